@@ -12,7 +12,13 @@ from isaacsim.core.utils.stage import add_reference_to_stage
 from isaacsim.core.utils.prims import create_prim
 
 from slcore.common import utils
-from slcore.common.primary_functions import create_parallel_robots, CollisionDetector, CUSTOM_ASSETS_ROOT_PATH
+from slcore.common.primary_functions import (
+    create_parallel_robots,
+    update_handlers,
+    CollisionDetector,
+    CUSTOM_ASSETS_ROOT_PATH,
+)
+from slcore.common.env_manager import EnvironmentManager
 from slcore.common.parallel_config import ParallelConfig
 
 
@@ -122,6 +128,11 @@ def main():
     # Set up collision detection
     collision_detector = CollisionDetector(handlers)
 
+    # Capture initial environment states so reset_env can restore them
+    env_manager = EnvironmentManager(world, handlers, parallel_config=parallel_config)
+    env_manager.capture_initial_states()
+    router_server.register_admin_handler(env_manager)
+
     # Start ZMQ ROUTER server
     router_server.start_server()
 
@@ -133,8 +144,8 @@ def main():
     try:
         while simulation_app.is_running():
             # Call robot handler update methods each frame
-            for handler in handlers.values():
-                handler.update()
+            update_handlers(handlers)
+            env_manager.update()
 
             # Step the simulation
             world.step(render=True)
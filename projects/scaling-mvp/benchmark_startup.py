@@ -0,0 +1,104 @@
+"""Startup benchmark for parallel environment construction.
+
+Builds the scaling-mvp workcell (PF400, peeler, thermocycler) for an
+increasing number of environments on a fresh stage each time and reports
+how long stage setup and world.reset() take.
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --num-envs 1 10 100
+    python benchmark_startup.py --clone
+    python benchmark_startup.py --observed-envs 0
+"""
+
+import argparse
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import omni.usd
+from isaacsim.core.api import World
+
+from slcore.common.primary_functions import create_parallel_robots, CUSTOM_ASSETS_ROOT_PATH
+from slcore.common.parallel_config import ParallelConfig
+
+
+BASE_ROBOTS_CONFIG = [
+    {
+        "type": "pf400",
+        "asset_path": str(CUSTOM_ASSETS_ROOT_PATH / "robots/Brooks/PF400/PF400.usd"),
+        "position": [0.0, 0.0, 0.0],
+        "orientation": [1.0, 0.0, 0.0, 0.0],
+    },
+    {
+        "type": "peeler",
+        "asset_path": str(CUSTOM_ASSETS_ROOT_PATH / "robots/Azenta/XPeel/XPeel.usd"),
+        "position": [-0.4, -0.625, 0.125],
+        "orientation": [1.0, 0.0, 0.0, 0.0],
+    },
+    {
+        "type": "thermocycler",
+        "asset_path": str(CUSTOM_ASSETS_ROOT_PATH / "robots/AnalytikJena/Biometra/Biometra.usd"),
+        "position": [0.16, 0.4, 0.125],
+        "orientation": [0.0, 0.0, 0.0, 1.0],
+    },
+]
+
+
+def benchmark(num_envs: int, clone_envs: bool = False, observed_envs: tuple[int, ...] = None) -> dict:
+    """Build num_envs environments on a fresh stage and time each phase.
+
+    Args:
+        num_envs: Number of parallel environments
+        clone_envs: Copy env_0 to the other environments instead of authoring each
+        observed_envs: Environments that load visuals (default: all)
+
+    Returns:
+        Dict of phase timings in seconds
+    """
+    omni.usd.get_context().new_stage()
+    World.clear_instance()
+    world = World(stage_units_in_meters=1.0)
+    world.scene.add_default_ground_plane()
+
+    parallel_config = ParallelConfig(
+        num_envs=num_envs, spacing=5.0, clone_envs=clone_envs, observed_envs=observed_envs,
+    )
+
+    start = time.perf_counter()
+    create_parallel_robots(simulation_app, world, BASE_ROBOTS_CONFIG, parallel_config)
+    setup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    world.reset()
+    reset_time = time.perf_counter() - start
+
+    world.stop()
+    return {"setup": setup_time, "reset": reset_time}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time parallel environment startup")
+    parser.add_argument("--num-envs", type=int, nargs="+", default=[1, 10, 100],
+                        help="Environment counts to benchmark (default: 1 10 100)")
+    parser.add_argument("--clone", action="store_true",
+                        help="Build env_0 once and copy it to the other environments")
+    parser.add_argument("--observed-envs", type=int, nargs="*", default=None,
+                        help="Only load visuals for these environments (requires compiled assets)")
+    args = parser.parse_args()
+
+    results = {num_envs: benchmark(num_envs, args.clone, args.observed_envs) for num_envs in args.num_envs}
+
+    print(f"\n{'envs':>6} {'setup (s)':>10} {'reset (s)':>10} {'setup/env (ms)':>15}")
+    for num_envs, timings in results.items():
+        per_env_ms = 1000.0 * timings["setup"] / num_envs
+        print(f"{num_envs:>6} {timings['setup']:>10.2f} {timings['reset']:>10.2f} {per_env_ms:>15.1f}")
+
+    simulation_app.close()
+
+
+if __name__ == "__main__":
+    main()
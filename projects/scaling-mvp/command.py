@@ -43,6 +43,9 @@ COMMANDS = [
     # {"robot": "pf400", "action": "goto_prim", "prim_name": "/World/env_0/locations/staging_hover"},
     # {"robot": "pf400", "action": "goto_prim", "prim_name": "/World/env_0/locations/staging"},
 
+    # Move to a location using joint positions precomputed at startup (no IK)
+    # {"robot": "pf400", "action": "goto_location", "location": "staging"},
+
     # Move to specific joint angles (7 joints)
     # {"robot": "pf400", "action": "move_joints", "joint_angles": [0.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0]},
 
@@ -110,6 +113,7 @@ MOTION_ACTIONS = {
     "move_joints",
     "goto_pose",
     "goto_prim",
+    "goto_location",
     "gripper_open",
     "gripper_close",
     "open",
@@ -6,12 +6,19 @@ simulation_app = SimulationApp({"headless": False})
 
 import numpy as np
 from isaacsim.core.api import World
-from isaacsim.core.utils.prims import create_prim
-from isaacsim.core.utils.stage import add_reference_to_stage
-from pxr import PhysxSchema
-
-from slcore.common import utils
-from slcore.common.primary_functions import create_parallel_robots, CollisionDetector, CUSTOM_ASSETS_ROOT_PATH
+from pxr import Sdf
+
+from slcore.common import pose_math, stage_authoring
+from slcore.common.compiled_assets import resolve_asset_path
+from slcore.common.primary_functions import (
+    create_env,
+    create_parallel_robots,
+    update_handlers,
+    warmup_handlers,
+    CollisionDetector,
+    CUSTOM_ASSETS_ROOT_PATH,
+)
+from slcore.common.env_manager import EnvironmentManager
 from slcore.common.parallel_config import ParallelConfig
 from slcore.robots.common.config import DEFAULT_PHYSICS_CONFIG
 
@@ -49,66 +56,90 @@ PF400_LOCATIONS = {
 }
 
 
-def create_location_markers(env_id: int, offset: np.ndarray):
+def get_location_poses() -> tuple[list[str], np.ndarray]:
+    """Get every PF400 location marker, including hover markers, as one pose array.
+
+    Returns:
+        Tuple of (marker names, (M, 7) poses as [x, y, z, qw, qx, qy, qz])
+    """
+    names = []
+    poses = []
+    for name, pose in PF400_LOCATIONS.items():
+        location_pose = pose_math.make_poses(pose["position"], pose["orientation"])
+
+        # Main location marker, and hover marker (same pose but higher z)
+        names += [name, f"{name}_hover"]
+        poses += [location_pose, pose_math.translate_poses(location_pose, [0.0, 0.0, HOVER_HEIGHT])]
+
+    return names, np.stack(poses)
+
+
+LOCATION_NAMES, LOCATION_POSES = get_location_poses()
+
+
+def create_location_markers(layer: Sdf.Layer, env_id: int, offset: np.ndarray):
     """Create PF400 location xform markers for an environment.
 
+    Only authors Sdf specs, so it can run inside an Sdf.ChangeBlock.
+
     Args:
+        layer: Layer to author into
         env_id: Environment ID for naming
         offset: [x, y, z] offset for this environment
     """
-    for name, pose in PF400_LOCATIONS.items():
-        # Calculate offset position
-        pos = np.array(pose["position"]) + offset
-
-        # Create main location marker
-        create_prim(
-            prim_path=f"/World/env_{env_id}/locations/{name}",
-            prim_type="Xform",
-            position=pos,
-            orientation=np.array(pose["orientation"]),
-        )
-
-        # Create hover marker (same position but higher z)
-        hover_pos = pos.copy()
-        hover_pos[2] += HOVER_HEIGHT
-        create_prim(
-            prim_path=f"/World/env_{env_id}/locations/{name}_hover",
-            prim_type="Xform",
-            position=hover_pos,
-            orientation=np.array(pose["orientation"]),
+    # Shift all marker poses to this environment in one call
+    env_poses = pose_math.translate_poses(LOCATION_POSES, offset)
+
+    for name, pose in zip(LOCATION_NAMES, env_poses):
+        stage_authoring.author_xform(
+            layer,
+            f"/World/env_{env_id}/locations/{name}",
+            position=pose[:3],
+            orientation=pose[3:],
         )
 
 
-def create_microplate(world, env_id: int, offset: np.ndarray):
+def create_microplate(layer: Sdf.Layer, env_id: int, offset: np.ndarray):
     """Create a microplate at the peeler for testing transfers.
 
+    Only authors Sdf specs, so it can run inside an Sdf.ChangeBlock.
+
     Args:
-        world: The simulation world
+        layer: Layer to author into
         env_id: Environment ID for naming
         offset: [x, y, z] offset for this environment
     """
-    microplate_asset_path = str(CUSTOM_ASSETS_ROOT_PATH / "labware/microplate/microplate.usd")
-    prim_path = f"/World/env_{env_id}/microplate"
-
-    add_reference_to_stage(
-        usd_path=microplate_asset_path,
-        prim_path=prim_path,
-    )
+    microplate_asset_path = resolve_asset_path(str(CUSTOM_ASSETS_ROOT_PATH / "labware/microplate/microplate.usd"))
 
     # Position at peeler nest (peeler is open, thermocycler starts closed)
     plate_pos = np.array(PF400_LOCATIONS["peeler_nest"]["position"]) + offset
-    plate_rot = np.array([1.0, 0.0, 0.0, 0.0])  # Identity rotation
-
-    microplate_prim = world.stage.GetPrimAtPath(prim_path)
-    utils.set_xform_world_pose(microplate_prim, plate_pos, plate_rot)
+    plate_rot = [1.0, 0.0, 0.0, 0.0]  # Identity rotation
+
+    microplate_spec = stage_authoring.author_reference(
+        layer,
+        f"/World/env_{env_id}/microplate",
+        microplate_asset_path,
+        position=plate_pos,
+        orientation=plate_rot,
+    )
 
-    # Enable collision detection for microplate
-    contact_report_api = PhysxSchema.PhysxContactReportAPI.Apply(microplate_prim)
-    contact_report_api.CreateThresholdAttr().Set(0.0)
+    # Apply contact reporting, switched off until a robot picks the microplate up
+    stage_authoring.author_contact_report(microplate_spec, DEFAULT_PHYSICS_CONFIG.contact_threshold_disabled)
 
     # Set contact offset for microplate
-    physx_collision_api = PhysxSchema.PhysxCollisionAPI.Apply(microplate_prim)
-    physx_collision_api.CreateContactOffsetAttr().Set(DEFAULT_PHYSICS_CONFIG.contact_offset)
+    stage_authoring.author_contact_offset(microplate_spec, DEFAULT_PHYSICS_CONFIG.contact_offset)
+
+
+def create_env_props(layer: Sdf.Layer, env_id: int, offset: np.ndarray):
+    """Create the location markers and labware of one environment.
+
+    Args:
+        layer: Layer to author into
+        env_id: Environment ID
+        offset: [x, y, z] offset for this environment
+    """
+    create_location_markers(layer, env_id, offset)
+    create_microplate(layer, env_id, offset)
 
 
 def main():
@@ -122,6 +153,9 @@ def main():
         num_envs=5,
         spacing=5.0,  # 5 meters between environments
         zmq_port=5555,
+        clone_envs=True,  # Build env_0 once and copy it to the other environments
+        layout="grid",  # Square grid instead of one long line along X
+        filter_env_collisions=True,  # No broad-phase pairs between environments
     )
 
     # Base robot configuration (will be cloned with offsets for each environment)
@@ -146,30 +180,44 @@ def main():
         },
     ]
 
-    # Create all parallel environments
+    # Create all parallel environments, each with location markers (for PF400
+    # calibration and goto_prim) and a microplate (for transfer testing)
     router_server, handlers = create_parallel_robots(
         simulation_app,
         world,
         base_robots_config,
         parallel_config,
+        author_env_props=create_env_props,
     )
 
-    # Create location markers for each environment (for PF400 calibration and goto_prim)
-    for env_id in range(parallel_config.num_envs):
-        offset = parallel_config.get_offset(env_id)
-        create_location_markers(env_id, offset)
-
-    # Create microplates at thermocycler for each environment (for transfer testing)
-    for env_id in range(parallel_config.num_envs):
-        offset = parallel_config.get_offset(env_id)
-        create_microplate(world, env_id, offset)
-
     # Reset world after all robots are added
     world.reset()
 
+    # Solve IK for every location marker before serving commands
+    warmup_handlers(handlers)
+
     # Set up collision detection across all environments
     collision_detector = CollisionDetector(handlers)
 
+    def build_env(env_id: int) -> dict:
+        """Create robots, location markers and labware for an environment added at runtime"""
+        env_handlers = create_env(simulation_app, world, base_robots_config, parallel_config, env_id)
+        with Sdf.ChangeBlock():
+            create_env_props(world.stage.GetEditTarget().GetLayer(), env_id, parallel_config.get_offset(env_id))
+        return env_handlers
+
+    # Capture initial environment states so reset_env can restore them
+    env_manager = EnvironmentManager(
+        world,
+        handlers,
+        router_server=router_server,
+        env_factory=build_env,
+        collision_detector=collision_detector,
+        parallel_config=parallel_config,
+    )
+    env_manager.capture_initial_states()
+    router_server.register_admin_handler(env_manager)
+
     # Start multiplexed ZMQ ROUTER server
     router_server.start_server()
 
@@ -183,8 +231,8 @@ def main():
     try:
         while simulation_app.is_running():
             # Update all robot handlers
-            for handler in handlers.values():
-                handler.update()
+            update_handlers(handlers)
+            env_manager.update()
 
             # Step simulation
             world.step(render=True)
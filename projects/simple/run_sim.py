@@ -11,7 +11,14 @@ from isaacsim.core.utils.stage import add_reference_to_stage
 from pxr import PhysxSchema
 
 from slcore.common import utils
-from slcore.common.primary_functions import create_parallel_robots, CollisionDetector, CUSTOM_ASSETS_ROOT_PATH
+from slcore.common.primary_functions import (
+    create_parallel_robots,
+    update_handlers,
+    warmup_handlers,
+    CollisionDetector,
+    CUSTOM_ASSETS_ROOT_PATH,
+)
+from slcore.common.env_manager import EnvironmentManager
 from slcore.common.parallel_config import ParallelConfig
 from slcore.robots.common.config import DEFAULT_PHYSICS_CONFIG
 
@@ -85,9 +92,9 @@ def create_microplate(world):
     microplate_prim = world.stage.GetPrimAtPath(prim_path)
     utils.set_xform_world_pose(microplate_prim, plate_pos, plate_rot)
 
-    # Enable collision detection
+    # Apply contact reporting, switched off until a robot picks the microplate up
     contact_report_api = PhysxSchema.PhysxContactReportAPI.Apply(microplate_prim)
-    contact_report_api.CreateThresholdAttr().Set(0.0)
+    contact_report_api.CreateThresholdAttr().Set(DEFAULT_PHYSICS_CONFIG.contact_threshold_disabled)
     physx_collision_api = PhysxSchema.PhysxCollisionAPI.Apply(microplate_prim)
     physx_collision_api.CreateContactOffsetAttr().Set(DEFAULT_PHYSICS_CONFIG.contact_offset)
 
@@ -137,7 +144,13 @@ def main():
 
     world.reset()
 
+    # Solve IK for every location marker before serving commands
+    warmup_handlers(handlers)
+
     collision_detector = CollisionDetector(handlers)
+    env_manager = EnvironmentManager(world, handlers, parallel_config=parallel_config)
+    env_manager.capture_initial_states()
+    router_server.register_admin_handler(env_manager)
     router_server.start_server()
 
     print("Simulation App Startup Complete")
@@ -147,8 +160,8 @@ def main():
 
     try:
         while simulation_app.is_running():
-            for handler in handlers.values():
-                handler.update()
+            update_handlers(handlers)
+            env_manager.update()
             world.step(render=True)
     except KeyboardInterrupt:
         print("\nShutting down...")
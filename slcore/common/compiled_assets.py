@@ -0,0 +1,172 @@
+"""Lookup of preflight-compiled assets.
+
+tools/usd_asset_compiler.py flattens each source asset (its full reference,
+sublayer and material graph) into binary .usdc layers under
+assets/.compiled/<name>-<hash>/, with physics and visual content split:
+
+    <name>.physics.usdc   Prims, transforms, joints, rigid bodies and colliders
+    <name>.visual.usdc    Render-only meshes and materials
+    <name>.usdc           Root layer; drop-in for the source
+
+Render-only subtrees are payloaded from the physics layer into the visual
+layer, so a stage can leave visuals unloaded (Usd.StageLoadRules) and still
+compose every collider; see ParallelConfig.observed_envs.
+
+The compiler records every compiled asset in assets/.compiled/manifest.json,
+together with the size and modification time of every file it was built from.
+resolve_asset_path() swaps a source asset path for its compiled root layer
+when the manifest entry is still current, and falls back to the source (with
+a warning) when a dependency has changed since the asset was compiled.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from slcore.robots.common.config import CUSTOM_ASSETS_ROOT_PATH
+
+
+COMPILER_VERSION = 2
+COMPILED_ASSETS_DIR = CUSTOM_ASSETS_ROOT_PATH / ".compiled"
+MANIFEST_PATH = COMPILED_ASSETS_DIR / "manifest.json"
+
+# Compiled layer kinds, keyed by the name used in manifest entries
+COMPILED_LAYERS = ("root", "physics", "visual")
+
+# Manifest loaded once per process, plus the per-asset staleness verdicts
+_manifest: dict = None
+_resolved: dict[str, bool] = {}
+
+
+def get_source_key(asset_path) -> str:
+    """Get the manifest key of a source asset.
+
+    Args:
+        asset_path: Source USD file path
+
+    Returns:
+        Absolute, normalized path string
+    """
+    return str(Path(asset_path).expanduser().resolve())
+
+
+def get_file_stamp(path) -> list:
+    """Get the [size, mtime_ns] stamp used to detect changed dependencies.
+
+    Args:
+        path: File path
+
+    Returns:
+        [size, mtime_ns], or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    """Load the compiled asset manifest.
+
+    Args:
+        path: Manifest file path
+
+    Returns:
+        Manifest dict ({"version": int, "assets": {source_key: entry}}), empty
+        if the file does not exist or was written by another compiler version
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": COMPILER_VERSION, "assets": {}}
+
+    if manifest.get("version") != COMPILER_VERSION:
+        return {"version": COMPILER_VERSION, "assets": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict, path: Path = MANIFEST_PATH):
+    """Write the compiled asset manifest atomically.
+
+    Args:
+        manifest: Manifest dict
+        path: Manifest file path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_entry_current(entry: dict) -> bool:
+    """Check whether a manifest entry still matches its dependencies and outputs.
+
+    Args:
+        entry: Manifest entry written by the compiler
+
+    Returns:
+        True if no dependency changed and all compiled layers exist
+    """
+    for dependency, stamp in entry["dependencies"].items():
+        if get_file_stamp(dependency) != stamp:
+            return False
+    return all(os.path.exists(entry["layers"][name]) for name in COMPILED_LAYERS)
+
+
+def get_compiled_asset(asset_path, layer: str = "root") -> str:
+    """Get a compiled layer of a source asset.
+
+    Args:
+        asset_path: Source USD file path
+        layer: Compiled layer kind ("root", "physics" or "visual")
+
+    Returns:
+        Path of the compiled layer, or None if the asset has not been compiled
+        or its compiled output is stale
+    """
+    global _manifest
+    if layer not in COMPILED_LAYERS:
+        raise ValueError(f"Unknown compiled layer '{layer}', expected one of {COMPILED_LAYERS}")
+
+    if _manifest is None:
+        _manifest = load_manifest()
+
+    key = get_source_key(asset_path)
+    entry = _manifest["assets"].get(key)
+    if entry is None:
+        return None
+
+    # Dependencies are only checked once per process
+    if key not in _resolved:
+        current = is_entry_current(entry)
+        if not current:
+            print(f"Compiled asset for {asset_path} is stale, using source asset "
+                  f"(rerun tools/usd_asset_compiler.py)")
+        _resolved[key] = current
+
+    if not _resolved[key]:
+        return None
+    return entry["layers"][layer]
+
+
+def resolve_asset_path(asset_path) -> str:
+    """Resolve a source asset path to its compiled root layer when available.
+
+    Args:
+        asset_path: Source USD file path
+
+    Returns:
+        Compiled root layer path, or asset_path unchanged
+    """
+    return get_compiled_asset(asset_path) or asset_path
+
+
+def clear_compiled_asset_cache():
+    """Forget the loaded manifest (e.g., after recompiling assets in-process)."""
+    global _manifest
+    _manifest = None
+    _resolved.clear()
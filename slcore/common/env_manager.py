@@ -0,0 +1,390 @@
+"""Admin command handler for environment-level operations.
+
+The EnvironmentManager is registered with ZMQRouterServer under the "admin"
+identity. Commands arrive on the ZMQ thread and are queued; the actual
+stage and physics work happens in update() on the simulation thread.
+"""
+
+import time
+from collections import deque
+from pathlib import Path
+
+from slcore.common.env_state import (
+    EnvState,
+    capture_env_state,
+    get_env_handlers,
+    load_checkpoint,
+    remap_env_state,
+    restore_env_state,
+    restore_rigid_bodies,
+    save_checkpoint,
+)
+from slcore.common.parallel_config import ParallelConfig
+from slcore.common.primary_functions import remove_env
+
+
+class EnvironmentManager:
+    """Handles admin commands that act on whole environments.
+
+    Supported actions:
+        - reset_env: Restore one environment to its captured initial state
+        - get_env_status: Report whether an environment is idle or resetting
+        - save_checkpoint: Write the state of all environments to a file
+        - load_checkpoint: Restore environments from a checkpoint file
+        - get_checkpoint_status: Report the result of the last checkpoint operation
+        - add_env: Spawn a new environment while the simulation keeps running
+        - remove_env: Tear down an idle environment
+        - list_envs: Report the active and initializing environment IDs
+    """
+
+    def __init__(
+        self,
+        world,
+        handlers: dict,
+        settle_frames: int = 3,
+        checkpoint_path: str | Path = None,
+        checkpoint_interval: float = None,
+        router_server=None,
+        env_factory=None,
+        collision_detector=None,
+        parallel_config: ParallelConfig = None,
+    ):
+        """Initialize the environment manager.
+
+        Args:
+            world: Isaac Sim world
+            handlers: Dict of {identity: server} for all environments
+            settle_frames: Frames to hold restored labware in place after a reset
+            checkpoint_path: File for periodic checkpoints (default: no autosave)
+            checkpoint_interval: Seconds between periodic checkpoints
+            router_server: ZMQRouterServer that new handlers are registered with
+            env_factory: Callable(env_id) -> {identity: server} that creates the
+                prims and handlers of one environment (required for add_env)
+            collision_detector: CollisionDetector to re-index when environments change
+            parallel_config: Parallel environment configuration (required to
+                restore checkpoints into other environments)
+        """
+        self.world = world
+        self.handlers = handlers
+        self.settle_frames = settle_frames
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.router_server = router_server
+        self.env_factory = env_factory
+        self.parallel_config = parallel_config
+        self.collision_detector = collision_detector
+
+        self.initial_states: dict[int, EnvState] = {}
+
+        # Filled on the ZMQ thread, drained on the simulation thread
+        self._pending_resets: deque[EnvState] = deque()
+        self._pending_checkpoints: deque[dict] = deque()
+        self._settling: dict[int, tuple[int, EnvState]] = {}  # env_id -> (frames left, state)
+        self._pending_adds: deque[int] = deque()
+        self._pending_removals: deque[int] = deque()
+        self._initializing: dict[int, dict] = {}  # env_id -> handlers awaiting their first physics step
+
+        self._last_checkpoint_time = time.monotonic()
+        self.checkpoint_status = {"status": "none"}
+
+    @property
+    def env_ids(self) -> list[int]:
+        """Environment IDs that currently have handlers"""
+        # Snapshot: the simulation thread adds and removes handlers while ZMQ commands read them
+        return sorted({handler.env_id for handler in list(self.handlers.values())})
+
+    def capture_initial_states(self):
+        """Capture the initial state of every environment.
+
+        Call this once after world.reset(), before any commands run.
+        """
+        for env_id in self.env_ids:
+            self.capture_initial_state(env_id)
+        print(f"Captured initial state for {len(self.initial_states)} environments")
+
+    def capture_initial_state(self, env_id: int):
+        """Capture the initial state of one environment.
+
+        Args:
+            env_id: Environment ID
+        """
+        self.initial_states[env_id] = capture_env_state(self.world.stage, env_id, self.handlers)
+
+    def create_success_response(self, message: str = "success", **kwargs) -> dict:
+        """Helper to create standardized success response"""
+        response = {"status": "success", "message": message}
+        response.update(kwargs)
+        return response
+
+    def create_error_response(self, message: str) -> dict:
+        """Helper to create standardized error response"""
+        return {"status": "error", "message": message}
+
+    def handle_command(self, request: dict) -> dict:
+        """Handle incoming admin command"""
+        action = request.get("action", "")
+
+        if action == "reset_env":
+            env_id = request.get("env_id")
+            if env_id not in self.initial_states:
+                return self.create_error_response(f"No initial state captured for env_id: {env_id}")
+            if self.is_resetting(env_id):
+                return self.create_error_response(f"env_{env_id} is already resetting")
+
+            self._pending_resets.append(self.initial_states[env_id])
+            return self.create_success_response("reset_env queued", env_id=env_id)
+
+        elif action == "get_env_status":
+            env_id = request.get("env_id")
+            if env_id not in self.env_ids:
+                return self.create_error_response(f"Unknown env_id: {env_id}")
+
+            env_handlers = get_env_handlers(self.handlers, env_id)
+            status = {
+                "env_id": env_id,
+                "resetting": self.is_resetting(env_id),
+                "is_idle": self.is_idle(env_id),
+                "robots": sorted(env_handlers),
+            }
+            return self.create_success_response("env status retrieved", data=status)
+
+        elif action == "save_checkpoint":
+            path = request.get("path") or self.checkpoint_path
+            if not path:
+                return self.create_error_response("save_checkpoint requires path parameter")
+
+            self.checkpoint_status = {"status": "pending", "operation": "save", "path": str(path)}
+            self._pending_checkpoints.append({"operation": "save", "path": path})
+            return self.create_success_response("save_checkpoint queued", path=str(path))
+
+        elif action == "load_checkpoint":
+            path = request.get("path") or self.checkpoint_path
+            if not path:
+                return self.create_error_response("load_checkpoint requires path parameter")
+
+            # Optional {source_env_id: destination_env_id} map for forking environments
+            env_map = {int(k): int(v) for k, v in (request.get("env_map") or {}).items()}
+            unknown = [env_id for env_id in env_map.values() if env_id not in self.env_ids]
+            if unknown:
+                return self.create_error_response(f"Unknown destination env_ids: {unknown}")
+            if env_map and self.parallel_config is None:
+                return self.create_error_response("env_map requires an EnvironmentManager with parallel_config")
+
+            self.checkpoint_status = {"status": "pending", "operation": "load", "path": str(path)}
+            self._pending_checkpoints.append({"operation": "load", "path": path, "env_map": env_map})
+            return self.create_success_response("load_checkpoint queued", path=str(path))
+
+        elif action == "get_checkpoint_status":
+            return self.create_success_response("checkpoint status retrieved", data=dict(self.checkpoint_status))
+
+        elif action == "add_env":
+            if self.env_factory is None:
+                return self.create_error_response("add_env is not supported: no env_factory configured")
+
+            env_id = request.get("env_id")
+            if env_id is None:
+                env_id = max(self.env_ids + list(self._initializing) + list(self._pending_adds), default=-1) + 1
+            if env_id in self.env_ids or env_id in self._initializing or env_id in self._pending_adds:
+                return self.create_error_response(f"env_{env_id} already exists")
+
+            self._pending_adds.append(env_id)
+            return self.create_success_response("add_env queued", env_id=env_id)
+
+        elif action == "remove_env":
+            env_id = request.get("env_id")
+            if env_id not in self.env_ids:
+                return self.create_error_response(f"Unknown env_id: {env_id}")
+            if env_id in self._pending_removals:
+                return self.create_error_response(f"env_{env_id} is already being removed")
+            if self.is_resetting(env_id) or not self.is_idle(env_id):
+                return self.create_error_response(f"env_{env_id} is busy; only idle environments can be removed")
+
+            self._pending_removals.append(env_id)
+            return self.create_success_response("remove_env queued", env_id=env_id)
+
+        elif action == "list_envs":
+            data = {
+                "env_ids": self.env_ids,
+                "initializing": sorted(set(self._initializing) | set(self._pending_adds)),
+            }
+            return self.create_success_response("environments listed", data=data)
+
+        else:
+            return self.create_error_response(f"Unknown action: {action}")
+
+    def is_resetting(self, env_id: int) -> bool:
+        """Whether a reset of the environment is queued or still settling"""
+        return any(state.env_id == env_id for state in self._pending_resets) or env_id in self._settling
+
+    def is_idle(self, env_id: int) -> bool:
+        """Whether no robot in the environment is executing an action"""
+        return all(handler.current_action is None for handler in get_env_handlers(self.handlers, env_id).values())
+
+    def _start_add(self, env_id: int):
+        """Create an environment's prims and handlers.
+
+        The handlers are held back until the next frame: new articulations
+        can only be initialized after PhysX has parsed them in a step.
+        """
+        self._initializing[env_id] = self.env_factory(env_id)
+        print(f"Adding env_{env_id}")
+
+    def _finish_add(self, env_id: int):
+        """Initialize a new environment's robots and start routing commands to it."""
+        env_handlers = self._initializing.pop(env_id)
+        for identity, handler in env_handlers.items():
+            handler.robot.initialize()
+            self.handlers[identity] = handler
+            if self.router_server is not None:
+                self.router_server.register_handler(env_id, identity.split(".", 1)[1], handler)
+
+        if self.collision_detector is not None:
+            self.collision_detector.rebuild_index()
+
+        for handler in env_handlers.values():
+            handler.warmup()
+
+        self.capture_initial_state(env_id)
+        print(f"Added env_{env_id} ({len(env_handlers)} robots)")
+
+    def _remove(self, env_id: int):
+        """Tear down an environment if it is still idle."""
+        if self.is_resetting(env_id) or not self.is_idle(env_id):
+            print(f"Skipping removal of env_{env_id}: environment became busy")
+            return
+
+        remove_env(self.world, env_id, self.handlers, self.router_server)
+        self.initial_states.pop(env_id, None)
+
+        if self.collision_detector is not None:
+            self.collision_detector.rebuild_index()
+
+    def _start_restore(self, state: EnvState):
+        """Restore an environment and pause its handlers while it settles."""
+        restore_env_state(self.world.stage, state, self.handlers)
+
+        for handler in get_env_handlers(self.handlers, state.env_id).values():
+            handler.is_paused = True
+
+        self._settling[state.env_id] = (self.settle_frames, state)
+        print(f"Restoring env_{state.env_id}")
+
+    def _finish_restore(self, state: EnvState):
+        """Hand control back to the environment's handlers."""
+        env_handlers = get_env_handlers(self.handlers, state.env_id)
+        for robot_state in state.robots:
+            handler = env_handlers.get(robot_state.identity)
+            if handler is not None:
+                handler.is_paused = robot_state.handler_state.get("is_paused", False)
+
+        del self._settling[state.env_id]
+        print(f"Restore of env_{state.env_id} complete")
+
+    def capture_states(self) -> list[EnvState]:
+        """Capture the current state of every environment.
+
+        Must be called from the simulation thread.
+
+        Returns:
+            List of EnvState snapshots
+        """
+        return [capture_env_state(self.world.stage, env_id, self.handlers) for env_id in self.env_ids]
+
+    def save_checkpoint(self, path: str | Path):
+        """Write the current state of every environment to a checkpoint file.
+
+        Must be called from the simulation thread.
+
+        Args:
+            path: Output file path (.npz)
+        """
+        start = time.monotonic()
+        save_checkpoint(path, self.capture_states(), metadata={
+            "wall_time": time.time(),
+            "simulation_time": self.world.current_time,
+        })
+        self._last_checkpoint_time = time.monotonic()
+        print(f"Saved checkpoint to {path} in {self._last_checkpoint_time - start:.3f}s")
+
+    def load_checkpoint(self, path: str | Path, env_map: dict[int, int] = None):
+        """Restore environments from a checkpoint file.
+
+        Must be called from the simulation thread. Environments not in the
+        checkpoint (or not mapped) are left untouched.
+
+        Args:
+            path: Checkpoint file written by save_checkpoint()
+            env_map: Optional {source_env_id: destination_env_id} map; when
+                given, only the mapped environments are restored
+        """
+        states, _ = load_checkpoint(path)
+        if env_map:
+            if self.parallel_config is None:
+                raise ValueError("Restoring into other environments requires parallel_config")
+            by_env = {state.env_id: state for state in states}
+            states = [
+                remap_env_state(
+                    by_env[src],
+                    dst,
+                    self.parallel_config.get_offset(dst) - self.parallel_config.get_offset(src),
+                )
+                for src, dst in env_map.items()
+                if src in by_env
+            ]
+
+        for state in states:
+            if state.env_id in self.env_ids:
+                self._start_restore(state)
+
+    def _run_checkpoint_operation(self, operation: dict):
+        """Run a queued save or load and record its outcome."""
+        path = operation["path"]
+        try:
+            if operation["operation"] == "save":
+                self.save_checkpoint(path)
+            else:
+                self.load_checkpoint(path, operation.get("env_map"))
+            self.checkpoint_status = {"status": "success", "operation": operation["operation"], "path": str(path)}
+        except Exception as e:
+            self.checkpoint_status = {
+                "status": "error",
+                "operation": operation["operation"],
+                "path": str(path),
+                "message": str(e),
+            }
+            print(f"Checkpoint {operation['operation']} failed: {e}")
+
+    def update(self):
+        """Called every simulation frame to run queued environment operations"""
+        # Environments added last frame have now been through a physics step
+        for env_id in list(self._initializing):
+            self._finish_add(env_id)
+
+        while self._pending_adds:
+            self._start_add(self._pending_adds.popleft())
+
+        while self._pending_removals:
+            self._remove(self._pending_removals.popleft())
+
+        while self._pending_resets:
+            self._start_restore(self._pending_resets.popleft())
+
+        while self._pending_checkpoints:
+            self._run_checkpoint_operation(self._pending_checkpoints.popleft())
+
+        for env_id in list(self._settling):
+            # Keep labware pinned while attachment joints and PD targets settle
+            frames_left, state = self._settling[env_id]
+            restore_rigid_bodies(state)
+            if frames_left <= 1:
+                self._finish_restore(state)
+            else:
+                self._settling[env_id] = (frames_left - 1, state)
+
+        if (
+            self.checkpoint_path
+            and self.checkpoint_interval
+            and not self._settling
+            and time.monotonic() - self._last_checkpoint_time >= self.checkpoint_interval
+        ):
+            self._run_checkpoint_operation({"operation": "save", "path": self.checkpoint_path})
@@ -0,0 +1,452 @@
+"""Capture and restore the simulation state of a single environment.
+
+An EnvState holds everything needed to put one environment back where it
+was without touching the others: articulation joint states, handler state
+machines, free rigid bodies (labware) and gripper attachment joints.
+
+EnvStates can be written to and read from compressed checkpoint files
+with save_checkpoint() and load_checkpoint().
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+from isaacsim.core.prims import SingleRigidPrim
+from isaacsim.core.utils.types import ArticulationAction
+from pxr import Gf, Sdf, Usd, UsdPhysics
+
+from slcore.common.parallel_config import get_env_prim_path
+
+
+@dataclass
+class RobotState:
+    """Joint and handler state of one robot."""
+
+    identity: str
+    """Handler identity (env_id.robot_type)"""
+
+    joint_positions: np.ndarray
+    joint_velocities: np.ndarray
+
+    handler_state: dict = field(default_factory=dict)
+    """Output of ZMQ_Robot_Server.get_state()"""
+
+
+@dataclass
+class RigidBodyState:
+    """Pose and velocity of a free rigid body (e.g., a microplate)."""
+
+    prim_path: str
+    position: np.ndarray
+    orientation: np.ndarray
+    """[w, x, y, z] quaternion"""
+
+    linear_velocity: np.ndarray
+    angular_velocity: np.ndarray
+
+
+@dataclass
+class AttachmentState:
+    """A gripper attachment joint (UsdPhysics.FixedJoint)."""
+
+    joint_path: str
+    body0: str
+    body1: str
+    local_pos0: list[float]
+    local_rot0: list[float]
+    """[w, x, y, z] quaternion"""
+
+    local_pos1: list[float]
+    local_rot1: list[float]
+    """[w, x, y, z] quaternion"""
+
+
+@dataclass
+class EnvState:
+    """Complete state of one environment."""
+
+    env_id: int
+    robots: list[RobotState] = field(default_factory=list)
+    rigid_bodies: list[RigidBodyState] = field(default_factory=list)
+    attachments: list[AttachmentState] = field(default_factory=list)
+
+
+# Rigid prim wrappers are reused across captures and restores
+_rigid_prims: dict[str, SingleRigidPrim] = {}
+
+
+def _get_rigid_prim(prim_path: str) -> SingleRigidPrim:
+    """Get a (cached) physics-backed wrapper for a rigid body prim."""
+    rigid_prim = _rigid_prims.get(prim_path)
+    if rigid_prim is None:
+        rigid_prim = SingleRigidPrim(prim_path)
+        rigid_prim.initialize()
+        _rigid_prims[prim_path] = rigid_prim
+    return rigid_prim
+
+
+def forget_rigid_prims(path_prefix: str):
+    """Drop cached rigid prim wrappers below a path (e.g., a removed environment).
+
+    Args:
+        path_prefix: Prim path whose subtree is dropped
+    """
+    stale = [path for path in _rigid_prims if path == path_prefix or path.startswith(path_prefix + "/")]
+    for path in stale:
+        del _rigid_prims[path]
+
+
+def get_env_handlers(handlers: dict, env_id: int) -> dict:
+    """Select the handlers that belong to one environment.
+
+    Args:
+        handlers: Dict of {identity: server} for all environments
+        env_id: Environment ID
+
+    Returns:
+        Dict of {identity: server} for the environment
+    """
+    # Snapshot: environments may be added or removed on the simulation thread meanwhile
+    return {identity: handler for identity, handler in list(handlers.items()) if handler.env_id == env_id}
+
+
+def find_env_rigid_bodies(stage: Usd.Stage, env_id: int, handlers: dict) -> list[str]:
+    """Find free rigid bodies in an environment, excluding robot articulations.
+
+    Args:
+        stage: USD stage
+        env_id: Environment ID
+        handlers: Dict of {identity: server} (robot subtrees are skipped)
+
+    Returns:
+        List of rigid body prim paths
+    """
+    env_prim = stage.GetPrimAtPath(get_env_prim_path(env_id))
+    if not env_prim:
+        return []
+
+    robot_paths = {handler.robot_prim_path for handler in get_env_handlers(handlers, env_id).values()}
+
+    rigid_body_paths = []
+    prim_range = iter(Usd.PrimRange(env_prim))
+    for prim in prim_range:
+        if prim.GetPath().pathString in robot_paths:
+            prim_range.PruneChildren()
+            continue
+        if prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            rigid_body_paths.append(prim.GetPath().pathString)
+            prim_range.PruneChildren()
+
+    return rigid_body_paths
+
+
+def _capture_attachment(stage: Usd.Stage, joint_path: str) -> AttachmentState:
+    """Read an attachment joint's bodies and local frames."""
+    joint = UsdPhysics.FixedJoint(stage.GetPrimAtPath(joint_path))
+
+    def _quat(value) -> list[float]:
+        return [value.GetReal(), *value.GetImaginary()]
+
+    return AttachmentState(
+        joint_path=joint_path,
+        body0=joint.GetBody0Rel().GetTargets()[0].pathString,
+        body1=joint.GetBody1Rel().GetTargets()[0].pathString,
+        local_pos0=list(joint.GetLocalPos0Attr().Get()),
+        local_rot0=_quat(joint.GetLocalRot0Attr().Get()),
+        local_pos1=list(joint.GetLocalPos1Attr().Get()),
+        local_rot1=_quat(joint.GetLocalRot1Attr().Get()),
+    )
+
+
+def _restore_attachment(stage: Usd.Stage, attachment: AttachmentState):
+    """Recreate an attachment joint from its captured state."""
+    joint = UsdPhysics.FixedJoint.Define(stage, Sdf.Path(attachment.joint_path))
+    joint.CreateBody0Rel().SetTargets([Sdf.Path(attachment.body0)])
+    joint.CreateBody1Rel().SetTargets([Sdf.Path(attachment.body1)])
+    joint.CreateLocalPos0Attr().Set(Gf.Vec3f(*attachment.local_pos0))
+    joint.CreateLocalRot0Attr().Set(Gf.Quatf(*attachment.local_rot0))
+    joint.CreateLocalPos1Attr().Set(Gf.Vec3f(*attachment.local_pos1))
+    joint.CreateLocalRot1Attr().Set(Gf.Quatf(*attachment.local_rot1))
+
+
+def capture_env_state(stage: Usd.Stage, env_id: int, handlers: dict, rigid_body_paths: list[str] = None) -> EnvState:
+    """Capture the current state of one environment.
+
+    Args:
+        stage: USD stage
+        env_id: Environment ID
+        handlers: Dict of {identity: server} for all environments
+        rigid_body_paths: Free rigid bodies to capture (default: discovered
+            with find_env_rigid_bodies)
+
+    Returns:
+        EnvState snapshot
+    """
+    if rigid_body_paths is None:
+        rigid_body_paths = find_env_rigid_bodies(stage, env_id, handlers)
+
+    state = EnvState(env_id=env_id)
+
+    for identity, handler in get_env_handlers(handlers, env_id).items():
+        handler_state = handler.get_state()
+        state.robots.append(RobotState(
+            identity=identity,
+            joint_positions=np.array(handler.robot.get_joint_positions()),
+            joint_velocities=np.array(handler.robot.get_joint_velocities()),
+            handler_state=handler_state,
+        ))
+        for joint_path in handler_state.get("attached_objects", {}):
+            state.attachments.append(_capture_attachment(stage, joint_path))
+
+    for prim_path in rigid_body_paths:
+        rigid_prim = _get_rigid_prim(prim_path)
+        position, orientation = rigid_prim.get_world_pose()
+        state.rigid_bodies.append(RigidBodyState(
+            prim_path=prim_path,
+            position=np.array(position),
+            orientation=np.array(orientation),
+            linear_velocity=np.array(rigid_prim.get_linear_velocity()),
+            angular_velocity=np.array(rigid_prim.get_angular_velocity()),
+        ))
+
+    return state
+
+
+def restore_rigid_bodies(state: EnvState):
+    """Put the environment's free rigid bodies back at their captured poses.
+
+    Args:
+        state: Snapshot to restore from
+    """
+    for body in state.rigid_bodies:
+        rigid_prim = _get_rigid_prim(body.prim_path)
+        rigid_prim.set_world_pose(body.position, body.orientation)
+        rigid_prim.set_linear_velocity(body.linear_velocity)
+        rigid_prim.set_angular_velocity(body.angular_velocity)
+
+
+def restore_env_state(stage: Usd.Stage, state: EnvState, handlers: dict):
+    """Restore one environment from a snapshot.
+
+    Must be called from the simulation thread. Other environments are not
+    touched.
+
+    Args:
+        stage: USD stage
+        state: Snapshot to restore
+        handlers: Dict of {identity: server} for all environments
+    """
+    env_handlers = get_env_handlers(handlers, state.env_id)
+
+    # Drop attachments made since the snapshot, then recreate the captured ones
+    for handler in env_handlers.values():
+        handler.detach_all_objects()
+    for attachment in state.attachments:
+        _restore_attachment(stage, attachment)
+
+    for robot_state in state.robots:
+        handler = env_handlers.get(robot_state.identity)
+        if handler is None:
+            continue
+        handler.robot.set_joint_positions(robot_state.joint_positions)
+        handler.robot.set_joint_velocities(robot_state.joint_velocities)
+        # Hold the restored pose instead of driving back to the last PD target
+        handler.robot.apply_action(ArticulationAction(joint_positions=robot_state.joint_positions))
+        handler.set_state(robot_state.handler_state)
+
+    restore_rigid_bodies(state)
+
+
+# =============================================================================
+# Checkpoint Files
+# =============================================================================
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str | Path, states: list[EnvState], metadata: dict = None):
+    """Write environment snapshots to a compressed checkpoint file.
+
+    Joint states of all robots are concatenated into flat arrays and rigid
+    body states are stacked into one (M, 13) array; paths, handler state
+    machines and attachments go into a JSON header. The file is written to
+    a temporary path first and then moved into place, so an interrupted
+    save never leaves a truncated checkpoint behind.
+
+    Args:
+        path: Output file path (.npz)
+        states: Snapshots to save
+        metadata: Extra JSON-serializable information to store
+    """
+    path = Path(path)
+
+    robots = []
+    joint_positions = []
+    joint_velocities = []
+    offset = 0
+    bodies = []
+    body_rows = []
+    attachments = []
+
+    for state in states:
+        for robot in state.robots:
+            count = len(robot.joint_positions)
+            robots.append({
+                "env_id": state.env_id,
+                "identity": robot.identity,
+                "offset": offset,
+                "count": count,
+                "handler_state": robot.handler_state,
+            })
+            joint_positions.append(np.asarray(robot.joint_positions, dtype=np.float64))
+            joint_velocities.append(np.asarray(robot.joint_velocities, dtype=np.float64))
+            offset += count
+
+        for body in state.rigid_bodies:
+            bodies.append({"env_id": state.env_id, "prim_path": body.prim_path})
+            body_rows.append(np.concatenate([
+                body.position, body.orientation, body.linear_velocity, body.angular_velocity,
+            ]))
+
+        for attachment in state.attachments:
+            attachments.append({"env_id": state.env_id, **asdict(attachment)})
+
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "env_ids": [state.env_id for state in states],
+        "robots": robots,
+        "rigid_bodies": bodies,
+        "attachments": attachments,
+        "metadata": metadata or {},
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(
+            f,
+            header=np.frombuffer(json.dumps(header).encode(), dtype=np.uint8),
+            joint_positions=np.concatenate(joint_positions) if joint_positions else np.zeros(0),
+            joint_velocities=np.concatenate(joint_velocities) if joint_velocities else np.zeros(0),
+            rigid_bodies=np.stack(body_rows) if body_rows else np.zeros((0, 13)),
+        )
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str | Path) -> tuple[list[EnvState], dict]:
+    """Read environment snapshots from a checkpoint file.
+
+    Args:
+        path: Checkpoint file written by save_checkpoint()
+
+    Returns:
+        Tuple of (states, metadata)
+
+    Raises:
+        FileNotFoundError: If the checkpoint does not exist
+        ValueError: If the checkpoint version is not supported
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Checkpoint not found: {path}")
+
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(data["header"].tobytes().decode())
+        joint_positions = data["joint_positions"]
+        joint_velocities = data["joint_velocities"]
+        body_rows = data["rigid_bodies"]
+
+    if header.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {header.get('version')}")
+
+    states = {env_id: EnvState(env_id=env_id) for env_id in header["env_ids"]}
+
+    for robot in header["robots"]:
+        start, end = robot["offset"], robot["offset"] + robot["count"]
+        states[robot["env_id"]].robots.append(RobotState(
+            identity=robot["identity"],
+            joint_positions=joint_positions[start:end].copy(),
+            joint_velocities=joint_velocities[start:end].copy(),
+            handler_state=robot["handler_state"],
+        ))
+
+    for body, row in zip(header["rigid_bodies"], body_rows):
+        states[body["env_id"]].rigid_bodies.append(RigidBodyState(
+            prim_path=body["prim_path"],
+            position=row[0:3].copy(),
+            orientation=row[3:7].copy(),
+            linear_velocity=row[7:10].copy(),
+            angular_velocity=row[10:13].copy(),
+        ))
+
+    for attachment in header["attachments"]:
+        env_id = attachment.pop("env_id")
+        states[env_id].attachments.append(AttachmentState(**attachment))
+
+    return list(states.values()), header["metadata"]
+
+
+def remap_env_state(state: EnvState, env_id: int, offset: np.ndarray) -> EnvState:
+    """Re-target a snapshot at another environment.
+
+    Rewrites every prim path and handler identity from the snapshot's
+    environment to the new one and shifts rigid body world poses into the
+    new environment's space, so a mid-run state of one environment can be
+    forked into others.
+
+    Args:
+        state: Snapshot to re-target
+        env_id: Destination environment ID
+        offset: [x, y, z] offset of the destination environment from the
+            snapshot's (see ParallelConfig.get_offset)
+
+    Returns:
+        New EnvState for the destination environment
+    """
+    old_path = get_env_prim_path(state.env_id)
+    new_path = get_env_prim_path(env_id)
+    old_identity = f"env_{state.env_id}."
+    new_identity = f"env_{env_id}."
+
+    def _remap(value):
+        if isinstance(value, str):
+            if value == old_path or value.startswith(old_path + "/"):
+                return new_path + value[len(old_path):]
+            if value.startswith(old_identity):
+                return new_identity + value[len(old_identity):]
+            return value
+        if isinstance(value, dict):
+            return {_remap(key): _remap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [_remap(item) for item in value]
+        return value
+
+    return EnvState(
+        env_id=env_id,
+        robots=[
+            RobotState(
+                identity=_remap(robot.identity),
+                joint_positions=robot.joint_positions.copy(),
+                joint_velocities=robot.joint_velocities.copy(),
+                handler_state=_remap(robot.handler_state),
+            )
+            for robot in state.robots
+        ],
+        rigid_bodies=[
+            RigidBodyState(
+                prim_path=_remap(body.prim_path),
+                position=body.position + np.asarray(offset, dtype=float),
+                orientation=body.orientation.copy(),
+                linear_velocity=body.linear_velocity.copy(),
+                angular_velocity=body.angular_velocity.copy(),
+            )
+            for body in state.rigid_bodies
+        ],
+        attachments=[
+            AttachmentState(**_remap(asdict(attachment)))
+            for attachment in state.attachments
+        ],
+    )
@@ -1,10 +1,30 @@
 """Configuration for parallel environment scaling."""
 
+import math
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 
 
+def get_env_prim_path(env_id: int) -> str:
+    """Get the root prim path of an environment.
+
+    Args:
+        env_id: Environment ID
+
+    Returns:
+        Prim path such as "/World/env_3"
+    """
+    return f"/World/env_{env_id}"
+
+
+SHARED_COLLISION_GROUP_PATH = "/World/collision_groups/shared"
+"""Collision group of colliders shared by all environments (e.g., the ground plane)"""
+
+ENV_LAYOUTS = ("line", "grid", "grid3d", "compact")
+
+
 @dataclass
 class ParallelConfig:
     """Configuration for parallel environment execution.
@@ -22,10 +42,78 @@ class ParallelConfig:
     zmq_port: int = 5555
     """Port for multiplexed ZMQ ROUTER server"""
 
+    clone_envs: bool = False
+    """Build env_0 once and copy its prim specs to the other environments
+    instead of authoring every environment from scratch"""
+
+    layout: str = "line"
+    """Environment arrangement: "line" (along X), "grid" (rows in the XY plane),
+    "grid3d" (stacked XY grids) or "compact" (grid sized from env_extent)"""
+
+    columns: Optional[int] = None
+    """Environments per row for grid layouts (default: as square as possible)"""
+
+    rows: Optional[int] = None
+    """Rows per layer for the "grid3d" layout (default: as cubic as possible)"""
+
+    layer_spacing: Optional[float] = None
+    """Vertical distance between "grid3d" layers in meters (default: spacing)"""
+
+    env_extent: Optional[tuple[float, float]] = None
+    """[x, y] footprint of one environment in meters, used by the "compact" layout"""
+
+    margin: float = 0.5
+    """Gap between environment footprints in meters for the "compact" layout"""
+
+    filter_env_collisions: bool = False
+    """Put each environment in its own collision group that only collides with
+    itself and shared_collider_paths, so PhysX skips cross-environment pairs"""
+
+    shared_collider_paths: tuple[str, ...] = ("/World/defaultGroundPlane",)
+    """Colliders outside the environments that every environment collides with"""
+
+    observed_envs: Optional[tuple[int, ...]] = None
+    """Environments whose visual payloads are loaded (default: all). The others
+    only load physics and collision geometry; requires assets compiled with
+    tools/usd_asset_compiler.py"""
+
+    def __post_init__(self):
+        if self.layout not in ENV_LAYOUTS:
+            raise ValueError(f"Unknown layout: {self.layout}. Available layouts: {list(ENV_LAYOUTS)}")
+        if self.layout == "compact" and self.env_extent is None:
+            raise ValueError("The compact layout requires env_extent")
+        if self.observed_envs is not None:
+            self.observed_envs = tuple(self.observed_envs)
+            if any(env_id < 0 for env_id in self.observed_envs):
+                raise ValueError(f"Invalid observed_envs: {self.observed_envs}")
+
+    def _grid_shape(self) -> tuple[int, int, float, float]:
+        """Get (columns, rows, x spacing, y spacing) for the grid layouts."""
+        num_envs = max(self.num_envs, 1)
+
+        if self.layout == "compact":
+            spacing_x = self.env_extent[0] + self.margin
+            spacing_y = self.env_extent[1] + self.margin
+            # Pick the column count that makes the overall footprint closest to square
+            columns = self.columns or max(1, math.ceil(math.sqrt(num_envs * spacing_y / spacing_x)))
+            return columns, math.ceil(num_envs / columns), spacing_x, spacing_y
+
+        if self.layout == "grid3d":
+            side = math.ceil(round(num_envs ** (1.0 / 3.0), 6))
+            columns = self.columns or side
+            rows = self.rows or side
+            return columns, rows, self.spacing, self.spacing
+
+        columns = self.columns or math.ceil(math.sqrt(num_envs))
+        return columns, math.ceil(num_envs / columns), self.spacing, self.spacing
+
     def get_offset(self, env_id: int) -> np.ndarray:
         """Calculate spatial offset for a given environment.
 
-        Environments are arranged linearly along the X axis.
+        Environment 0 is always at the origin. Grid layouts fill rows along X
+        first, then along Y ("grid3d" then stacks further layers along Z).
+        Environment IDs past num_envs (e.g., added at runtime) continue the
+        pattern.
 
         Args:
             env_id: Environment ID (0 to num_envs-1)
@@ -33,4 +121,41 @@ class ParallelConfig:
         Returns:
             [x, y, z] offset in meters
         """
-        return np.array([env_id * self.spacing, 0.0, 0.0])
+        if self.layout == "line":
+            return np.array([env_id * self.spacing, 0.0, 0.0])
+
+        columns, rows, spacing_x, spacing_y = self._grid_shape()
+        column = env_id % columns
+        row = env_id // columns
+
+        if self.layout == "grid3d":
+            layer_spacing = self.layer_spacing if self.layer_spacing is not None else self.spacing
+            return np.array([
+                column * spacing_x,
+                (row % rows) * spacing_y,
+                (row // rows) * layer_spacing,
+            ])
+
+        return np.array([column * spacing_x, row * spacing_y, 0.0])
+
+    def is_observed(self, env_id: int) -> bool:
+        """Check whether an environment loads its visual payloads.
+
+        Args:
+            env_id: Environment ID
+
+        Returns:
+            True if observed_envs is unset or contains env_id
+        """
+        return self.observed_envs is None or env_id in self.observed_envs
+
+    def get_collision_group_path(self, env_id: int) -> str:
+        """Get the path of an environment's collision group prim.
+
+        Args:
+            env_id: Environment ID
+
+        Returns:
+            Prim path inside the environment root
+        """
+        return f"{get_env_prim_path(env_id)}/collision_group"
@@ -0,0 +1,280 @@
+"""Vectorized rigid-transform math on stacked pose arrays.
+
+Poses are float arrays of shape (..., 7) laid out as
+[x, y, z, qw, qx, qy, qz], matching the [w, x, y, z] quaternion convention
+used throughout slcore. Every function broadcasts over leading dimensions,
+so a single (7,) pose, an (N, 7) batch (e.g., one pose per environment)
+and an (E, M, 7) grid all go through the same code path.
+"""
+
+import numpy as np
+
+
+IDENTITY_QUAT = np.array([1.0, 0.0, 0.0, 0.0])
+IDENTITY_POSE = np.array([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+
+
+# =============================================================================
+# Packing
+# =============================================================================
+
+def make_poses(positions, orientations=None) -> np.ndarray:
+    """Stack positions and quaternions into pose arrays.
+
+    Args:
+        positions: (..., 3) positions
+        orientations: (..., 4) [w, x, y, z] quaternions (default: identity)
+
+    Returns:
+        (..., 7) poses
+    """
+    positions = np.asarray(positions, dtype=float)
+    orientations = np.asarray(IDENTITY_QUAT if orientations is None else orientations, dtype=float)
+    shape = np.broadcast_shapes(positions.shape[:-1], orientations.shape[:-1])
+    return np.concatenate([
+        np.broadcast_to(positions, shape + (3,)),
+        np.broadcast_to(orientations, shape + (4,)),
+    ], axis=-1)
+
+
+def split_poses(poses) -> tuple[np.ndarray, np.ndarray]:
+    """Split pose arrays into positions and quaternions.
+
+    Args:
+        poses: (..., 7) poses
+
+    Returns:
+        Tuple of ((..., 3) positions, (..., 4) [w, x, y, z] quaternions)
+    """
+    poses = np.asarray(poses, dtype=float)
+    return poses[..., :3], poses[..., 3:]
+
+
+# =============================================================================
+# Quaternions
+# =============================================================================
+
+def quat_normalize(quats) -> np.ndarray:
+    """Normalize quaternions to unit length.
+
+    Args:
+        quats: (..., 4) [w, x, y, z] quaternions
+
+    Returns:
+        (..., 4) unit quaternions
+    """
+    quats = np.asarray(quats, dtype=float)
+    return quats / np.linalg.norm(quats, axis=-1, keepdims=True)
+
+
+def quat_conjugate(quats) -> np.ndarray:
+    """Conjugate (inverse, for unit quaternions) of quaternions.
+
+    Args:
+        quats: (..., 4) [w, x, y, z] quaternions
+
+    Returns:
+        (..., 4) conjugated quaternions
+    """
+    quats = np.asarray(quats, dtype=float)
+    return quats * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def quat_multiply(q1, q2) -> np.ndarray:
+    """Hamilton product q1 * q2 (apply q2, then q1).
+
+    Args:
+        q1: (..., 4) [w, x, y, z] quaternions
+        q2: (..., 4) [w, x, y, z] quaternions
+
+    Returns:
+        (..., 4) quaternion products
+    """
+    q1 = np.asarray(q1, dtype=float)
+    q2 = np.asarray(q2, dtype=float)
+    w1, x1, y1, z1 = np.moveaxis(q1, -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(q2, -1, 0)
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ], axis=-1)
+
+
+def quat_rotate(quats, vectors) -> np.ndarray:
+    """Rotate vectors by unit quaternions.
+
+    Args:
+        quats: (..., 4) [w, x, y, z] unit quaternions
+        vectors: (..., 3) vectors
+
+    Returns:
+        (..., 3) rotated vectors
+    """
+    quats = np.asarray(quats, dtype=float)
+    vectors = np.asarray(vectors, dtype=float)
+    w = quats[..., :1]
+    xyz = quats[..., 1:]
+    # v' = v + 2w(u x v) + 2u x (u x v)
+    t = 2.0 * np.cross(xyz, vectors)
+    return vectors + w * t + np.cross(xyz, t)
+
+
+def quat_to_matrix(quats) -> np.ndarray:
+    """Convert unit quaternions to rotation matrices.
+
+    Args:
+        quats: (..., 4) [w, x, y, z] unit quaternions
+
+    Returns:
+        (..., 3, 3) rotation matrices
+    """
+    w, x, y, z = np.moveaxis(np.asarray(quats, dtype=float), -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+        np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+        np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1),
+    ], axis=-2)
+
+
+def matrix_to_quat(matrices) -> np.ndarray:
+    """Convert rotation matrices to unit quaternions with w >= 0.
+
+    Args:
+        matrices: (..., 3, 3) rotation matrices
+
+    Returns:
+        (..., 4) [w, x, y, z] quaternions
+    """
+    m = np.asarray(matrices, dtype=float)
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+
+    # Compute all four candidates and keep the numerically largest per matrix
+    candidates = np.stack([
+        np.stack([1 + m00 + m11 + m22, m21 - m12, m02 - m20, m10 - m01], axis=-1),
+        np.stack([m21 - m12, 1 + m00 - m11 - m22, m01 + m10, m02 + m20], axis=-1),
+        np.stack([m02 - m20, m01 + m10, 1 - m00 + m11 - m22, m12 + m21], axis=-1),
+        np.stack([m10 - m01, m02 + m20, m12 + m21, 1 - m00 - m11 + m22], axis=-1),
+    ], axis=-2)
+    diagonal = np.stack([
+        1 + m00 + m11 + m22,
+        1 + m00 - m11 - m22,
+        1 - m00 + m11 - m22,
+        1 - m00 - m11 + m22,
+    ], axis=-1)
+    best = np.argmax(diagonal, axis=-1)
+    quats = np.take_along_axis(candidates, best[..., None, None], axis=-2)[..., 0, :]
+    quats = quat_normalize(quats)
+    return np.where(quats[..., :1] < 0, -quats, quats)
+
+
+# =============================================================================
+# Poses
+# =============================================================================
+
+def compose_poses(a, b) -> np.ndarray:
+    """Compose poses: the pose b expressed in frame a, returned in a's parent frame.
+
+    Args:
+        a: (..., 7) parent-frame poses
+        b: (..., 7) poses relative to a
+
+    Returns:
+        (..., 7) composed poses a * b
+    """
+    pa, qa = split_poses(a)
+    pb, qb = split_poses(b)
+    return make_poses(pa + quat_rotate(qa, pb), quat_multiply(qa, qb))
+
+
+def invert_poses(poses) -> np.ndarray:
+    """Invert poses.
+
+    Args:
+        poses: (..., 7) poses
+
+    Returns:
+        (..., 7) inverse poses
+    """
+    positions, quats = split_poses(poses)
+    inverse_quats = quat_conjugate(quats)
+    return make_poses(-quat_rotate(inverse_quats, positions), inverse_quats)
+
+
+def relative_poses(frames, poses) -> np.ndarray:
+    """Express poses in other frames (world to local).
+
+    Args:
+        frames: (..., 7) frame poses in the common parent frame
+        poses: (..., 7) poses in the common parent frame
+
+    Returns:
+        (..., 7) poses relative to the frames, inverse(frames) * poses
+    """
+    return compose_poses(invert_poses(frames), poses)
+
+
+def translate_poses(poses, offsets) -> np.ndarray:
+    """Shift poses by positional offsets, keeping their orientations.
+
+    Args:
+        poses: (..., 7) poses
+        offsets: (..., 3) offsets
+
+    Returns:
+        (..., 7) shifted poses
+    """
+    positions, quats = split_poses(poses)
+    return make_poses(positions + np.asarray(offsets, dtype=float), quats)
+
+
+def tile_poses(poses, offsets) -> np.ndarray:
+    """Replicate a set of poses for every offset (e.g., every environment).
+
+    Args:
+        poses: (M, 7) poses
+        offsets: (E, 3) offsets
+
+    Returns:
+        (E, M, 7) poses, entry [e, m] being poses[m] shifted by offsets[e]
+    """
+    poses = np.asarray(poses, dtype=float)
+    offsets = np.asarray(offsets, dtype=float)
+    return translate_poses(poses[None, :, :], offsets[:, None, :])
+
+
+def poses_to_matrices(poses) -> np.ndarray:
+    """Convert poses to 4x4 homogeneous transforms (column-vector convention).
+
+    Args:
+        poses: (..., 7) poses
+
+    Returns:
+        (..., 4, 4) transforms
+    """
+    positions, quats = split_poses(poses)
+    matrices = np.zeros(positions.shape[:-1] + (4, 4))
+    matrices[..., :3, :3] = quat_to_matrix(quats)
+    matrices[..., :3, 3] = positions
+    matrices[..., 3, 3] = 1.0
+    return matrices
+
+
+def matrices_to_poses(matrices) -> np.ndarray:
+    """Convert 4x4 homogeneous transforms (column-vector convention) to poses.
+
+    Any scale in the transforms is removed before the rotation is extracted.
+
+    Args:
+        matrices: (..., 4, 4) transforms
+
+    Returns:
+        (..., 7) poses
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    rotations = matrices[..., :3, :3]
+    rotations = rotations / np.linalg.norm(rotations, axis=-2, keepdims=True)
+    return make_poses(matrices[..., :3, 3], matrix_to_quat(rotations))
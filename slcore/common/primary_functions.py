@@ -1,15 +1,23 @@
+import time
 from pathlib import Path
+
 import numpy as np
 
 from isaacsim.core.api.robots import Robot
-from isaacsim.core.utils.stage import add_reference_to_stage, get_current_stage
+from isaacsim.core.utils.prims import delete_prim
+from isaacsim.core.utils.stage import add_reference_to_stage
 from omni.physx import get_physx_simulation_interface
 from omni.physx.bindings._physx import ContactEventType
 from omni.physx.scripts.physicsUtils import PhysicsSchemaTools
-from pxr import PhysxSchema, UsdPhysics
-
-from slcore.common import utils
-from slcore.common.parallel_config import ParallelConfig
+from pxr import Sdf, Usd, UsdPhysics
+
+from slcore.common import stage_authoring, utils
+from slcore.common.compiled_assets import get_compiled_asset, resolve_asset_path
+from slcore.common.env_state import forget_rigid_prims
+from slcore.common.parallel_config import ParallelConfig, SHARED_COLLISION_GROUP_PATH, get_env_prim_path
+from slcore.common.stage_cache import get_xform_cache
+from slcore.motion.ik_batch import flush_ik_batch_queues
+from slcore.robots.common.batched_ik_solver import invalidate_batched_ik_solvers
 from slcore.robots.common.config import CUSTOM_ASSETS_ROOT_PATH, PhysicsConfig, DEFAULT_PHYSICS_CONFIG
 from slcore.robots.common.validation import validate_prim_exists
 from slcore.robots.common.zmq_router_server import ZMQRouterServer
@@ -58,32 +66,153 @@ def create_zmq_server(robot_type: str, simulation_app, robot, robot_prim_path: s
 
 
 class CollisionDetector:
-    """Handles collision detection and notifies robot servers"""
+    """Routes PhysX contact reports to the robot servers of the affected environment.
+
+    Contact actors are resolved to their environment through a path-prefix index
+    built once from the registered handlers, so each contact is only delivered to
+    handlers in the same environment that set ``wants_collision_events``.
+    """
+
+    def __init__(self, robot_servers, log_interval: float = 1.0):
+        """Initialize the detector and subscribe to contact report events.
+
+        Args:
+            robot_servers: Dict of {identity: server} for all environments
+            log_interval: Minimum seconds between collision log lines
+        """
+        self.robot_servers = robot_servers
+        self.log_interval = log_interval
+        self._last_log_time = 0.0
+        self._suppressed_logs = 0
+
+        # Contact actors arrive as encoded ints; decode each body path once
+        self._path_cache: dict[int, str] = {}
+
+        self.rebuild_index()
 
-    def __init__(self, robot_servers):
-        self.robot_servers = robot_servers  # Dict of {robot_name: server}
         self._contact_report_sub = get_physx_simulation_interface().subscribe_contact_report_events(
             self.on_collision
         )
 
+    def rebuild_index(self):
+        """Rebuild the environment prefix index from the registered servers.
+
+        Call this after servers are added or removed.
+        """
+        self._env_prefixes: dict[str, int] = {}
+        self._env_listeners: dict[int, list] = {}
+
+        for server in self.robot_servers.values():
+            env_prefix = server.robot_prim_path.rsplit("/", 1)[0]
+            self._env_prefixes[env_prefix] = server.env_id
+            listeners = self._env_listeners.setdefault(server.env_id, [])
+            if getattr(server, "wants_collision_events", False):
+                listeners.append(server)
+
+        self._path_cache.clear()
+
+    def _resolve_path(self, encoded_path: int) -> str:
+        """Decode a PhysX actor path, caching the result."""
+        path = self._path_cache.get(encoded_path)
+        if path is None:
+            path = str(PhysicsSchemaTools.intToSdfPath(encoded_path))
+            self._path_cache[encoded_path] = path
+        return path
+
+    def _resolve_env(self, path: str):
+        """Map a prim path to its environment ID, or None if outside any environment."""
+        # "/World/env_3/pf400/link" -> "/World/env_3"
+        parts = path.split("/", 3)
+        return self._env_prefixes.get("/".join(parts[:3]))
+
+    def _log_collision(self, actor0: str, actor1: str):
+        """Log a collision, rate-limited to one line per log interval."""
+        now = time.monotonic()
+        if now - self._last_log_time < self.log_interval:
+            self._suppressed_logs += 1
+            return
+
+        suffix = f" (+{self._suppressed_logs} more since last report)" if self._suppressed_logs else ""
+        print(f"Collision detected: {actor0} <-> {actor1}{suffix}")
+        self._last_log_time = now
+        self._suppressed_logs = 0
+
     def on_collision(self, contact_headers, contact_data):
-        """Handle collision events and notify all robot servers"""
+        """Handle collision events and notify servers in the affected environment"""
 
         for contact_header in contact_headers:
             if contact_header.type != ContactEventType.CONTACT_FOUND:
                 continue
 
-            actor0 = str(PhysicsSchemaTools.intToSdfPath(contact_header.actor0))
-            actor1 = str(PhysicsSchemaTools.intToSdfPath(contact_header.actor1))
+            actor0 = self._resolve_path(contact_header.actor0)
+            actor1 = self._resolve_path(contact_header.actor1)
 
-            print(f"Collision detected: {actor0} <-> {actor1}")
+            env0 = self._resolve_env(actor0)
+            env1 = self._resolve_env(actor1)
+            if env0 is None and env1 is None:
+                continue
+
+            self._log_collision(actor0, actor1)
 
-            # Notify all robot servers - they decide what to care about
-            for robot_name, server in self.robot_servers.items():
-                if hasattr(server, 'on_collision'):
+            for env_id in {env0, env1}:
+                for server in self._env_listeners.get(env_id, ()):
                     server.on_collision(actor0, actor1)
 
 
+# Collision prim paths (relative to the robot root) found per robot asset
+_collision_paths_by_asset: dict[str, list[Sdf.Path]] = {}
+
+
+def find_collision_paths(root_prim: Usd.Prim) -> list[Sdf.Path]:
+    """Find all prims with UsdPhysics.CollisionAPI below a root prim.
+
+    Only the root's own subtree is traversed.
+
+    Args:
+        root_prim: Root prim of the subtree (e.g., a robot)
+
+    Returns:
+        Paths of collision prims, relative to the root prim
+    """
+    root_path = root_prim.GetPath()
+    return [
+        prim.GetPath().MakeRelativePath(root_path)
+        for prim in Usd.PrimRange(root_prim)
+        if prim.HasAPI(UsdPhysics.CollisionAPI)
+    ]
+
+
+def apply_contact_offset(root_prim: Usd.Prim, asset_path: str = None, contact_offset: float = None):
+    """Set the PhysX contact offset on every collision shape below a root prim.
+
+    The collision shapes of an asset are found once and the relative paths are
+    replayed for every further copy of the same asset, so setting up N robots
+    costs one subtree traversal per asset instead of one per robot.
+
+    Args:
+        root_prim: Root prim of the subtree (e.g., a robot)
+        asset_path: USD file the subtree references, used as the cache key
+            (optional; without it the subtree is always traversed)
+        contact_offset: Contact offset in meters (default: DEFAULT_PHYSICS_CONFIG.contact_offset)
+    """
+    if contact_offset is None:
+        contact_offset = DEFAULT_PHYSICS_CONFIG.contact_offset
+
+    collision_paths = _collision_paths_by_asset.get(asset_path) if asset_path else None
+    if collision_paths is None:
+        collision_paths = find_collision_paths(root_prim)
+        if asset_path:
+            _collision_paths_by_asset[asset_path] = collision_paths
+
+    # Author all shapes in one batch so the stage recomposes once per robot
+    layer = root_prim.GetStage().GetEditTarget().GetLayer()
+    root_path = root_prim.GetPath()
+    with Sdf.ChangeBlock():
+        for relative_path in collision_paths:
+            prim_spec = stage_authoring.get_prim_spec(layer, relative_path.MakeAbsolutePath(root_path))
+            stage_authoring.author_contact_offset(prim_spec, contact_offset)
+
+
 def create_robot(simulation_app, world, robot_config, add=True):
     """Create robots and their ZMQ servers.
 
@@ -91,7 +220,7 @@ def create_robot(simulation_app, world, robot_config, add=True):
         simulation_app: Isaac Sim application instance
         world: Isaac Sim world
         robot_config: Dictionary with robot configuration including:
-            - asset_path: USD file path
+            - asset_path: USD file path (its compiled layers are used when current)
             - prim_path: USD prim path
             - name: Robot name
             - type: Robot type (pf400, peeler, etc.)
@@ -106,7 +235,7 @@ def create_robot(simulation_app, world, robot_config, add=True):
     # Create robot in simulation
     if add:
         add_reference_to_stage(
-            usd_path=robot_config["asset_path"],
+            usd_path=resolve_asset_path(robot_config["asset_path"]),
             prim_path=robot_config['prim_path'],
         )
 
@@ -135,36 +264,268 @@ def create_robot(simulation_app, world, robot_config, add=True):
         env_id,
     )
 
-    # Enable collision detection
-    contact_report_api = PhysxSchema.PhysxContactReportAPI.Apply(robot_prim)
-    contact_report_api.CreateThresholdAttr().Set(0.0)
+    # Apply contact reporting, switched off until the robot moves or holds an object
+    zmq_server.set_contact_reporting(False)
 
     # Set contact offset for robot for precise collision detection
     # This needs to be applied to all collision shapes in the robot hierarchy
-    stage = get_current_stage()
-    for prim in stage.Traverse():
-        prim_path = str(prim.GetPath())
-        if prim_path.startswith(robot_prim.GetPath().pathString):
-            if prim.HasAPI(UsdPhysics.CollisionAPI):
-                physx_collision = PhysxSchema.PhysxCollisionAPI.Apply(prim)
-                physx_collision.CreateContactOffsetAttr().Set(DEFAULT_PHYSICS_CONFIG.contact_offset)
+    apply_contact_offset(robot_prim, robot_config.get("asset_path"))
 
     return robot, zmq_server
 
 
+def get_env_robot_configs(base_robots: list[dict], parallel_config: ParallelConfig, env_id: int) -> list[dict]:
+    """Clone base robot configs for one environment.
+
+    Args:
+        base_robots: List of base robot configs (without env_id or spatial offsets)
+        parallel_config: Parallel environment configuration
+        env_id: Environment ID
+
+    Returns:
+        Robot configs with environment-specific prim path, name, env_id and position
+    """
+    offset = parallel_config.get_offset(env_id)
+    robot_configs = []
+
+    for base_robot in base_robots:
+        robot_config = base_robot.copy()
+        robot_type = robot_config["type"]
+
+        # Update prim path and name with environment ID
+        robot_config["prim_path"] = f"{get_env_prim_path(env_id)}/{robot_type}"
+        robot_config["name"] = f"{robot_type}_{env_id}"
+        robot_config["env_id"] = env_id
+
+        # Apply spatial offset to position
+        if "position" in robot_config:
+            base_position = np.array(robot_config["position"])
+            robot_config["position"] = (base_position + offset).tolist()
+
+        robot_configs.append(robot_config)
+
+    return robot_configs
+
+
+def author_robots(layer: Sdf.Layer, robot_configs: list[dict]):
+    """Author robot references and poses as Sdf specs.
+
+    Only uses Sdf calls, so it can run inside an Sdf.ChangeBlock.
+
+    Args:
+        layer: Layer to author into (usually the stage's edit target layer)
+        robot_configs: Robot configs with asset_path, prim_path and optional pose
+    """
+    for robot_config in robot_configs:
+        stage_authoring.author_reference(
+            layer,
+            robot_config["prim_path"],
+            resolve_asset_path(robot_config["asset_path"]),
+            robot_config.get("position"),
+            robot_config.get("orientation"),
+        )
+
+
+def author_env_collision_group(layer: Sdf.Layer, env_id: int, parallel_config: ParallelConfig):
+    """Author a collision group that confines an environment's contacts to itself.
+
+    The group only collides with itself and the shared collider group, so
+    PhysX never generates broad-phase pairs or contact reports between
+    environments. Only uses Sdf calls, so it can run inside an Sdf.ChangeBlock.
+
+    Args:
+        layer: Layer to author into
+        env_id: Environment ID
+        parallel_config: Parallel environment configuration
+    """
+    group_path = parallel_config.get_collision_group_path(env_id)
+    stage_authoring.author_collision_group(
+        layer,
+        group_path,
+        includes=[get_env_prim_path(env_id)],
+        filtered_groups=[group_path, SHARED_COLLISION_GROUP_PATH],
+        invert_filtered_groups=True,
+    )
+
+
+def author_shared_collision_group(layer: Sdf.Layer, parallel_config: ParallelConfig):
+    """Author the collision group of colliders every environment collides with.
+
+    Args:
+        layer: Layer to author into
+        parallel_config: Parallel environment configuration
+    """
+    stage_authoring.author_collision_group(
+        layer,
+        SHARED_COLLISION_GROUP_PATH,
+        includes=list(parallel_config.shared_collider_paths),
+    )
+
+
+def set_env_load_rules(stage: Usd.Stage, parallel_config: ParallelConfig, env_ids):
+    """Set stage load rules so only observed environments load visual payloads.
+
+    Rules are path based, so they can be set before the environments are
+    authored; payloads under unobserved environment roots are then never
+    loaded. Compiled assets keep their visuals behind such a payload, while
+    colliders stay in the always-loaded physics layer. Does nothing when
+    parallel_config.observed_envs is unset.
+
+    Args:
+        stage: USD stage
+        parallel_config: Parallel environment configuration
+        env_ids: Environment IDs to set rules for
+    """
+    if parallel_config.observed_envs is None:
+        return
+
+    rules = stage.GetLoadRules()
+    for env_id in env_ids:
+        rule = Usd.StageLoadRules.AllRule if parallel_config.is_observed(env_id) else Usd.StageLoadRules.NoneRule
+        rules.AddRule(get_env_prim_path(env_id), rule)
+    rules.Minimize()
+    stage.SetLoadRules(rules)
+
+
+def create_env(
+    simulation_app,
+    world,
+    base_robots: list[dict],
+    parallel_config: ParallelConfig,
+    env_id: int,
+    router_server: ZMQRouterServer = None,
+    add: bool = True,
+) -> dict:
+    """Create the robots and handlers of one environment.
+
+    Args:
+        simulation_app: Isaac Sim application instance
+        world: Isaac Sim world
+        base_robots: List of base robot configs (without env_id or spatial offsets)
+        parallel_config: Parallel environment configuration
+        env_id: Environment ID
+        router_server: ROUTER server to register handlers with (optional)
+        add: Whether to author the robot prims (default: True); pass False if
+            they were already authored with author_robots()
+
+    Returns:
+        Dict mapping identity strings (env_id.robot_type) to ZMQ server instances
+    """
+    robot_configs = get_env_robot_configs(base_robots, parallel_config, env_id)
+
+    # Author all robot prims of the environment in one batch
+    if add:
+        set_env_load_rules(world.stage, parallel_config, [env_id])
+        layer = world.stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            author_robots(layer, robot_configs)
+            if parallel_config.filter_env_collisions:
+                author_env_collision_group(layer, env_id, parallel_config)
+
+    handlers = {}
+
+    for robot_config in robot_configs:
+        robot_type = robot_config["type"]
+
+        # Prims and poses are already authored; only wrap them
+        robot_config.pop("position", None)
+        robot_config.pop("orientation", None)
+
+        # Create robot and handler
+        robot, handler = create_robot(simulation_app, world, robot_config, add=False)
+
+        # Register handler with ROUTER server
+        if router_server is not None:
+            router_server.register_handler(env_id, robot_type, handler)
+
+        # Store in handlers dict
+        identity = f"env_{env_id}.{robot_type}"
+        handlers[identity] = handler
+
+    return handlers
+
+
+def remove_env(world, env_id: int, handlers: dict, router_server: ZMQRouterServer = None):
+    """Tear down one environment while the simulation keeps running.
+
+    Unregisters the environment's handlers, removes its robots from the scene
+    and deletes everything under the environment root prim (robots, location
+    markers, labware). Other environments are untouched.
+
+    Args:
+        world: Isaac Sim world
+        env_id: Environment ID
+        handlers: Dict of {identity: server} for all environments; the
+            environment's entries are removed in place
+        router_server: ROUTER server the handlers were registered with (optional)
+    """
+    env_prefix = f"env_{env_id}."
+    env_identities = [identity for identity in list(handlers) if identity.startswith(env_prefix)]
+
+    for identity in env_identities:
+        handler = handlers.pop(identity)
+        if router_server is not None:
+            router_server.unregister_handler(env_id, identity[len(env_prefix):])
+
+        handler.detach_all_objects()
+        world.scene.remove_object(handler.robot.name, registry_only=True)
+
+    env_prim_path = get_env_prim_path(env_id)
+    if world.stage.GetPrimAtPath(env_prim_path):
+        delete_prim(env_prim_path)
+    forget_rigid_prims(env_prim_path)
+
+    # Shared IK views still hold the removed robots
+    invalidate_batched_ik_solvers()
+
+    print(f"Removed env_{env_id} ({len(env_identities)} robots)")
+
+
+def clone_env(layer: Sdf.Layer, source_env_id: int, env_id: int, parallel_config: ParallelConfig):
+    """Copy an environment's prim specs to a new environment.
+
+    Everything authored under the source environment root (robot references,
+    poses, physics overrides, markers, labware) is copied in one Sdf.CopySpec
+    and the copy is shifted by a transform on its root prim. Only uses Sdf
+    calls, so it can run inside an Sdf.ChangeBlock.
+
+    Args:
+        layer: Layer holding the source environment's specs
+        source_env_id: Environment to copy (its root must have no transform)
+        env_id: Environment ID of the copy
+        parallel_config: Parallel environment configuration
+    """
+    env_prim_path = get_env_prim_path(env_id)
+    Sdf.CopySpec(layer, get_env_prim_path(source_env_id), layer, env_prim_path)
+
+    offset = parallel_config.get_offset(env_id) - parallel_config.get_offset(source_env_id)
+    stage_authoring.set_xform_spec(layer.GetPrimAtPath(env_prim_path), offset)
+
+
 def create_parallel_robots(
     simulation_app,
     world,
     base_robots: list[dict],
     parallel_config: ParallelConfig,
+    author_env_props=None,
 ):
     """Create N copies of robots with spatial offsets for parallel environments.
 
+    With parallel_config.clone_envs, env_0 is built once and its specs are
+    copied to the other environments (see clone_env()). With
+    parallel_config.filter_env_collisions, each environment gets its own
+    collision group (see author_env_collision_group()). With
+    parallel_config.observed_envs, only those environments load visuals (see
+    set_env_load_rules()).
+
     Args:
         simulation_app: Isaac Sim application instance
         world: Isaac Sim world
         base_robots: List of base robot configs (without env_id or spatial offsets)
         parallel_config: Parallel environment configuration
+        author_env_props: Optional callable(layer, env_id, offset) that authors
+            project-specific prims (location markers, labware) for one
+            environment using Sdf calls only
 
     Returns:
         Tuple of (router_server, handlers_dict) where handlers_dict maps
@@ -174,34 +535,85 @@ def create_parallel_robots(
     router_server = ZMQRouterServer(simulation_app, parallel_config.zmq_port)
 
     handlers = {}
+    layer = world.stage.GetEditTarget().GetLayer()
+
+    if parallel_config.observed_envs is not None:
+        uncompiled = [robot["asset_path"] for robot in base_robots if get_compiled_asset(robot["asset_path"]) is None]
+        if uncompiled:
+            print(f"Warning: assets without compiled visual payloads load visuals in every environment: {uncompiled}")
+    set_env_load_rules(world.stage, parallel_config, range(parallel_config.num_envs))
+
+    def author_env(env_id: int):
+        author_robots(layer, get_env_robot_configs(base_robots, parallel_config, env_id))
+        if parallel_config.filter_env_collisions:
+            author_env_collision_group(layer, env_id, parallel_config)
+        if author_env_props is not None:
+            author_env_props(layer, env_id, parallel_config.get_offset(env_id))
+
+    if parallel_config.filter_env_collisions:
+        with Sdf.ChangeBlock():
+            author_shared_collision_group(layer, parallel_config)
+
+    if parallel_config.clone_envs and parallel_config.num_envs > 1:
+        # Build the template environment completely, including the physics
+        # overrides create_robot() authors, then copy it to all other envs
+        with Sdf.ChangeBlock():
+            author_env(0)
+        handlers.update(create_env(
+            simulation_app, world, base_robots, parallel_config, 0, router_server, add=False,
+        ))
+
+        with Sdf.ChangeBlock():
+            for env_id in range(1, parallel_config.num_envs):
+                clone_env(layer, 0, env_id, parallel_config)
+        first_env_id = 1
+    else:
+        # Author every environment in one batch; the stage recomposes once
+        # when the change block closes
+        with Sdf.ChangeBlock():
+            for env_id in range(parallel_config.num_envs):
+                author_env(env_id)
+        first_env_id = 0
 
     # Create robots for each environment
-    for env_id in range(parallel_config.num_envs):
-        offset = parallel_config.get_offset(env_id)
+    for env_id in range(first_env_id, parallel_config.num_envs):
+        handlers.update(create_env(
+            simulation_app, world, base_robots, parallel_config, env_id, router_server, add=False,
+        ))
 
-        # Clone robots with environment-specific configuration
-        for base_robot in base_robots:
-            robot_config = base_robot.copy()
-            robot_type = robot_config["type"]
+    return router_server, handlers
 
-            # Update prim path and name with environment ID
-            robot_config["prim_path"] = f"/World/env_{env_id}/{robot_type}"
-            robot_config["name"] = f"{robot_type}_{env_id}"
-            robot_config["env_id"] = env_id
 
-            # Apply spatial offset to position
-            if "position" in robot_config:
-                base_position = np.array(robot_config["position"])
-                robot_config["position"] = (base_position + offset).tolist()
+def warmup_handlers(handlers: dict):
+    """Run one-time handler warmup (e.g., location IK precompute).
 
-            # Create robot and handler
-            robot, handler = create_robot(simulation_app, world, robot_config)
+    Call this after world.reset(), once physics views exist, and before
+    the ROUTER server starts serving commands.
 
-            # Register handler with ROUTER server
-            router_server.register_handler(env_id, robot_type, handler)
+    Args:
+        handlers: Dict of {identity: ZMQ server instance}
+    """
+    start_time = time.perf_counter()
+    for handler in list(handlers.values()):
+        handler.warmup()
+    print(f"Warmed up {len(handlers)} handlers in {time.perf_counter() - start_time:.2f}s")
 
-            # Store in handlers dict
-            identity = f"env_{env_id}.{robot_type}"
-            handlers[identity] = handler
 
-    return router_server, handlers
+def update_handlers(handlers: dict):
+    """Run one frame of robot handler updates.
+
+    Call this once per simulation frame before stepping the world.
+
+    Args:
+        handlers: Dict of {identity: ZMQ server instance}
+    """
+    # Transforms changed during the last physics step
+    get_xform_cache().advance_frame()
+
+    for handler in list(handlers.values()):
+        handler.update()
+        handler.sync_contact_reporting()
+
+    # Solve this frame's queued IK requests together; handlers pick up the
+    # results on their next update
+    flush_ik_batch_queues()
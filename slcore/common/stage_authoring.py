@@ -0,0 +1,216 @@
+"""Sdf-level authoring helpers for batched stage construction.
+
+Authoring through the Usd API sends a change notice (and triggers
+recomposition) for every attribute that is set. These helpers write prim
+and attribute specs directly to a layer so they can be used inside an
+Sdf.ChangeBlock, which defers notification until the block closes:
+
+    layer = stage.GetEditTarget().GetLayer()
+    with Sdf.ChangeBlock():
+        author_reference(layer, "/World/env_0/pf400", asset_path, position, orientation)
+        author_xform(layer, "/World/env_0/locations/home", position, orientation)
+
+Only Sdf calls are safe inside a change block: composed prims (Usd.Prim)
+must not be read until the block has closed.
+"""
+
+from pxr import Gf, Sdf
+
+
+def pose_to_matrix(position, orientation=None) -> Gf.Matrix4d:
+    """Build a transform matrix from a position and quaternion.
+
+    Args:
+        position: [x, y, z] position
+        orientation: [w, x, y, z] quaternion (default: identity)
+
+    Returns:
+        Gf.Matrix4d transform
+    """
+    if orientation is None:
+        orientation = [1.0, 0.0, 0.0, 0.0]
+    w, x, y, z = (float(v) for v in orientation)
+    rotation = Gf.Rotation(Gf.Quatd(w, Gf.Vec3d(x, y, z)))
+    return Gf.Matrix4d().SetTransform(rotation, Gf.Vec3d(*(float(v) for v in position)))
+
+
+def get_prim_spec(layer: Sdf.Layer, prim_path: str, type_name: str = None, define: bool = False) -> Sdf.PrimSpec:
+    """Get or create the prim spec at a path.
+
+    Args:
+        layer: Layer to author into
+        prim_path: Prim path
+        type_name: Prim type to set (e.g., "Xform") (optional)
+        define: Whether to make the spec a "def" rather than an "over"; missing
+            ancestors are then defined as Xforms, like add_reference_to_stage()
+
+    Returns:
+        Prim spec at prim_path
+    """
+    prim_spec = Sdf.CreatePrimInLayer(layer, Sdf.Path(prim_path))
+    if define:
+        prim_spec.specifier = Sdf.SpecifierDef
+
+        # CreatePrimInLayer adds missing ancestors as typeless "over" specs, which
+        # would leave the new prim undefined (skipped by traversal and PhysX)
+        parent_spec = prim_spec.nameParent
+        while parent_spec and parent_spec.path != Sdf.Path.absoluteRootPath:
+            if parent_spec.specifier == Sdf.SpecifierOver and not parent_spec.typeName:
+                parent_spec.specifier = Sdf.SpecifierDef
+                parent_spec.typeName = "Xform"
+            parent_spec = parent_spec.nameParent
+    if type_name:
+        prim_spec.typeName = type_name
+    return prim_spec
+
+
+def set_attribute_spec(prim_spec: Sdf.PrimSpec, name: str, type_name: Sdf.ValueTypeName, value):
+    """Set an attribute value on a prim spec, creating the attribute spec if needed.
+
+    Args:
+        prim_spec: Prim spec to author on
+        name: Attribute name (e.g., "physxCollision:contactOffset")
+        type_name: Attribute value type (e.g., Sdf.ValueTypeNames.Float)
+        value: Value to set
+    """
+    attr_spec = prim_spec.attributes.get(name)
+    if attr_spec is None:
+        attr_spec = Sdf.AttributeSpec(prim_spec, name, type_name)
+    attr_spec.default = value
+
+
+def set_relationship_spec(prim_spec: Sdf.PrimSpec, name: str, targets: list[str]):
+    """Set the explicit targets of a relationship on a prim spec.
+
+    Args:
+        prim_spec: Prim spec to author on
+        name: Relationship name (e.g., "physics:filteredGroups")
+        targets: Target prim paths
+    """
+    rel_spec = prim_spec.relationships.get(name)
+    if rel_spec is None:
+        rel_spec = Sdf.RelationshipSpec(prim_spec, name, custom=False)
+    rel_spec.targetPathList.explicitItems = [Sdf.Path(target) for target in targets]
+
+
+def apply_api_schema_spec(prim_spec: Sdf.PrimSpec, schema_name: str):
+    """Add an applied API schema (e.g., "PhysxCollisionAPI") to a prim spec.
+
+    Args:
+        prim_spec: Prim spec to author on
+        schema_name: Registered name of the applied API schema
+    """
+    schemas = prim_spec.GetInfo("apiSchemas")
+    prepended = list(schemas.prependedItems)
+    if schema_name in prepended:
+        return
+    prepended.append(schema_name)
+    schemas.prependedItems = prepended
+    prim_spec.SetInfo("apiSchemas", schemas)
+
+
+def set_xform_spec(prim_spec: Sdf.PrimSpec, position, orientation=None):
+    """Author a local transform on a prim spec.
+
+    Uses a single xformOp:transform, matching utils.set_xform_world_pose().
+
+    Args:
+        prim_spec: Prim spec to author on
+        position: [x, y, z] position
+        orientation: [w, x, y, z] quaternion (default: identity)
+    """
+    set_attribute_spec(prim_spec, "xformOp:transform", Sdf.ValueTypeNames.Matrix4d,
+                       pose_to_matrix(position, orientation))
+    set_attribute_spec(prim_spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, ["xformOp:transform"])
+
+
+def author_xform(layer: Sdf.Layer, prim_path: str, position=None, orientation=None) -> Sdf.PrimSpec:
+    """Define an Xform prim, optionally with a transform.
+
+    Args:
+        layer: Layer to author into
+        prim_path: Prim path
+        position: [x, y, z] position (optional)
+        orientation: [w, x, y, z] quaternion (optional)
+
+    Returns:
+        The Xform prim spec
+    """
+    prim_spec = get_prim_spec(layer, prim_path, type_name="Xform", define=True)
+    if position is not None:
+        set_xform_spec(prim_spec, position, orientation)
+    return prim_spec
+
+
+def author_reference(layer: Sdf.Layer, prim_path: str, asset_path: str, position=None, orientation=None) -> Sdf.PrimSpec:
+    """Define a prim that references a USD asset, optionally with a transform.
+
+    Sdf equivalent of add_reference_to_stage() followed by set_xform_world_pose()
+    for prims whose parents have no transform of their own.
+
+    Args:
+        layer: Layer to author into
+        prim_path: Prim path
+        asset_path: USD file to reference
+        position: [x, y, z] position (optional)
+        orientation: [w, x, y, z] quaternion (optional)
+
+    Returns:
+        The referencing prim spec
+    """
+    prim_spec = get_prim_spec(layer, prim_path, define=True)
+    references = list(prim_spec.referenceList.prependedItems)
+    if not any(reference.assetPath == asset_path for reference in references):
+        prim_spec.referenceList.Prepend(Sdf.Reference(asset_path))
+    if position is not None:
+        set_xform_spec(prim_spec, position, orientation)
+    return prim_spec
+
+
+def author_contact_offset(prim_spec: Sdf.PrimSpec, contact_offset: float):
+    """Apply PhysxCollisionAPI with a contact offset to a prim spec.
+
+    Args:
+        prim_spec: Prim spec of a collision prim
+        contact_offset: Contact offset in meters
+    """
+    apply_api_schema_spec(prim_spec, "PhysxCollisionAPI")
+    set_attribute_spec(prim_spec, "physxCollision:contactOffset", Sdf.ValueTypeNames.Float, float(contact_offset))
+
+
+def author_contact_report(prim_spec: Sdf.PrimSpec, threshold: float):
+    """Apply PhysxContactReportAPI with a force threshold to a prim spec.
+
+    Args:
+        prim_spec: Prim spec of a rigid body
+        threshold: Contact report force threshold
+    """
+    apply_api_schema_spec(prim_spec, "PhysxContactReportAPI")
+    set_attribute_spec(prim_spec, "physxContactReport:threshold", Sdf.ValueTypeNames.Float, float(threshold))
+
+
+def author_collision_group(
+    layer: Sdf.Layer,
+    group_path: str,
+    includes: list[str],
+    filtered_groups: list[str] = (),
+    invert_filtered_groups: bool = False,
+) -> Sdf.PrimSpec:
+    """Define a UsdPhysics.CollisionGroup.
+
+    Args:
+        layer: Layer to author into
+        group_path: Prim path of the collision group
+        includes: Prim paths whose colliders belong to the group (subtrees included)
+        filtered_groups: Collision groups this group does not collide with
+        invert_filtered_groups: Collide only with filtered_groups instead
+
+    Returns:
+        The collision group prim spec
+    """
+    prim_spec = get_prim_spec(layer, group_path, type_name="PhysicsCollisionGroup", define=True)
+    apply_api_schema_spec(prim_spec, "CollectionAPI:colliders")
+    set_relationship_spec(prim_spec, "collection:colliders:includes", includes)
+    set_relationship_spec(prim_spec, "physics:filteredGroups", filtered_groups)
+    set_attribute_spec(prim_spec, "physics:invertFilteredGroups", Sdf.ValueTypeNames.Bool, invert_filtered_groups)
+    return prim_spec
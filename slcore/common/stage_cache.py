@@ -0,0 +1,471 @@
+"""Stage lookup caches kept current through USD change notices.
+
+Hot paths such as raycast callbacks query the same prims over and over.
+These caches answer those queries from dictionaries and drop affected
+entries when Usd.Notice.ObjectsChanged reports that prims were resynced.
+"""
+
+import re
+import threading
+from typing import Optional
+
+import numpy as np
+from isaacsim.core.utils.stage import get_current_stage
+from pxr import Tf, Usd, UsdGeom, UsdPhysics
+
+
+def _has_path_prefix(path: str, prefix: str) -> bool:
+    """Check whether path equals prefix or lies below it."""
+    return prefix == "/" or path == prefix or path.startswith(prefix + "/")
+
+
+class RigidBodyCache:
+    """Cache from prim path to (prim, is_rigid_body).
+
+    Entries are filled lazily on first lookup and invalidated when the
+    prim or one of its ancestors is resynced (created, removed, or had
+    API schemas applied/removed).
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        """Initialize the cache and register for stage change notices.
+
+        Args:
+            stage: USD stage to cache lookups for
+        """
+        self.stage = stage
+        self._entries: dict[str, tuple[Usd.Prim, bool]] = {}
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+
+    def _on_objects_changed(self, notice, sender):
+        """Drop cached entries under any resynced path."""
+        if not self._entries:
+            return
+
+        for changed_path in notice.GetResyncedPaths():
+            prefix = changed_path.GetPrimPath().pathString
+            if prefix == "/":
+                self._entries.clear()
+                return
+            stale = [path for path in self._entries if _has_path_prefix(path, prefix)]
+            for path in stale:
+                del self._entries[path]
+
+    def lookup(self, prim_path: str) -> tuple[Usd.Prim, bool]:
+        """Get a prim and whether it has UsdPhysics.RigidBodyAPI.
+
+        Args:
+            prim_path: Prim path string (e.g., from a PhysX hit)
+
+        Returns:
+            Tuple of (prim, is_rigid_body)
+        """
+        entry = self._entries.get(prim_path)
+        if entry is None:
+            prim = self.stage.GetPrimAtPath(prim_path)
+            is_rigid_body = bool(prim) and prim.HasAPI(UsdPhysics.RigidBodyAPI)
+            entry = (prim, is_rigid_body)
+            self._entries[prim_path] = entry
+        return entry
+
+    def get_rigid_body(self, prim_path: str) -> Optional[Usd.Prim]:
+        """Get the prim at prim_path if it is a rigid body.
+
+        Args:
+            prim_path: Prim path string
+
+        Returns:
+            The prim, or None if it does not exist or is not a rigid body
+        """
+        prim, is_rigid_body = self.lookup(prim_path)
+        return prim if is_rigid_body else None
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def revoke(self):
+        """Stop listening for stage change notices."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+
+_rigid_body_cache: Optional[RigidBodyCache] = None
+
+
+def get_rigid_body_cache() -> RigidBodyCache:
+    """Get the rigid body cache for the current stage.
+
+    The cache is recreated if the current stage has changed since
+    the last call.
+
+    Returns:
+        RigidBodyCache bound to the current stage
+    """
+    global _rigid_body_cache
+    stage = get_current_stage()
+    if _rigid_body_cache is None or _rigid_body_cache.stage != stage:
+        if _rigid_body_cache is not None:
+            _rigid_body_cache.revoke()
+        _rigid_body_cache = RigidBodyCache(stage)
+    return _rigid_body_cache
+
+
+_ENV_PATH_PATTERN = re.compile(r"^/World/env_(\d+)(?:/|$)")
+
+
+def get_path_env_id(prim_path: str) -> Optional[int]:
+    """Get the environment ID a prim path belongs to.
+
+    Args:
+        prim_path: Prim path string (e.g., "/World/env_3/locations/home")
+
+    Returns:
+        Environment ID, or None if the path is outside any environment
+    """
+    match = _ENV_PATH_PATTERN.match(prim_path)
+    return int(match.group(1)) if match else None
+
+
+class PrimNameIndex:
+    """Index from prim name to prim paths, scoped by environment.
+
+    The index is built with one Usd.PrimRange walk on first lookup. Resynced
+    subtrees reported by Usd.Notice.ObjectsChanged are queued and re-indexed
+    on the next lookup, so bursts of stage edits (e.g., environment
+    construction) cost nothing until the index is used again.
+
+    Lookups may come from the ZMQ thread while notices arrive on the
+    simulation thread, so all access goes through a lock.
+    """
+
+    def __init__(self, stage: Usd.Stage, root_path: str = "/World"):
+        """Initialize the index and register for stage change notices.
+
+        Args:
+            stage: USD stage to index
+            root_path: Root of the indexed subtree
+        """
+        self.stage = stage
+        self.root_path = root_path
+
+        self._lock = threading.Lock()
+        self._built = False
+        self._dirty_paths: set[str] = set()
+
+        self._names: dict[str, str] = {}  # path -> name
+        self._by_name: dict[tuple[Optional[int], str], set[str]] = {}  # (env_id, name) -> paths
+        self._by_env: dict[Optional[int], set[str]] = {}  # env_id -> paths
+
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+
+    def _on_objects_changed(self, notice, sender):
+        """Queue resynced subtrees for re-indexing."""
+        if not self._built:
+            return
+
+        with self._lock:
+            for changed_path in notice.GetResyncedPaths():
+                path = changed_path.GetPrimPath().pathString
+                if _has_path_prefix(self.root_path, path):
+                    # The whole indexed subtree changed
+                    self._built = False
+                    self._dirty_paths.clear()
+                    return
+                if _has_path_prefix(path, self.root_path):
+                    self._dirty_paths.add(path)
+
+    def _add(self, prim: Usd.Prim):
+        path = prim.GetPath().pathString
+        name = prim.GetName()
+        env_id = get_path_env_id(path)
+        self._names[path] = name
+        self._by_name.setdefault((env_id, name), set()).add(path)
+        self._by_env.setdefault(env_id, set()).add(path)
+
+    def _remove_subtree(self, prefix: str):
+        # Only the environment the prefix belongs to can hold paths below it
+        env_id = get_path_env_id(prefix)
+        candidates = self._by_env.get(env_id, set())
+        if env_id is None:
+            candidates = [path for paths in self._by_env.values() for path in paths]
+
+        for path in [path for path in candidates if _has_path_prefix(path, prefix)]:
+            name = self._names.pop(path)
+            path_env_id = get_path_env_id(path)
+            self._by_name[(path_env_id, name)].discard(path)
+            if not self._by_name[(path_env_id, name)]:
+                del self._by_name[(path_env_id, name)]
+            self._by_env[path_env_id].discard(path)
+
+    def _index_subtree(self, path: str):
+        prim = self.stage.GetPrimAtPath(path)
+        if prim:
+            for descendant in Usd.PrimRange(prim):
+                self._add(descendant)
+
+    def _refresh(self):
+        """Build the index or re-index queued subtrees. Caller holds the lock."""
+        if not self._built:
+            self._names.clear()
+            self._by_name.clear()
+            self._by_env.clear()
+            self._dirty_paths.clear()
+            self._index_subtree(self.root_path)
+            self._built = True
+            return
+
+        if self._dirty_paths:
+            # Skip paths already covered by a dirty ancestor
+            dirty = sorted(self._dirty_paths)
+            self._dirty_paths.clear()
+            roots = []
+            for path in dirty:
+                if not roots or not _has_path_prefix(path, roots[-1]):
+                    roots.append(path)
+            for path in roots:
+                self._remove_subtree(path)
+                self._index_subtree(path)
+
+    def find(self, name: str, env_id: Optional[int] = None, root_path: str = None) -> list[str]:
+        """Find all prims with a given name.
+
+        Args:
+            name: Prim name (last path element)
+            env_id: Only return prims in this environment (optional)
+            root_path: Only return prims at or below this path (optional)
+
+        Returns:
+            Matching prim paths, shallowest first
+        """
+        if root_path is not None and env_id is None:
+            env_id = get_path_env_id(root_path)
+
+        with self._lock:
+            self._refresh()
+            if env_id is not None:
+                paths = list(self._by_name.get((env_id, name), ()))
+            else:
+                paths = [
+                    path
+                    for (_, indexed_name), indexed_paths in self._by_name.items()
+                    if indexed_name == name
+                    for path in indexed_paths
+                ]
+
+        if root_path is not None:
+            paths = [path for path in paths if _has_path_prefix(path, root_path)]
+        return sorted(paths, key=lambda path: (path.count("/"), path))
+
+    def find_first(self, name: str, env_id: Optional[int] = None, root_path: str = None) -> Optional[str]:
+        """Find the shallowest prim with a given name.
+
+        Args:
+            name: Prim name (last path element)
+            env_id: Only consider prims in this environment (optional)
+            root_path: Only consider prims at or below this path (optional)
+
+        Returns:
+            Prim path, or None if no prim has that name
+        """
+        paths = self.find(name, env_id, root_path)
+        return paths[0] if paths else None
+
+    def get_env_prims(self, env_id: int) -> list[str]:
+        """Get the paths of all prims in an environment.
+
+        Args:
+            env_id: Environment ID
+
+        Returns:
+            Sorted prim paths
+        """
+        with self._lock:
+            self._refresh()
+            return sorted(self._by_env.get(env_id, ()))
+
+    def resolve(self, name_or_path: str, env_id: Optional[int] = None) -> Optional[str]:
+        """Resolve a prim path or a bare prim name to a prim path.
+
+        Args:
+            name_or_path: Absolute prim path, or a prim name to look up
+            env_id: Environment to look names up in (optional)
+
+        Returns:
+            Prim path, or None if no such prim exists
+        """
+        if name_or_path.startswith("/"):
+            return name_or_path if self.stage.GetPrimAtPath(name_or_path) else None
+        return self.find_first(name_or_path, env_id)
+
+    def revoke(self):
+        """Stop listening for stage change notices."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+
+_prim_name_index: Optional[PrimNameIndex] = None
+
+
+def get_prim_name_index() -> PrimNameIndex:
+    """Get the prim name index for the current stage.
+
+    The index is recreated if the current stage has changed since
+    the last call.
+
+    Returns:
+        PrimNameIndex bound to the current stage
+    """
+    global _prim_name_index
+    stage = get_current_stage()
+    if _prim_name_index is None or _prim_name_index.stage != stage:
+        if _prim_name_index is not None:
+            _prim_name_index.revoke()
+        _prim_name_index = PrimNameIndex(stage)
+    return _prim_name_index
+
+
+def _affects_transforms(path) -> bool:
+    """Check whether a changed path can move prims (a prim or a transform attribute)."""
+    return not path.IsPropertyPath() or UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(path.name)
+
+
+class FrameXformCache:
+    """Per-frame cache of prim world transforms.
+
+    Wraps a UsdGeom.XformCache so ancestor transforms are computed once per
+    frame and shared by every world-pose query (goto_prim, raycasts,
+    end-effector and base poses across all environments). Call
+    advance_frame() once per simulation frame; a stage change notice that
+    resyncs a prim or authors a transform attribute (xformOp:*,
+    xformOpOrder) also clears the cache so poses authored mid-frame are
+    never stale. Other attribute edits leave it intact.
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        """Initialize the cache and register for stage change notices.
+
+        Args:
+            stage: USD stage to cache transforms for
+        """
+        self.stage = stage
+        self._lock = threading.Lock()
+        self._xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+        self._poses: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+
+    def _on_objects_changed(self, notice, sender):
+        """Clear the cache if the notice can move any prim."""
+        if not self._poses:
+            return
+
+        changed_paths = [*notice.GetResyncedPaths(), *notice.GetChangedInfoOnlyPaths()]
+        if any(_affects_transforms(path) for path in changed_paths):
+            self.clear()
+
+    def advance_frame(self):
+        """Drop all cached transforms at the start of a new frame."""
+        self.clear()
+
+    def clear(self):
+        """Drop all cached transforms."""
+        with self._lock:
+            if self._poses:
+                self._poses.clear()
+            self._xform_cache.Clear()
+
+    def _get_world_pose(self, prim: Usd.Prim) -> tuple[np.ndarray, np.ndarray]:
+        """Get a cached world pose. Caller holds the lock."""
+        path = prim.GetPath().pathString
+        pose = self._poses.get(path)
+        if pose is None:
+            world_transform = self._xform_cache.GetLocalToWorldTransform(prim)
+            position = np.array(world_transform.ExtractTranslation())
+
+            # Remove scale so the rotation is orthonormal before extracting it
+            quat = world_transform.RemoveScaleShear().ExtractRotationQuat()
+            orientation = np.array([quat.GetReal(), *quat.GetImaginary()])
+
+            pose = (position, orientation)
+            self._poses[path] = pose
+        return pose
+
+    def get_world_pose(self, prim: Usd.Prim) -> tuple[np.ndarray, np.ndarray]:
+        """Get the world pose of a prim.
+
+        Args:
+            prim: USD prim
+
+        Returns:
+            Tuple of (position [x, y, z], orientation [w, x, y, z])
+        """
+        with self._lock:
+            position, orientation = self._get_world_pose(prim)
+        return position.copy(), orientation.copy()
+
+    def get_world_transform(self, prim: Usd.Prim) -> np.ndarray:
+        """Get the local-to-world matrix of a prim, including scale.
+
+        Args:
+            prim: USD prim
+
+        Returns:
+            (4, 4) matrix in USD's row-vector convention
+        """
+        with self._lock:
+            return np.array(self._xform_cache.GetLocalToWorldTransform(prim))
+
+    def get_world_poses(self, prims: list) -> tuple[np.ndarray, np.ndarray]:
+        """Get the world poses of many prims at once.
+
+        Args:
+            prims: USD prims or prim path strings
+
+        Returns:
+            Tuple of (positions (N, 3), orientations (N, 4) as [w, x, y, z])
+        """
+        positions = np.empty((len(prims), 3))
+        orientations = np.empty((len(prims), 4))
+
+        with self._lock:
+            for i, prim in enumerate(prims):
+                if isinstance(prim, str):
+                    prim = self.stage.GetPrimAtPath(prim)
+                positions[i], orientations[i] = self._get_world_pose(prim)
+
+        return positions, orientations
+
+    def revoke(self):
+        """Stop listening for stage change notices."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+
+_xform_cache: Optional[FrameXformCache] = None
+
+
+def get_xform_cache() -> FrameXformCache:
+    """Get the per-frame transform cache for the current stage.
+
+    The cache is recreated if the current stage has changed since
+    the last call.
+
+    Returns:
+        FrameXformCache bound to the current stage
+    """
+    global _xform_cache
+    stage = get_current_stage()
+    if _xform_cache is None or _xform_cache.stage != stage:
+        if _xform_cache is not None:
+            _xform_cache.revoke()
+        _xform_cache = FrameXformCache(stage)
+    return _xform_cache
@@ -1,17 +1,13 @@
 from typing import Optional
 
 import numpy as np
-import omni.usd
 from pxr import UsdGeom, UsdPhysics, Gf, Usd
 
 from isaacsim.core.api.robots import Robot
 from isaacsim.core.prims import SingleXFormPrim
-from isaacsim.core.utils.transformations import (
-    get_relative_transform,
-    get_world_pose_from_relative,
-    pose_from_tf_matrix,
-    tf_matrix_from_pose,
-)
+
+from slcore.common import pose_math
+from slcore.common.stage_cache import get_prim_name_index, get_xform_cache
 
 
 # =============================================================================
@@ -19,25 +15,31 @@ from isaacsim.core.utils.transformations import (
 # =============================================================================
 
 def get_xform_world_pose(prim):
-    """Get world pose of an Xform prim using USD operations"""
-    xformable = UsdGeom.Xformable(prim)
-    time = Usd.TimeCode.Default()
-    world_transform = xformable.ComputeLocalToWorldTransform(time)
+    """Get world pose of an Xform prim using USD operations.
+
+    Transforms are served from the shared per-frame XformCache.
+    """
+    return get_xform_cache().get_world_pose(prim)
+
 
-    # Convert Gf.Matrix4d to numpy array
-    transform_np = np.array(world_transform).T  # Transpose for correct layout
+def get_xform_world_poses(prims) -> tuple[np.ndarray, np.ndarray]:
+    """Get world poses of many Xform prims at once.
 
-    # Extract position and orientation
-    position, orientation = pose_from_tf_matrix(transform_np)
-    return position, orientation
+    Args:
+        prims: USD prim objects or prim path strings
+
+    Returns:
+        Tuple of (positions (N, 3), orientations (N, 4) as [w, x, y, z])
+    """
+    return get_xform_cache().get_world_poses(prims)
 
 
 def set_xform_world_pose(prim, position, orientation):
     """Set world pose of an Xform prim using USD operations"""
     # Convert pose to transform matrix
-    transform_matrix = tf_matrix_from_pose(position, orientation)
+    transform_matrix = pose_math.poses_to_matrices(pose_math.make_poses(position, orientation))
 
-    # Convert to Gf.Matrix4d
+    # Convert to Gf.Matrix4d (row-vector convention)
     gf_matrix = Gf.Matrix4d(*transform_matrix.T.flatten().tolist())
 
     # Set the transform
@@ -57,16 +59,16 @@ def get_relative_pose(prim, relative_to_prim) -> tuple[np.ndarray, np.ndarray]:
     Returns:
         Tuple of (position, orientation) of source relative to target
     """
-    # Get relative transform matrix using Isaac Sim's existing function
-    transform_matrix = get_relative_transform(prim, relative_to_prim)
-
-    # Extract pose from transform matrix
-    return pose_from_tf_matrix(transform_matrix)
+    positions, orientations = get_xform_world_poses([relative_to_prim, prim])
+    world_poses = pose_math.make_poses(positions, orientations)
+    return pose_math.split_poses(pose_math.relative_poses(world_poses[0], world_poses[1]))
 
 
 def world_to_local_coords(relative_to_prim, world_position: np.ndarray, world_orientation: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
     """Convert world coordinates to local coordinates relative to a reference prim.
 
+    Accepts single poses or stacked (N, 3) positions and (N, 4) orientations.
+
     Args:
         relative_to_prim: USD prim object for reference frame
         world_position: [x, y, z] position in world frame
@@ -75,27 +77,16 @@ def world_to_local_coords(relative_to_prim, world_position: np.ndarray, world_or
     Returns:
         Tuple of (local_position, local_orientation) relative to the reference prim
     """
-    if world_orientation is None:
-        world_orientation = np.array([1.0, 0.0, 0.0, 0.0])  # Identity quaternion
-
-    # Get world-to-local transform matrix
-    stage = omni.usd.get_context().get_stage()
-    world_prim = stage.GetPseudoRoot()  # World root
-    world_to_local_transform = get_relative_transform(world_prim, relative_to_prim)
-
-    # Convert world pose to transform matrix
-    world_to_world_transform = tf_matrix_from_pose(world_position, world_orientation)
-
-    # Chain the transformations: world pose -> local frame
-    world_to_local_pose_transform = world_to_local_transform @ world_to_world_transform
-
-    # Extract local pose
-    return pose_from_tf_matrix(world_to_local_pose_transform)
+    frame = pose_math.make_poses(*get_xform_world_pose(relative_to_prim))
+    world_poses = pose_math.make_poses(world_position, world_orientation)
+    return pose_math.split_poses(pose_math.relative_poses(frame, world_poses))
 
 
 def local_to_world_coords(relative_to_prim, local_position: np.ndarray, local_orientation: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
     """Convert local coordinates to world coordinates.
 
+    Accepts single poses or stacked (N, 3) positions and (N, 4) orientations.
+
     Args:
         relative_to_prim: USD prim object whose frame defines local coords
         local_position: [x, y, z] position in local frame
@@ -104,38 +95,31 @@ def local_to_world_coords(relative_to_prim, local_position: np.ndarray, local_or
     Returns:
         Tuple of (world_position, world_orientation) in world frame
     """
-    if local_orientation is None:
-        local_orientation = np.array([1.0, 0.0, 0.0, 0.0])  # Identity quaternion
-
-    # Use Isaac Sim's existing function
-    return get_world_pose_from_relative(relative_to_prim, local_position, local_orientation)
+    frame = pose_math.make_poses(*get_xform_world_pose(relative_to_prim))
+    local_poses = pose_math.make_poses(local_position, local_orientation)
+    return pose_math.split_poses(pose_math.compose_poses(frame, local_poses))
 
 
 # =============================================================================
 # Prim Manipulation Utilities
 # =============================================================================
 
-def find_prim_by_name(name: str, search_root_prim: str = "/World") -> Optional[str]:
+def find_prim_by_name(name: str, search_root_prim="/World") -> Optional[str]:
     """Find a prim by name within search root.
 
+    Uses the stage-wide prim name index instead of walking the subtree.
+
     Args:
         name: Name to search for
-        search_root: Root path to search within
+        search_root_prim: Root prim or prim path to search within
 
     Returns:
         Full prim path if found, None otherwise
     """
-    def _recursive_search(prim):
-        if prim.GetName() == name:
-            return str(prim.GetPath())
-
-        for child in prim.GetChildren():
-            result = _recursive_search(child)
-            if result:
-                return result
-        return None
+    if isinstance(search_root_prim, Usd.Prim):
+        search_root_prim = search_root_prim.GetPath().pathString
 
-    return _recursive_search(search_root_prim)
+    return get_prim_name_index().find_first(name, root_path=search_root_prim)
 
 
 def get_prim_bounds(prim) -> tuple[np.ndarray, np.ndarray]:
@@ -7,6 +7,14 @@ robots and algorithms. Key components:
 - MotionApproach: Abstract base class for motion algorithms
 - MotionDispatcher: Routes commands to appropriate approaches
 - MotionConfig: Configuration loading from YAML
+- IKCache: Solution cache shared by robots of the same model
+- LocationJointTable: Joint positions precomputed for named locations
+- IKBatchQueue: IK requests of all robots of a model, solved once per frame
+- TrajectoryGenerator: Time-optimal trapezoid / S-curve joint trajectories
+- CollisionChecker / BoxProxies: Pre-execution collision checks against stage proxies
+- LocationRoadmap: Collision-free paths between named locations, cached on disk
+- slcore.motion.benchmark: IK latency, convergence and success-rate benchmark
+  (python -m slcore.motion.benchmark)
 
 Example usage:
     from slcore.motion import MotionDispatcher, MotionConfig
@@ -29,13 +37,28 @@ Example usage:
 
 from slcore.motion.base import (
     CapabilityError,
+    CollisionError,
     IKError,
     MotionApproach,
     MotionResult,
+    PlanningError,
 )
 from slcore.motion.capabilities import MotionCapability
-from slcore.motion.config import ApproachConfig, ExecutionConfig, MotionConfig
+from slcore.motion.collision import BoxProxies, CollisionChecker, collect_obstacle_prims
+from slcore.motion.config import (
+    ApproachConfig,
+    ExecutionConfig,
+    IKCacheConfig,
+    MotionConfig,
+    RoadmapConfig,
+    TrajectoryConfig,
+)
 from slcore.motion.dispatcher import MotionDispatcher
+from slcore.motion.ik_batch import IKBatchQueue, IKRequest, flush_ik_batch_queues, get_ik_batch_queue
+from slcore.motion.ik_cache import IKCache, get_ik_cache
+from slcore.motion.location_table import LocationJointTable, get_location_joint_table
+from slcore.motion.roadmap import LocationRoadmap, get_location_roadmap, layout_hash
+from slcore.motion.trajectory import JointTrajectory, TrajectoryGenerator
 
 __all__ = [
     # Capabilities
@@ -45,11 +68,38 @@ __all__ = [
     "MotionResult",
     # Exceptions
     "CapabilityError",
+    "CollisionError",
     "IKError",
+    "PlanningError",
     # Config
     "MotionConfig",
     "ApproachConfig",
     "ExecutionConfig",
+    "IKCacheConfig",
+    "TrajectoryConfig",
+    "RoadmapConfig",
     # Dispatcher
     "MotionDispatcher",
+    # IK cache
+    "IKCache",
+    "get_ik_cache",
+    # IK batching
+    "IKBatchQueue",
+    "IKRequest",
+    "get_ik_batch_queue",
+    "flush_ik_batch_queues",
+    # Location table
+    "LocationJointTable",
+    "get_location_joint_table",
+    # Location roadmap
+    "LocationRoadmap",
+    "get_location_roadmap",
+    "layout_hash",
+    # Collision proxies
+    "BoxProxies",
+    "CollisionChecker",
+    "collect_obstacle_prims",
+    # Trajectories
+    "JointTrajectory",
+    "TrajectoryGenerator",
 ]
@@ -4,11 +4,20 @@ This package contains concrete implementations of MotionApproach for
 different motion planning algorithms.
 
 Available approaches:
-- DifferentialIKApproach: Wraps Isaac Lab's DifferentialIKController
+- DifferentialIKApproach: Differential IK (Isaac Lab controller or iterative NumPy solver)
+- AnalyticalIKApproach: Closed-form IK for SCARA arms on a vertical lift (PF400)
+- BatchedDifferentialIKApproach: Differential IK for all robots of a model from one shared view
+- SamplingPlannerApproach: Collision-free joint paths (RRT-Connect) around stage proxies
 """
 
+from slcore.motion.approaches.analytical_ik import AnalyticalIKApproach
+from slcore.motion.approaches.batched_differential_ik import BatchedDifferentialIKApproach
 from slcore.motion.approaches.differential_ik import DifferentialIKApproach
+from slcore.motion.approaches.sampling_planner import SamplingPlannerApproach
 
 __all__ = [
+    "AnalyticalIKApproach",
+    "BatchedDifferentialIKApproach",
     "DifferentialIKApproach",
+    "SamplingPlannerApproach",
 ]
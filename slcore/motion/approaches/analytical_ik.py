@@ -0,0 +1,175 @@
+"""Closed-form analytical IK motion approach.
+
+Solves SCARA arms on a vertical lift (e.g., the PF400) with ScaraKinematics:
+no Jacobian iteration, no simulator state beyond the current joint vector,
+and no local minima. Every valid elbow configuration is returned, ranked by
+the request's solution preference. This approach only provides IK
+capability.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.motion.base import IKError, MotionApproach, MotionResult
+from slcore.motion.capabilities import MotionCapability
+from slcore.motion.kinematics import ScaraKinematics
+
+if TYPE_CHECKING:
+    from slcore.robots.common.config import AnalyticalIKConfig
+
+
+class AnalyticalIKApproach(MotionApproach):
+    """Motion approach using closed-form SCARA inverse kinematics.
+
+    Attributes:
+        kinematics: ScaraKinematics model of the arm
+        config: Analytical IK configuration
+    """
+
+    def __init__(
+        self,
+        config: AnalyticalIKConfig,
+        get_joint_positions: Callable[[], np.ndarray],
+    ):
+        """Initialize the analytical IK approach.
+
+        Args:
+            config: Analytical IK configuration from YAML
+            get_joint_positions: Returns the current full joint vector
+                (reference for "closest_to_current")
+        """
+        self.config = config
+        self.kinematics = ScaraKinematics(config)
+        self._get_joint_positions = get_joint_positions
+
+        # Robot base pose in world frame (updated before each IK solve)
+        self.robot_base_pose = pose_math.IDENTITY_POSE.copy()
+
+    def capabilities(self) -> MotionCapability:
+        """Return capabilities: IK only.
+
+        Returns:
+            MotionCapability.IK
+        """
+        return MotionCapability.IK
+
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Update the robot base pose for IK calculations.
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        self.robot_base_pose = pose_math.make_poses(position, orientation)
+
+    def _get_reference(self, solution_preference: str) -> np.ndarray:
+        if solution_preference == "closest_to_home":
+            return np.array(self.config.home_pose, dtype=float)
+        return np.array(self._get_joint_positions(), dtype=float)
+
+    def solve(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        solution_preference: str = "closest_to_current",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute all elbow configurations for world-frame targets.
+
+        Args:
+            target_positions: (..., 3) target positions in world frame (meters)
+            target_orientations: (..., 4) target quaternions [w, x, y, z]
+            solution_preference: Ranking reference:
+                - "closest_to_current": Least movement from the current joints
+                - "closest_to_home": Closest to the configured home pose
+
+        Returns:
+            Tuple of ((..., 2, num_joints) solutions best first, (..., 2) validity flags)
+        """
+        targets_w = pose_math.make_poses(target_positions, target_orientations)
+        targets_b = pose_math.relative_poses(self.robot_base_pose, targets_w)
+        return self.kinematics.inverse_kinematics(targets_b, self._get_reference(solution_preference))
+
+    def compute_motion(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        **kwargs,
+    ) -> MotionResult:
+        """Compute joint positions to achieve target pose.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame (meters)
+            target_orientation: Target orientation quaternion [w, x, y, z]
+            solution_preference: "closest_to_current" or "closest_to_home"
+            **kwargs: Ignored (for interface compatibility)
+
+        Returns:
+            MotionResult with the best solution in joint_positions and the
+            other valid elbow configurations in alternatives
+
+        Raises:
+            IKError: If no elbow configuration reaches the target within limits
+        """
+        return self.compute_motion_batch(
+            np.asarray(target_position)[None],
+            np.asarray(target_orientation)[None],
+            solution_preference=solution_preference,
+            raise_on_failure=True,
+        )[0]
+
+    def compute_motion_batch(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        raise_on_failure: bool = False,
+        **kwargs,
+    ) -> list[MotionResult]:
+        """Compute joint positions for many target poses in one vectorized call.
+
+        Args:
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target orientation quaternions [w, x, y, z]
+            solution_preference: "closest_to_current" or "closest_to_home"
+            raise_on_failure: If True, raise IKError for the first unreachable
+                target instead of returning an unsuccessful result
+            **kwargs: Ignored (for interface compatibility)
+
+        Returns:
+            One MotionResult per target, in input order
+
+        Raises:
+            IKError: If raise_on_failure is set and a target is unreachable
+        """
+        target_positions = np.asarray(target_positions, dtype=float)
+        target_orientations = np.asarray(target_orientations, dtype=float)
+        solutions, valid = self.solve(target_positions, target_orientations, solution_preference)
+
+        results = []
+        for i in range(len(solutions)):
+            candidates = solutions[i][valid[i]]
+            if len(candidates):
+                results.append(MotionResult(
+                    success=True,
+                    joint_positions=candidates[0],
+                    alternatives=list(candidates[1:]),
+                ))
+                continue
+
+            message = (
+                f"Analytical IK found no reachable elbow configuration for "
+                f"position={target_positions[i].tolist()}, orientation={target_orientations[i].tolist()}"
+            )
+            if raise_on_failure:
+                raise IKError(target_positions[i], target_orientations[i], message=message)
+            results.append(MotionResult(success=False, error_message=message))
+        return results
+
+    def reset(self):
+        """Reset approach state (the approach is stateless)."""
+        pass
@@ -0,0 +1,147 @@
+"""Batched differential IK motion approach.
+
+Wraps a BatchedDifferentialIKSolver shared by all robots of a model. An
+instance bound to one robot (prim_path) solves for that robot only; an
+unbound instance, registered on the dispatcher of an IKBatchQueue, solves
+requests from many robots in one call, with the robot of each target given
+by the rows keyword.
+
+This approach only provides IK capability.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from slcore.motion.base import IKError, MotionApproach, MotionResult
+from slcore.motion.capabilities import MotionCapability
+
+if TYPE_CHECKING:
+    from slcore.robots.common.batched_ik_solver import BatchedDifferentialIKSolver
+
+
+class BatchedDifferentialIKApproach(MotionApproach):
+    """Motion approach using one differential IK step over a shared view.
+
+    Attributes:
+        solver: The shared BatchedDifferentialIKSolver
+        prim_path: Robot solved for when no rows are given, or None
+    """
+
+    def __init__(self, solver: BatchedDifferentialIKSolver, prim_path: str = None):
+        """Initialize the batched differential IK approach.
+
+        Args:
+            solver: Solver shared by all robots of the model
+            prim_path: Articulation root prim path of the robot this instance
+                solves for, or None to require rows on every call
+        """
+        self.solver = solver
+        self.prim_path = prim_path
+
+    def capabilities(self) -> MotionCapability:
+        """Return capabilities: IK only.
+
+        Returns:
+            MotionCapability.IK
+        """
+        return MotionCapability.IK
+
+    def compute_motion(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        **kwargs,
+    ) -> MotionResult:
+        """Compute joint positions to achieve target pose.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame (meters)
+            target_orientation: Target orientation quaternion [w, x, y, z]
+            solution_preference: "closest_to_current" or "closest_to_home"
+            **kwargs: rows (see compute_motion_batch); others ignored
+
+        Returns:
+            MotionResult with computed joint positions
+
+        Raises:
+            IKError: If the step produced an invalid solution
+        """
+        result = self.compute_motion_batch(
+            np.asarray(target_position)[None],
+            np.asarray(target_orientation)[None],
+            solution_preference=solution_preference,
+            **kwargs,
+        )[0]
+        if not result.success:
+            raise IKError(target_position, target_orientation, message=result.error_message)
+        return result
+
+    def compute_motion_batch(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        rows: np.ndarray = None,
+        **kwargs,
+    ) -> list[MotionResult]:
+        """Compute joint positions for many target poses in one solver call.
+
+        Args:
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target orientation quaternions [w, x, y, z]
+            solution_preference: "closest_to_current" or "closest_to_home"
+            rows: (N,) shared view row of the robot for each target (default:
+                this instance's robot)
+            **kwargs: Ignored (for interface compatibility)
+
+        Returns:
+            One MotionResult per target, in input order
+
+        Raises:
+            ValueError: If no rows are given and the instance is not bound to a robot
+        """
+        target_positions = np.asarray(target_positions, dtype=float)
+        target_orientations = np.asarray(target_orientations, dtype=float)
+        if rows is None:
+            if self.prim_path is None:
+                raise ValueError("BatchedDifferentialIKApproach needs rows when not bound to a robot")
+            rows = np.full(len(target_positions), self.solver.row_of(self.prim_path))
+
+        joint_positions, success = self.solver.solve(
+            rows,
+            target_positions,
+            target_orientations,
+            solution_preference,
+        )
+
+        results = []
+        for i in range(len(joint_positions)):
+            if success[i]:
+                results.append(MotionResult(success=True, joint_positions=joint_positions[i], iterations=1))
+            else:
+                results.append(MotionResult(
+                    success=False,
+                    error_message=(
+                        f"Differential IK failed for position={target_positions[i].tolist()}, "
+                        f"orientation={target_orientations[i].tolist()} after 1 iterations"
+                    ),
+                    iterations=1,
+                ))
+        return results
+
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Accept the robot base pose (unused: targets and Jacobians are both in world frame).
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        pass
+
+    def reset(self):
+        """Reset approach state (the approach is stateless)."""
+        pass
@@ -1,13 +1,19 @@
 """Differential IK motion approach.
 
-Wraps the existing DifferentialIKSolver to provide the MotionApproach
-interface. This approach only provides IK capability (no trajectory
-generation or collision awareness).
+Wraps a differential IK solver to provide the MotionApproach interface.
+The solver is picked by DifferentialIKConfig.backend:
+
+- "isaaclab": DifferentialIKSolver, one step from the PhysX Jacobian (GPU)
+- "numpy": KinematicIKSolver, iterated to convergence against the URDF
+  kinematic chain (CPU, no simulator state needed)
+
+This approach only provides IK capability (no trajectory generation or
+collision awareness).
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 
@@ -15,19 +21,19 @@ from slcore.motion.base import IKError, MotionApproach, MotionResult
 from slcore.motion.capabilities import MotionCapability
 
 if TYPE_CHECKING:
+    from slcore.motion.kinematics import KinematicChain
     from slcore.robots.common.config import DifferentialIKConfig
-    from slcore.robots.common.differential_ik_solver import DifferentialIKSolver
     from slcore.robots.common.isaaclab_articulation import ArticulationViewWrapper
 
 
 class DifferentialIKApproach(MotionApproach):
-    """Motion approach using Isaac Lab's differential IK controller.
+    """Motion approach using differential IK.
 
     This approach provides only IK capability. It computes joint positions
-    to achieve a target end-effector pose using iterative differential IK.
+    to achieve a target end-effector pose using differential IK.
 
     Attributes:
-        solver: The underlying DifferentialIKSolver instance
+        solver: The underlying DifferentialIKSolver or KinematicIKSolver
     """
 
     def __init__(
@@ -35,25 +41,48 @@ class DifferentialIKApproach(MotionApproach):
         articulation: ArticulationViewWrapper,
         config: DifferentialIKConfig,
         joint_names: list[str],
-        device: str = "cuda:0",
+        device: str = None,
+        get_joint_positions: Callable[[], np.ndarray] = None,
+        chain: KinematicChain = None,
     ):
         """Initialize the differential IK approach.
 
         Args:
-            articulation: Isaac Lab Articulation instance
+            articulation: Isaac Lab Articulation instance (unused by the numpy backend)
             config: Differential IK configuration from YAML
             joint_names: List of joint names to control
-            device: Torch device for computations
+            device: Torch device for the isaaclab backend (default: config.device)
+            get_joint_positions: Returns the current joint vector in joint_names
+                order (required by the numpy backend)
+            chain: Kinematic chain for the numpy backend (default: loaded
+                from config.urdf_path)
+
+        Raises:
+            ValueError: If config.backend is unknown
         """
-        # Deferred import to avoid Isaac Sim dependency at module load time
-        from slcore.robots.common.differential_ik_solver import DifferentialIKSolver
-
-        self.solver = DifferentialIKSolver(
-            articulation=articulation,
-            config=config,
-            joint_names=joint_names,
-            device=device,
-        )
+        if config.backend == "isaaclab":
+            # Deferred import to avoid Isaac Sim dependency at module load time
+            from slcore.robots.common.differential_ik_solver import DifferentialIKSolver
+
+            self.solver = DifferentialIKSolver(
+                articulation=articulation,
+                config=config,
+                joint_names=joint_names,
+                device=device or config.device,
+            )
+        elif config.backend == "numpy":
+            from slcore.robots.common.kinematic_ik_solver import KinematicIKSolver
+
+            if get_joint_positions is None:
+                raise ValueError("The numpy IK backend requires get_joint_positions")
+            self.solver = KinematicIKSolver(
+                config=config,
+                joint_names=joint_names,
+                get_joint_positions=get_joint_positions,
+                chain=chain,
+            )
+        else:
+            raise ValueError(f"Unknown differential IK backend '{config.backend}', expected 'isaaclab' or 'numpy'")
         self.config = config
 
     def capabilities(self) -> MotionCapability:
@@ -87,7 +116,7 @@ class DifferentialIKApproach(MotionApproach):
         Raises:
             IKError: If IK fails to find a solution
         """
-        joint_positions, success = self.solver.compute_inverse_kinematics(
+        joint_positions, success, iterations = self.solver.compute_inverse_kinematics(
             target_position=target_position,
             target_orientation=target_orientation,
             solution_preference=solution_preference,
@@ -99,15 +128,73 @@ class DifferentialIKApproach(MotionApproach):
                 target_orientation=target_orientation,
                 message=(
                     f"Differential IK failed for position={target_position.tolist()}, "
-                    f"orientation={target_orientation.tolist()}"
+                    f"orientation={target_orientation.tolist()} after {iterations} iterations"
                 ),
+                iterations=iterations,
             )
 
         return MotionResult(
             success=True,
             joint_positions=joint_positions,
+            iterations=iterations,
+        )
+
+    def compute_motion_batch(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        **kwargs,
+    ) -> list[MotionResult]:
+        """Compute joint positions for many target poses.
+
+        The numpy backend solves all targets in one vectorized call; the
+        isaaclab backend falls back to one solve per target.
+
+        Args:
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target orientation quaternions [w, x, y, z]
+            solution_preference: IK solution preference (seed choice)
+            **kwargs: Ignored (for interface compatibility)
+
+        Returns:
+            One MotionResult per target; unconverged targets have success=False
+        """
+        if self.config.backend != "numpy":
+            return super().compute_motion_batch(
+                target_positions,
+                target_orientations,
+                solution_preference=solution_preference,
+                **kwargs,
+            )
+
+        joint_positions, solution = self.solver.solve(
+            target_positions,
+            target_orientations,
+            self.solver.get_seeds(solution_preference),
         )
 
+        results = []
+        for i in range(len(joint_positions)):
+            if solution.converged[i]:
+                results.append(MotionResult(
+                    success=True,
+                    joint_positions=joint_positions[i],
+                    iterations=int(solution.iterations[i]),
+                ))
+            else:
+                results.append(MotionResult(
+                    success=False,
+                    error_message=(
+                        f"Differential IK did not converge for position={np.asarray(target_positions[i]).tolist()} "
+                        f"after {solution.iterations[i]} iterations "
+                        f"(position error {solution.position_error[i]:.4f} m, "
+                        f"orientation error {solution.orientation_error[i]:.4f} rad)"
+                    ),
+                    iterations=int(solution.iterations[i]),
+                ))
+        return results
+
     def reset(self):
         """Reset the controller state."""
         self.solver.reset()
@@ -0,0 +1,188 @@
+"""Collision-aware sampling-based motion approach.
+
+Solves IK with a wrapped IK approach, then plans a joint-space path from
+the current configuration to the solution with RRT-Connect and
+shortcutting, checking every edge against box proxies of the environment
+(see slcore.motion.collision). The path is time-parameterized with a
+TrajectoryGenerator so it is executed segment by segment along the
+checked straight edges.
+
+Obstacles touched by the robot at the start or goal configuration (e.g.,
+the nest a plate is picked from) are not checked for that motion, since
+every path would start or end in contact with them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+
+from slcore.motion.base import MotionApproach, MotionResult, PlanningError
+from slcore.motion.capabilities import MotionCapability
+from slcore.motion.collision import BoxProxies, CollisionChecker
+from slcore.motion.planning import rrt_connect, sampling_bounds, shortcut_path
+from slcore.motion.trajectory import TrajectoryGenerator
+
+if TYPE_CHECKING:
+    from slcore.motion.config import TrajectoryConfig
+    from slcore.robots.common.config import SamplingPlannerConfig
+
+
+class SamplingPlannerApproach(MotionApproach):
+    """Motion approach planning collision-free joint paths with RRT-Connect.
+
+    Attributes:
+        ik_approach: Approach providing goal configurations
+        checker: Collision checker holding the obstacle proxies
+        config: Planner configuration
+        generator: Time-parameterizes planned paths
+    """
+
+    def __init__(
+        self,
+        ik_approach: MotionApproach,
+        checker: CollisionChecker,
+        config: SamplingPlannerConfig,
+        joint_limits: dict[int, tuple[float, float]],
+        get_joint_positions: Callable[[], np.ndarray],
+        trajectory_config: TrajectoryConfig = None,
+    ):
+        """Initialize the sampling planner approach.
+
+        Args:
+            ik_approach: IK approach for goal configurations (its alternatives
+                are tried in order if the best solution cannot be reached)
+            checker: Collision checker with the robot's link model
+            config: Planner configuration from YAML
+            joint_limits: {joint index: (lower, upper)} of the joints the
+                planner samples; other joints stay between their start and
+                goal values (infinite limits span one turn around start and goal)
+            get_joint_positions: Returns the current full joint vector
+                (start when none is given)
+            trajectory_config: Limits for time-parameterizing planned paths
+        """
+        self.ik_approach = ik_approach
+        self.checker = checker
+        self.config = config
+        self.joint_limits = dict(joint_limits)
+        self.generator = TrajectoryGenerator(trajectory_config)
+        self._get_joint_positions = get_joint_positions
+        self._rng = np.random.default_rng(config.seed)
+
+    def capabilities(self) -> MotionCapability:
+        """Return capabilities: IK, collision awareness and the generator's trajectory limits.
+
+        Returns:
+            MotionCapability flags
+        """
+        return MotionCapability.IK | MotionCapability.COLLISION_AWARE | self.generator.capabilities()
+
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Update the robot base pose for IK and collision checking.
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        if hasattr(self.ik_approach, "set_robot_base_pose"):
+            self.ik_approach.set_robot_base_pose(position, orientation)
+        self.checker.set_robot_base_pose(position, orientation)
+
+    def set_obstacles(self, obstacles: BoxProxies):
+        """Replace the obstacle proxies (e.g., after labware moved).
+
+        Args:
+            obstacles: Obstacle boxes in world frame
+        """
+        self.checker.set_obstacles(obstacles)
+
+    def plan(self, start: np.ndarray, goal: np.ndarray) -> Optional[np.ndarray]:
+        """Plan a collision-free joint path.
+
+        Args:
+            start: (num_joints,) start configuration
+            goal: (num_joints,) goal configuration
+
+        Returns:
+            (W, num_joints) waypoints from start to goal joined by
+            collision-free straight edges, or None if none was found
+        """
+        start = np.asarray(start, dtype=float)
+        goal = np.asarray(goal, dtype=float)
+        ignore = self.checker.colliding_obstacles(np.stack([start, goal])).any(axis=0)
+
+        def edges_in_collision(starts, goals):
+            return self.checker.edges_in_collision(starts, goals, ignore)
+
+        lower, upper = sampling_bounds(self.joint_limits, np.stack([start, goal]))
+        path = rrt_connect(
+            start,
+            goal,
+            lower,
+            upper,
+            edges_in_collision,
+            step_size=self.config.step_size,
+            max_iterations=self.config.max_iterations,
+            batch_size=self.config.batch_size,
+            rng=self._rng,
+        )
+        if path is None:
+            return None
+        return shortcut_path(path, edges_in_collision)
+
+    def compute_motion(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        solution_preference: str = "closest_to_current",
+        start_joint_positions: np.ndarray = None,
+        **kwargs,
+    ) -> MotionResult:
+        """Compute a collision-free trajectory to the target pose.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame (meters)
+            target_orientation: Target orientation quaternion [w, x, y, z]
+            solution_preference: Passed to the IK approach
+            start_joint_positions: Start configuration (default: current joints)
+            **kwargs: Ignored (for interface compatibility)
+
+        Returns:
+            MotionResult with the goal in joint_positions and the planned
+            path in trajectory
+
+        Raises:
+            IKError: If the IK approach finds no goal configuration
+            PlanningError: If no goal configuration can be reached without collision
+        """
+        ik_result = self.ik_approach.compute_motion(
+            target_position=target_position,
+            target_orientation=target_orientation,
+            solution_preference=solution_preference,
+        )
+        if start_joint_positions is None:
+            start_joint_positions = self._get_joint_positions()
+        start = np.asarray(start_joint_positions, dtype=float)
+
+        for goal in [ik_result.joint_positions, *ik_result.alternatives]:
+            path = self.plan(start, goal)
+            if path is not None:
+                return MotionResult(
+                    success=True,
+                    joint_positions=np.asarray(goal, dtype=float),
+                    trajectory=self.generator.generate_path(path),
+                )
+
+        raise PlanningError(
+            target_position,
+            target_orientation,
+            message=(
+                f"No collision-free path found to position={np.asarray(target_position).tolist()} "
+                f"after {self.config.max_iterations} iterations per goal configuration"
+            ),
+        )
+
+    def reset(self):
+        """Reset the wrapped IK approach."""
+        self.ik_approach.reset()
@@ -12,6 +12,7 @@ from typing import Optional
 import numpy as np
 
 from slcore.motion.capabilities import MotionCapability
+from slcore.motion.trajectory import JointTrajectory
 
 
 class CapabilityError(Exception):
@@ -43,7 +44,8 @@ class IKError(Exception):
     """Raised when inverse kinematics fails to find a solution.
 
     This error indicates that the IK solver could not find valid
-    joint positions to achieve the requested pose.
+    joint positions to achieve the requested pose. Iterative solvers
+    report the iterations spent before giving up in iterations.
     """
 
     def __init__(
@@ -51,9 +53,11 @@ class IKError(Exception):
         target_position: np.ndarray,
         target_orientation: np.ndarray,
         message: str = None,
+        iterations: int = None,
     ):
         self.target_position = target_position
         self.target_orientation = target_orientation
+        self.iterations = iterations
         if message is None:
             message = (
                 f"IK failed for position={target_position.tolist()}, "
@@ -62,6 +66,52 @@ class IKError(Exception):
         super().__init__(message)
 
 
+class PlanningError(Exception):
+    """Raised when a collision-free path to a valid goal cannot be found.
+
+    Unlike IKError, the goal configuration exists but every path to it
+    tried by the planner collides.
+    """
+
+    def __init__(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        message: str = None,
+    ):
+        self.target_position = target_position
+        self.target_orientation = target_orientation
+        if message is None:
+            message = (
+                f"No collision-free path found for position={target_position.tolist()}, "
+                f"orientation={target_orientation.tolist()}"
+            )
+        super().__init__(message)
+
+
+class CollisionError(Exception):
+    """Raised when a move is rejected because its path would collide.
+
+    The path is checked against collision proxies before any motion is
+    sent to the simulation.
+    """
+
+    def __init__(
+        self,
+        obstacles: list[str],
+        joint_positions: np.ndarray,
+        message: str = None,
+    ):
+        self.obstacles = obstacles
+        self.joint_positions = joint_positions
+        if message is None:
+            message = (
+                f"Move would collide with {obstacles} "
+                f"at joint_positions={np.asarray(joint_positions).tolist()}"
+            )
+        super().__init__(message)
+
+
 @dataclass
 class MotionResult:
     """Result of a motion computation.
@@ -72,19 +122,24 @@ class MotionResult:
     Attributes:
         success: True if motion was computed successfully
         joint_positions: Single joint configuration (for IK-only approaches)
-        trajectory: List of (time, joint_positions) waypoints (for trajectory approaches)
+        trajectory: Timed joint trajectory ending at joint_positions (for trajectory
+            approaches, or IK approaches paired with a trajectory generator)
         error_message: Description of failure if success is False
+        iterations: Solver iterations used (None if the approach is not iterative)
+        alternatives: Other valid joint configurations for the same target, best first
     """
 
     success: bool
     joint_positions: np.ndarray = None
-    trajectory: list[tuple[float, np.ndarray]] = field(default_factory=list)
+    trajectory: Optional[JointTrajectory] = None
     error_message: str = None
+    iterations: int = None
+    alternatives: list[np.ndarray] = field(default_factory=list)
 
     def __post_init__(self):
         """Validate that result contains appropriate data."""
         if self.success:
-            if self.joint_positions is None and not self.trajectory:
+            if self.joint_positions is None and self.trajectory is None:
                 raise ValueError(
                     "Successful MotionResult must have joint_positions or trajectory"
                 )
@@ -162,6 +217,39 @@ class MotionApproach(ABC):
         """
         pass
 
+    def compute_motion_batch(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        **kwargs,
+    ) -> list[MotionResult]:
+        """Compute motions to reach many target poses.
+
+        The default implementation calls compute_motion() once per target.
+        Approaches that can solve several targets in one pass override this.
+        A target that fails IK yields an unsuccessful MotionResult instead of
+        aborting the whole batch.
+
+        Args:
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target orientation quaternions [w, x, y, z]
+            **kwargs: Additional approach-specific parameters
+
+        Returns:
+            One MotionResult per target, in input order
+        """
+        results = []
+        for target_position, target_orientation in zip(target_positions, target_orientations):
+            try:
+                results.append(self.compute_motion(
+                    target_position=target_position,
+                    target_orientation=target_orientation,
+                    **kwargs,
+                ))
+            except IKError as e:
+                results.append(MotionResult(success=False, error_message=str(e)))
+        return results
+
     def has_capability(self, capability: MotionCapability) -> bool:
         """Check if this approach has a specific capability.
 
@@ -0,0 +1,636 @@
+"""Benchmark of motion approaches: IK latency, convergence and accuracy.
+
+Sweeps a reproducible set of target poses through every approach of a
+MotionDispatcher and reports, per approach, the success rate, solve latency
+percentiles, solver iterations, final pose error (from forward kinematics of
+the returned joints) and the per-target cost of one batched call.
+
+Targets are either sampled over the workspace (random joint configurations
+within the limits, mapped through forward kinematics, so every target is
+reachable) or read from a recorded workflow or pose file (every mapping
+with a 3-element "position" and a 4-element "orientation").
+
+create_stub_dispatcher() registers the approaches that run without Isaac
+Sim on the same SCARA model: analytical_ik, differential_ik (numpy backend
+on ScaraKinematics.to_chain()), batched_differential_ik (on a
+StubArticulationView whose Jacobians come from the same chain) and
+sampling_planner (without obstacles), so approaches can be compared and
+regressions caught on any machine. batched_differential_ik takes a single
+step per call, as in the simulator where it steps once per frame, so its
+success rate measures one step, not convergence. When it is benchmarked, the
+targets are also pushed through an IKBatchQueue spread over all stub robots
+and flushed once.
+
+Usage:
+python -m slcore.motion.benchmark --targets 500 --seed 0
+python -m slcore.motion.benchmark --analytical-config assets/robots/Brooks/PF400/isaacsim/analytical_ik_config.yaml
+python -m slcore.motion.benchmark --workflow recorded_poses.yaml --json results.json --min-success 0.95
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import yaml
+
+from slcore.common import pose_math
+from slcore.motion.approaches import (
+    AnalyticalIKApproach,
+    BatchedDifferentialIKApproach,
+    DifferentialIKApproach,
+    SamplingPlannerApproach,
+)
+from slcore.motion.base import CapabilityError, IKError, PlanningError
+from slcore.motion.collision import CollisionChecker
+from slcore.motion.config import ApproachConfig, MotionConfig
+from slcore.motion.dispatcher import MotionDispatcher
+from slcore.motion.ik_batch import IKBatchQueue
+from slcore.motion.kinematics import KinematicChain, ScaraKinematics
+from slcore.robots.common.batched_ik_solver import BatchedDifferentialIKSolver
+from slcore.robots.common.config import (
+    CUSTOM_ASSETS_ROOT_PATH,
+    SCARA_JOINTS,
+    AnalyticalIKConfig,
+    DifferentialIKConfig,
+    SamplingPlannerConfig,
+)
+
+PF400_CONFIG_DIR = CUSTOM_ASSETS_ROOT_PATH / "robots/Brooks/PF400/isaacsim"
+
+# Joint limits of the stub arm when no analytical_ik_config.yaml is available
+STUB_JOINT_LIMITS = {
+    "rail": [-0.5, 0.5],
+    "lift": [0.0, 0.4],
+    "shoulder": [-2.9, 2.9],
+    "elbow": [-2.9, 2.9],
+    "wrist": [-3.1, 3.1],
+}
+
+# Home (and start) joints of the stub arm: mid-lift with the elbow bent,
+# away from the fully stretched singular configuration at all zeros
+STUB_HOME_POSE = [0.0, 0.2, 0.0, 1.5, -1.5, 0.0, 0.0]
+
+# Approaches create_stub_dispatcher() registers
+STUB_APPROACHES = ("analytical_ik", "differential_ik", "batched_differential_ik", "sampling_planner")
+
+# Robots (rows) of the stub articulation view; batched_differential_ik is bound to the first
+STUB_ROBOTS = 4
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class ApproachStats:
+    """Benchmark results of one approach.
+
+    Errors are over successful results only; latencies and iterations
+    cover every target (including failed solves).
+
+    Attributes:
+        approach: Approach name
+        targets: Number of targets
+        successes: Targets solved within the pose tolerances
+        success_rate: successes / targets
+        latency_ms: Single-target solve latency percentiles ("p50", "p90",
+            "p99", "max") in milliseconds
+        batch_ms_per_target: Time of one compute_motion_batch call over all
+            targets, divided by the number of targets (None if it failed)
+        mean_iterations: Mean solver iterations (None if not iterative)
+        max_iterations: Largest solver iteration count (None if not iterative)
+        position_error_mm: Median and max final position error ("median", "max")
+        orientation_error_mrad: Median and max final orientation error ("median", "max")
+        failures: Number of failed targets per reason
+    """
+
+    approach: str
+    targets: int
+    successes: int
+    success_rate: float
+    latency_ms: dict[str, float]
+    batch_ms_per_target: Optional[float] = None
+    mean_iterations: Optional[float] = None
+    max_iterations: Optional[int] = None
+    position_error_mm: dict[str, float] = field(default_factory=dict)
+    orientation_error_mrad: dict[str, float] = field(default_factory=dict)
+    failures: dict[str, int] = field(default_factory=dict)
+
+
+def workspace_targets(
+    forward_kinematics: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    count: int,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sample reachable target poses over the workspace.
+
+    Args:
+        forward_kinematics: Maps (N, num_joints) joint vectors to (N, 7) poses
+        lower: (num_joints,) lower joint bounds (infinite bounds become -pi)
+        upper: (num_joints,) upper joint bounds (infinite bounds become pi)
+        count: Number of targets
+        seed: Random seed
+
+    Returns:
+        Tuple of ((count, 3) positions, (count, 4) orientations [w, x, y, z])
+    """
+    lower = np.where(np.isfinite(lower), lower, -np.pi)
+    upper = np.where(np.isfinite(upper), upper, np.pi)
+    joint_positions = np.random.default_rng(seed).uniform(lower, upper, size=(count, len(lower)))
+    return pose_math.split_poses(forward_kinematics(joint_positions))
+
+
+def load_targets(path: str | Path) -> tuple[np.ndarray, np.ndarray]:
+    """Read target poses from a workflow or pose file (YAML or JSON).
+
+    Every mapping with a 3-element "position" and a 4-element "orientation"
+    anywhere in the file is a target, in file order.
+
+    Args:
+        path: File path
+
+    Returns:
+        Tuple of ((N, 3) positions, (N, 4) orientations [w, x, y, z])
+
+    Raises:
+        ValueError: If the file contains no poses
+    """
+    with open(path, "r") as f:
+        data = yaml.safe_load(f)
+
+    positions, orientations = [], []
+
+    def collect(node):
+        if isinstance(node, dict):
+            position, orientation = node.get("position"), node.get("orientation")
+            if isinstance(position, list) and isinstance(orientation, list) and len(position) == 3 and len(orientation) == 4:
+                positions.append(position)
+                orientations.append(orientation)
+            for value in node.values():
+                collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(data)
+    if not positions:
+        raise ValueError(f"No poses (position + orientation) found in {path}")
+    return np.array(positions, dtype=float), pose_math.quat_normalize(np.array(orientations, dtype=float))
+
+
+class StubArticulationView:
+    """ArticulationViewWrapper stand-in whose PhysX buffers come from a KinematicChain.
+
+    Every row is a fixed-base robot at the world origin holding its joint
+    positions; the Jacobians and link transforms are computed with
+    chain.jacobian(), with zero columns for joints outside the chain (e.g.,
+    the gripper). The bodies are the chain's base and end-effector links.
+    The view is its own root_physx_view and data, so it can be handed to
+    BatchedDifferentialIKSolver without Isaac Sim or a GPU.
+
+    Attributes:
+        chain: Kinematic chain of every robot
+        joint_names: Names of the full joint vector
+        body_names: [base link, end-effector link]
+        joint_positions: (num_robots, num_joints) joint positions of every row
+        prim_paths: Articulation root prim path of every row
+    """
+
+    is_fixed_base = True
+
+    def __init__(self, chain: KinematicChain, joint_names: list[str], joint_positions: np.ndarray, prim_paths: list[str]):
+        """Initialize the view.
+
+        Args:
+            chain: Kinematic chain whose joint names are a subset of joint_names
+            joint_names: Names of the full joint vector
+            joint_positions: (num_robots, num_joints) joint positions of every row
+            prim_paths: Articulation root prim path of every row
+        """
+        self.chain = chain
+        self.joint_names = list(joint_names)
+        self.body_names = [chain.base_link, chain.end_effector_link]
+        self.joint_positions = np.array(joint_positions, dtype=float)
+        self.prim_paths = list(prim_paths)
+        self._chain_ids = [self.joint_names.index(name) for name in chain.joint_names]
+        self.root_physx_view = self
+        self.data = self
+
+    def get_dof_positions(self) -> np.ndarray:
+        """(num_robots, num_joints) joint positions."""
+        return self.joint_positions.copy()
+
+    def get_jacobians(self) -> np.ndarray:
+        """(num_robots, 1, 6, num_joints) end-effector Jacobians (the base body is omitted)."""
+        jacobians, _ = self.chain.jacobian(self.joint_positions[:, self._chain_ids])
+        full = np.zeros((len(self.prim_paths), 1, 6, len(self.joint_names)))
+        full[:, 0][..., self._chain_ids] = jacobians
+        return full
+
+    def get_link_transforms(self) -> np.ndarray:
+        """(num_robots * 2, 7) base and end-effector poses [x, y, z, qx, qy, qz, qw]."""
+        _, poses = self.chain.jacobian(self.joint_positions[:, self._chain_ids])
+        links = np.zeros((len(self.prim_paths), 2, 7))
+        links[:, 0, 6] = 1.0
+        links[:, 1, :3] = poses[:, :3]
+        links[:, 1, 3:6] = poses[:, 4:7]
+        links[:, 1, 6] = poses[:, 3]
+        return links.reshape(-1, 7)
+
+
+def create_stub_dispatcher(
+    analytical_config: AnalyticalIKConfig,
+    diff_ik_config: DifferentialIKConfig = None,
+    planner_config: SamplingPlannerConfig = None,
+) -> MotionDispatcher:
+    """Register every approach that runs without Isaac Sim on one SCARA model.
+
+    Args:
+        analytical_config: Geometry and limits of the arm
+        diff_ik_config: Solver settings for differential_ik (backend is
+            forced to "numpy"; default: DifferentialIKConfig defaults)
+        planner_config: Settings for sampling_planner (default: defaults)
+
+    Returns:
+        MotionDispatcher with analytical_ik, differential_ik,
+        batched_differential_ik (bound to the first of STUB_ROBOTS robots of a
+        StubArticulationView at the home pose) and sampling_planner
+    """
+    kinematics = ScaraKinematics(analytical_config)
+    home_pose = np.array(analytical_config.home_pose, dtype=float)
+
+    # Full joint vector names: SCARA joints by index, others (e.g., gripper) generic
+    joint_names = [f"joint_{index}" for index in range(len(home_pose))]
+    for joint in SCARA_JOINTS:
+        index = analytical_config.joint_indices.get(joint)
+        if index is not None:
+            joint_names[index] = joint
+
+    def get_joint_positions():
+        return home_pose.copy()
+
+    dispatcher = MotionDispatcher(MotionConfig(
+        default_approach="analytical_ik",
+        approaches={name: ApproachConfig(enabled=True) for name in STUB_APPROACHES},
+    ))
+    dispatcher.register_approach("analytical_ik", AnalyticalIKApproach(analytical_config, get_joint_positions))
+
+    diff_ik_config = diff_ik_config or DifferentialIKConfig(home_pose=list(home_pose))
+    diff_ik_config.backend = "numpy"
+    chain = kinematics.to_chain()
+    dispatcher.register_approach("differential_ik", DifferentialIKApproach(
+        articulation=None,
+        config=diff_ik_config,
+        joint_names=joint_names,
+        get_joint_positions=get_joint_positions,
+        chain=chain,
+    ))
+
+    view = StubArticulationView(
+        chain,
+        joint_names,
+        np.tile(home_pose, (STUB_ROBOTS, 1)),
+        [f"/World/env_{i}/robot" for i in range(STUB_ROBOTS)],
+    )
+    solver = BatchedDifferentialIKSolver(
+        lambda: view,
+        replace(diff_ik_config, end_effector_body_name=chain.end_effector_link),
+        joint_names=chain.joint_names,
+    )
+    dispatcher.register_approach(
+        "batched_differential_ik",
+        BatchedDifferentialIKApproach(solver, prim_path=view.prim_paths[0]),
+    )
+
+    planner_config = planner_config or SamplingPlannerConfig(seed=0)
+    checker = CollisionChecker(
+        kinematics.link_points,
+        planner_config.link_radii,
+        home_pose,
+        resolution=planner_config.edge_resolution,
+        tool_poses=kinematics.forward_kinematics,
+    )
+    dispatcher.register_approach("sampling_planner", SamplingPlannerApproach(
+        ik_approach=AnalyticalIKApproach(analytical_config, get_joint_positions),
+        checker=checker,
+        config=planner_config,
+        joint_limits={
+            index: analytical_config.get_limits(joint)
+            for joint, index in analytical_config.joint_indices.items()
+            if index is not None
+        },
+        get_joint_positions=get_joint_positions,
+    ))
+    return dispatcher
+
+
+def _pose_errors(
+    forward_kinematics: Callable[[np.ndarray], np.ndarray],
+    joint_positions: np.ndarray,
+    target_positions: np.ndarray,
+    target_orientations: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Position (meters) and orientation (radians) errors of solved joints."""
+    positions, orientations = pose_math.split_poses(forward_kinematics(joint_positions))
+    position_errors = np.linalg.norm(positions - target_positions, axis=-1)
+    dots = np.abs(np.sum(orientations * pose_math.quat_normalize(target_orientations), axis=-1))
+    return position_errors, 2.0 * np.arccos(np.clip(dots, 0.0, 1.0))
+
+
+def benchmark_approach(
+    dispatcher: MotionDispatcher,
+    approach: str,
+    target_positions: np.ndarray,
+    target_orientations: np.ndarray,
+    forward_kinematics: Callable[[np.ndarray], np.ndarray],
+    solution_preference: str = "closest_to_current",
+    position_tolerance: float = 1e-3,
+    orientation_tolerance: float = 1e-2,
+) -> ApproachStats:
+    """Solve every target with one approach and summarize the results.
+
+    The IK cache is bypassed, so every target is solved.
+
+    Args:
+        dispatcher: Dispatcher with the approach registered
+        approach: Approach name
+        target_positions: (N, 3) target positions in world frame
+        target_orientations: (N, 4) target quaternions [w, x, y, z]
+        forward_kinematics: Maps joint vectors to world-frame poses, to
+            measure the final pose error
+        solution_preference: Passed to the approach
+        position_tolerance: Largest position error of a success (meters)
+        orientation_tolerance: Largest orientation error of a success (radians)
+
+    Returns:
+        ApproachStats
+    """
+    count = len(target_positions)
+    latencies = np.zeros(count)
+    solved_indices, solved_joints = [], []
+    iterations = []
+    failures: dict[str, int] = {}
+
+    for i in range(count):
+        start = time.perf_counter()
+        try:
+            result = dispatcher.compute_motion(
+                target_positions[i],
+                target_orientations[i],
+                approach=approach,
+                use_cache=False,
+                solution_preference=solution_preference,
+            )
+        except (IKError, PlanningError) as e:
+            result = None
+            failures[type(e).__name__] = failures.get(type(e).__name__, 0) + 1
+            if getattr(e, "iterations", None) is not None:
+                iterations.append(e.iterations)
+        latencies[i] = time.perf_counter() - start
+
+        if result is not None and result.iterations is not None:
+            iterations.append(result.iterations)
+        if result is not None and result.success:
+            solved_indices.append(i)
+            solved_joints.append(result.joint_positions)
+        elif result is not None:
+            failures["unsuccessful"] = failures.get("unsuccessful", 0) + 1
+
+    position_errors, orientation_errors = np.zeros(0), np.zeros(0)
+    if solved_indices:
+        position_errors, orientation_errors = _pose_errors(
+            forward_kinematics,
+            np.asarray(solved_joints, dtype=float),
+            target_positions[solved_indices],
+            target_orientations[solved_indices],
+        )
+
+    within = (position_errors <= position_tolerance) & (orientation_errors <= orientation_tolerance)
+    if np.any(~within):
+        failures["out_of_tolerance"] = int(np.sum(~within))
+    successes = int(np.sum(within))
+
+    batch_ms_per_target = None
+    try:
+        start = time.perf_counter()
+        dispatcher.compute_motion_batch(
+            target_positions,
+            target_orientations,
+            approach=approach,
+            use_cache=False,
+            solution_preference=solution_preference,
+        )
+        batch_ms_per_target = (time.perf_counter() - start) * 1000.0 / max(count, 1)
+    except (CapabilityError, IKError, PlanningError):
+        pass
+
+    latencies_ms = latencies * 1000.0
+    return ApproachStats(
+        approach=approach,
+        targets=count,
+        successes=successes,
+        success_rate=successes / max(count, 1),
+        latency_ms={
+            **{f"p{q}": float(np.percentile(latencies_ms, q)) for q in LATENCY_PERCENTILES},
+            "max": float(latencies_ms.max(initial=0.0)),
+        },
+        batch_ms_per_target=batch_ms_per_target,
+        mean_iterations=float(np.mean(iterations)) if iterations else None,
+        max_iterations=int(np.max(iterations)) if iterations else None,
+        position_error_mm=_median_max(position_errors * 1000.0),
+        orientation_error_mrad=_median_max(orientation_errors * 1000.0),
+        failures=failures,
+    )
+
+
+def benchmark_ik_batch_queue(
+    solver: BatchedDifferentialIKSolver,
+    target_positions: np.ndarray,
+    target_orientations: np.ndarray,
+    solution_preference: str = "closest_to_current",
+) -> tuple[int, float]:
+    """Submit every target to an IKBatchQueue, spread over the solver's robots, and flush once.
+
+    Args:
+        solver: Shared solver (e.g., of the stub batched_differential_ik)
+        target_positions: (N, 3) target positions in world frame
+        target_orientations: (N, 4) target quaternions [w, x, y, z]
+        solution_preference: Passed with every request
+
+    Returns:
+        Tuple of (successful requests, flush time per request in milliseconds)
+    """
+    queue = IKBatchQueue()
+    queue.dispatcher = MotionDispatcher(MotionConfig(
+        default_approach="batched_differential_ik",
+        approaches={"batched_differential_ik": ApproachConfig(enabled=True)},
+    ))
+    queue.dispatcher.register_approach("batched_differential_ik", BatchedDifferentialIKApproach(solver))
+
+    num_robots = len(solver.view.root_physx_view.prim_paths)
+    base_pose = (np.zeros(3), np.array([1.0, 0.0, 0.0, 0.0]))
+    requests = [
+        queue.submit(position, orientation, row=i % num_robots, base_pose=base_pose, solution_preference=solution_preference)
+        for i, (position, orientation) in enumerate(zip(target_positions, target_orientations))
+    ]
+
+    start = time.perf_counter()
+    queue.flush()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return sum(request.result.success for request in requests), elapsed_ms / max(len(requests), 1)
+
+
+def _median_max(values: np.ndarray) -> dict[str, float]:
+    if len(values) == 0:
+        return {}
+    return {"median": float(np.median(values)), "max": float(np.max(values))}
+
+
+def run_benchmark(
+    dispatcher: MotionDispatcher,
+    target_positions: np.ndarray,
+    target_orientations: np.ndarray,
+    forward_kinematics: Callable[[np.ndarray], np.ndarray],
+    approaches: list[str] = None,
+    **kwargs,
+) -> list[ApproachStats]:
+    """Benchmark several approaches on the same targets.
+
+    Args:
+        dispatcher: Dispatcher with the approaches registered
+        target_positions: (N, 3) target positions in world frame
+        target_orientations: (N, 4) target quaternions [w, x, y, z]
+        forward_kinematics: Maps joint vectors to world-frame poses
+        approaches: Approach names (default: every registered approach)
+        **kwargs: Passed to benchmark_approach()
+
+    Returns:
+        ApproachStats per approach, in order
+    """
+    names = approaches or list(dispatcher.approaches)
+    return [
+        benchmark_approach(dispatcher, name, target_positions, target_orientations, forward_kinematics, **kwargs)
+        for name in names
+    ]
+
+
+def format_report(stats: list[ApproachStats]) -> str:
+    """Format benchmark results as a text table.
+
+    Args:
+        stats: Results from run_benchmark()
+
+    Returns:
+        Table with one row per approach
+    """
+    def number(value, digits=2):
+        return "-" if value is None else f"{value:.{digits}f}"
+
+    header = (
+        f"{'approach':<24} {'success':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'batch ms':>9} {'iters':>11} {'pos mm':>15} {'ori mrad':>15}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in stats:
+        iterations = "-" if s.mean_iterations is None else f"{s.mean_iterations:.1f}/{s.max_iterations}"
+        position = f"{number(s.position_error_mm.get('median'), 3)}/{number(s.position_error_mm.get('max'), 3)}"
+        orientation = f"{number(s.orientation_error_mrad.get('median'), 3)}/{number(s.orientation_error_mrad.get('max'), 3)}"
+        lines.append(
+            f"{s.approach:<24} {s.success_rate:>8.1%} {number(s.latency_ms['p50']):>8} {number(s.latency_ms['p90']):>8} "
+            f"{number(s.latency_ms['p99']):>8} {number(s.latency_ms['max']):>8} {number(s.batch_ms_per_target, 3):>9} "
+            f"{iterations:>11} {position:>15} {orientation:>15}"
+        )
+        if s.failures:
+            lines.append(f"{'':<24} failures: {s.failures}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark motion approaches on analytical or stub SCARA kinematics.")
+    parser.add_argument("--analytical-config", type=Path, default=None,
+                        help="analytical_ik_config.yaml (default: the PF400 asset config, or a stub arm if missing)")
+    parser.add_argument("--diff-ik-config", type=Path, default=None,
+                        help="differential_ik_config.yaml for the numpy solver settings")
+    parser.add_argument("--planner-config", type=Path, default=None, help="sampling_planner_config.yaml")
+    parser.add_argument("--approach", action="append", default=None,
+                        help="Approach to benchmark (repeatable; default: all)")
+    parser.add_argument("--targets", type=int, default=200, help="Number of workspace targets")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for workspace targets")
+    parser.add_argument("--workflow", type=Path, default=None,
+                        help="Take targets from a workflow or pose file instead of sampling the workspace")
+    parser.add_argument("--solution-preference", default="closest_to_current",
+                        choices=["closest_to_current", "closest_to_home"])
+    parser.add_argument("--position-tolerance", type=float, default=1e-3, help="Success tolerance (meters)")
+    parser.add_argument("--orientation-tolerance", type=float, default=1e-2, help="Success tolerance (radians)")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the results to a JSON file")
+    parser.add_argument("--min-success", type=float, default=None,
+                        help="Exit with status 1 if any approach's success rate is below this fraction")
+    args = parser.parse_args()
+
+    analytical_config_path = args.analytical_config or PF400_CONFIG_DIR / "analytical_ik_config.yaml"
+    if analytical_config_path.exists():
+        analytical_config = AnalyticalIKConfig.from_yaml(analytical_config_path)
+    elif args.analytical_config is None:
+        print(f"No analytical IK config at {analytical_config_path}; using the stub arm")
+        analytical_config = AnalyticalIKConfig(joint_limits=STUB_JOINT_LIMITS, home_pose=STUB_HOME_POSE)
+    else:
+        print(f"Analytical IK config not found: {analytical_config_path}")
+        sys.exit(1)
+
+    diff_ik_config = DifferentialIKConfig.from_yaml(args.diff_ik_config) if args.diff_ik_config else None
+    planner_config = SamplingPlannerConfig.from_yaml(args.planner_config) if args.planner_config else None
+    dispatcher = create_stub_dispatcher(analytical_config, diff_ik_config, planner_config)
+    kinematics = ScaraKinematics(analytical_config)
+
+    if args.workflow is not None:
+        positions, orientations = load_targets(args.workflow)
+        source = str(args.workflow)
+    else:
+        home_pose = np.array(analytical_config.home_pose, dtype=float)
+        lower, upper = home_pose.copy(), home_pose.copy()
+        for joint, index in analytical_config.joint_indices.items():
+            if index is not None:
+                lower[index], upper[index] = analytical_config.get_limits(joint)
+        positions, orientations = workspace_targets(kinematics.forward_kinematics, lower, upper, args.targets, args.seed)
+        source = f"{args.targets} workspace samples (seed {args.seed})"
+
+    print(f"Benchmarking {len(positions)} targets from {source}")
+    stats = run_benchmark(
+        dispatcher,
+        positions,
+        orientations,
+        kinematics.forward_kinematics,
+        approaches=args.approach,
+        solution_preference=args.solution_preference,
+        position_tolerance=args.position_tolerance,
+        orientation_tolerance=args.orientation_tolerance,
+    )
+    print(format_report(stats))
+
+    if any(s.approach == "batched_differential_ik" for s in stats):
+        solver = dispatcher.approaches["batched_differential_ik"].solver
+        solved, ms_per_request = benchmark_ik_batch_queue(solver, positions, orientations, args.solution_preference)
+        print(
+            f"IK batch queue: {len(positions)} requests over {STUB_ROBOTS} stub robots, "
+            f"{solved} valid steps, {ms_per_request:.3f} ms per request"
+        )
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump({"source": source, "results": [asdict(s) for s in stats]}, f, indent=2)
+        print(f"Results written to {args.json}")
+
+    if args.min_success is not None:
+        below = [s.approach for s in stats if s.success_rate < args.min_success]
+        if below:
+            print(f"Success rate below {args.min_success:.1%} for: {below}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
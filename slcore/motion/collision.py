@@ -0,0 +1,465 @@
+"""Collision proxies for checking robot configurations before they are executed.
+
+Obstacles are approximated by oriented boxes built from the extents of the
+stage's collision prims (utils.get_prim_bounds), and the robot by capsules
+along its links (e.g., ScaraKinematics.link_points). Each capsule is covered
+by spheres spaced at most one radius apart, so a configuration check is a
+vectorized sphere-vs-box test and many configurations (whole edges of a
+path) are checked in one call. Held objects are boxes carried rigidly by the
+tool frame and tested box-vs-box.
+
+Example:
+    obstacles = BoxProxies.from_prims(collect_obstacle_prims(env_prim, exclude_paths=[robot_path]))
+    checker = CollisionChecker(kinematics.link_points, link_radii=[0.05, 0.04, 0.03],
+                               reference_joint_positions=home_pose, obstacles=obstacles)
+    checker.set_robot_base_pose(base_position, base_orientation)
+    blocked = checker.edges_in_collision(starts, goals)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+from pxr import Usd, UsdPhysics
+
+from slcore.common import pose_math
+
+
+@dataclass
+class BoxProxies:
+    """Oriented boxes approximating obstacles, in world frame.
+
+    Attributes:
+        centers: (B, 3) box centers
+        rotations: (B, 3, 3) box axes as matrix columns
+        half_extents: (B, 3) half sizes along the box axes
+        paths: Prim path of each box
+    """
+
+    centers: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    rotations: np.ndarray = field(default_factory=lambda: np.zeros((0, 3, 3)))
+    half_extents: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    paths: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_prims(cls, prims: list[Usd.Prim], margin: float = 0.0) -> "BoxProxies":
+        """Build boxes from the authored extents of prims.
+
+        Prims without an extent are skipped.
+
+        Args:
+            prims: Boundable prims (e.g., collision meshes)
+            margin: Padding added on every side of each box (meters)
+
+        Returns:
+            BoxProxies in world frame
+        """
+        # Deferred imports - both need Isaac Sim
+        from slcore.common import utils
+        from slcore.common.stage_cache import get_xform_cache
+
+        xform_cache = get_xform_cache()
+        centers, rotations, half_extents, paths = [], [], [], []
+        for prim in prims:
+            try:
+                min_bounds, max_bounds = utils.get_prim_bounds(prim)
+            except ValueError:
+                continue
+
+            # Row-vector convention: world = local @ M[:3, :3] + M[3, :3]
+            matrix = xform_cache.get_world_transform(prim)
+            axes = matrix[:3, :3]
+            scales = np.linalg.norm(axes, axis=1)
+            if np.any(scales < 1e-12):
+                continue
+
+            centers.append((min_bounds + max_bounds) / 2.0 @ axes + matrix[3, :3])
+            rotations.append((axes / scales[:, None]).T)
+            half_extents.append((max_bounds - min_bounds) / 2.0 * scales + margin)
+            paths.append(prim.GetPath().pathString)
+
+        if not paths:
+            return cls()
+        return cls(np.array(centers), np.array(rotations), np.array(half_extents), paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def select(self, mask: np.ndarray) -> "BoxProxies":
+        """Get a subset of the boxes.
+
+        Args:
+            mask: (B,) boolean mask or index array
+
+        Returns:
+            BoxProxies with the selected boxes
+        """
+        indices = np.arange(len(self))[mask]
+        return BoxProxies(
+            self.centers[indices],
+            self.rotations[indices],
+            self.half_extents[indices],
+            [self.paths[i] for i in indices],
+        )
+
+    def concatenate(self, other: "BoxProxies") -> "BoxProxies":
+        """Join two sets of boxes.
+
+        Args:
+            other: Boxes to append
+
+        Returns:
+            BoxProxies with the boxes of both sets
+        """
+        return BoxProxies(
+            np.concatenate([self.centers, other.centers]),
+            np.concatenate([self.rotations, other.rotations]),
+            np.concatenate([self.half_extents, other.half_extents]),
+            self.paths + other.paths,
+        )
+
+    def aabb_half_extents(self) -> np.ndarray:
+        """Get the half sizes of the world-axis-aligned boxes enclosing each box.
+
+        Returns:
+            (B, 3) half extents around centers
+        """
+        return np.einsum("bij,bj->bi", np.abs(self.rotations), self.half_extents)
+
+    def sphere_hits(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Test spheres against every box.
+
+        Args:
+            centers: (..., 3) sphere centers in world frame
+            radii: (...) sphere radii, broadcast against centers[..., 0]
+
+        Returns:
+            (..., B) True where a sphere overlaps a box
+        """
+        offsets = centers[..., None, :] - self.centers
+        local = np.einsum("bji,...bj->...bi", self.rotations, offsets)
+        outside = local - np.clip(local, -self.half_extents, self.half_extents)
+        radii = np.asarray(radii, dtype=float)[..., None]
+        return np.sum(outside * outside, axis=-1) <= radii * radii
+
+    def box_hits(self, centers: np.ndarray, rotations: np.ndarray, half_extents: np.ndarray) -> np.ndarray:
+        """Test oriented boxes against every box (separating axis test).
+
+        Args:
+            centers: (..., 3) box centers in world frame
+            rotations: (..., 3, 3) box axes as matrix columns
+            half_extents: (..., 3) half sizes along the box axes
+
+        Returns:
+            (..., B) True where a box overlaps a box of this set
+        """
+        a_extents = np.asarray(half_extents, dtype=float)
+        a = a_extents[..., None, :]
+        b = self.half_extents
+
+        # Axes of the other boxes and the offset between centers, in each box's frame
+        r = np.einsum("...ki,bkj->...bij", rotations, self.rotations)
+        t = np.einsum("...ki,...bk->...bi", rotations, self.centers - centers[..., None, :])
+        abs_r = np.abs(r) + 1e-9
+
+        separated = np.any(np.abs(t) > a + np.einsum("...bij,bj->...bi", abs_r, b), axis=-1)
+        t_b = np.einsum("...bi,...bij->...bj", t, r)
+        separated |= np.any(np.abs(t_b) > np.einsum("...i,...bij->...bj", a_extents, abs_r) + b, axis=-1)
+
+        # Cross products of the axis pairs (i, j)
+        i1, i2 = [1, 2, 0], [2, 0, 1]
+        cross_t = t[..., i2, None] * r[..., i1, :] - t[..., i1, None] * r[..., i2, :]
+        cross_extents = (
+            a[..., i1, None] * abs_r[..., i2, :]
+            + a[..., i2, None] * abs_r[..., i1, :]
+            + b[:, None, i1] * abs_r[..., :, i2]
+            + b[:, None, i2] * abs_r[..., :, i1]
+        )
+        separated |= np.any(np.abs(cross_t) > cross_extents, axis=(-2, -1))
+        return ~separated
+
+
+def collect_obstacle_prims(
+    root_prim: Usd.Prim,
+    exclude_paths: list[str] = (),
+    static_only: bool = False,
+) -> list[Usd.Prim]:
+    """Find the collision prims below a root prim.
+
+    Args:
+        root_prim: Root of the search (e.g., an environment root)
+        exclude_paths: Subtrees to skip (e.g., the robot itself, held labware)
+        static_only: Also skip rigid body subtrees (labware that can be moved)
+
+    Returns:
+        Prims with UsdPhysics.CollisionAPI applied
+    """
+    excluded = set(exclude_paths)
+    prims = []
+    iterator = iter(Usd.PrimRange(root_prim))
+    for prim in iterator:
+        if prim.GetPath().pathString in excluded or (static_only and prim.HasAPI(UsdPhysics.RigidBodyAPI)):
+            iterator.PruneChildren()
+            continue
+        if prim.HasAPI(UsdPhysics.CollisionAPI):
+            prims.append(prim)
+    return prims
+
+
+class CollisionChecker:
+    """Checks robot configurations against obstacle boxes.
+
+    The robot is a chain of capsules between consecutive link points; each
+    capsule is covered by evenly spaced spheres whose count is fixed from a
+    reference configuration. Held objects are boxes fixed in the tool frame.
+
+    Attributes:
+        obstacles: Obstacle boxes in world frame
+        attached: Held object boxes in the tool frame
+        link_radii: (S,) capsule radius of each link segment
+        resolution: Largest joint change between checked samples on an edge
+    """
+
+    # Configurations per chunk; boxes outside a chunk's bounds are skipped
+    CHUNK_SIZE = 64
+
+    def __init__(
+        self,
+        link_points: Callable[[np.ndarray], np.ndarray],
+        link_radii: list[float],
+        reference_joint_positions: np.ndarray,
+        obstacles: BoxProxies = None,
+        resolution: float = 0.02,
+        tool_poses: Callable[[np.ndarray], np.ndarray] = None,
+    ):
+        """Initialize the checker.
+
+        Args:
+            link_points: Maps (..., num_joints) joint vectors to (..., S + 1, 3)
+                link points in the robot base frame
+            link_radii: Capsule radius of each of the S link segments (meters)
+            reference_joint_positions: Configuration used to size the sphere
+                cover of each link (e.g., the home pose)
+            obstacles: Obstacle boxes (default: none)
+            resolution: Largest joint change between checked samples on an
+                edge (radians or meters)
+            tool_poses: Maps (..., num_joints) joint vectors to (..., 7) tool
+                poses in the robot base frame (e.g.,
+                ScaraKinematics.forward_kinematics); needed to carry held objects
+        """
+        self.link_radii = np.asarray(link_radii, dtype=float)
+        self.resolution = resolution
+        self.obstacles = obstacles if obstacles is not None else BoxProxies()
+        self.attached = BoxProxies()
+        self._link_points = link_points
+        self._tool_poses = tool_poses
+        self.base_pose = pose_math.IDENTITY_POSE.copy()
+
+        points = link_points(np.asarray(reference_joint_positions, dtype=float))
+        lengths = np.linalg.norm(np.diff(points, axis=-2), axis=-1)
+        if len(lengths) != len(self.link_radii):
+            raise ValueError(f"Expected {len(lengths)} link radii, got {len(self.link_radii)}")
+
+        # Sphere i of segment s sits at fraction t of the segment
+        fractions, segments = [], []
+        for index, (length, radius) in enumerate(zip(lengths, self.link_radii)):
+            count = int(np.ceil(length / max(radius, 1e-3))) + 1
+            fractions.append(np.linspace(0.0, 1.0, count))
+            segments.append(np.full(count, index))
+        self._fractions = np.concatenate(fractions)
+        self._segments = np.concatenate(segments)
+        self._sphere_radii = self.link_radii[self._segments]
+
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Update the robot base pose used to place the link spheres in world frame.
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        self.base_pose = pose_math.make_poses(position, orientation)
+
+    def set_obstacles(self, obstacles: BoxProxies):
+        """Replace the obstacle boxes.
+
+        Args:
+            obstacles: Obstacle boxes in world frame
+        """
+        self.obstacles = obstacles
+
+    def set_attached(self, objects: BoxProxies, joint_positions: np.ndarray):
+        """Carry held objects with the tool.
+
+        Args:
+            objects: Boxes of the held objects in world frame (empty to release)
+            joint_positions: (num_joints,) configuration the boxes were measured at
+
+        Raises:
+            ValueError: If objects are given but the checker has no tool_poses
+        """
+        if len(objects) == 0:
+            self.attached = BoxProxies()
+            return
+        if self._tool_poses is None:
+            raise ValueError("Held objects need a tool_poses function")
+
+        tool_pose = pose_math.compose_poses(self.base_pose, self._tool_poses(np.asarray(joint_positions, dtype=float)))
+        tool_position, tool_orientation = pose_math.split_poses(tool_pose)
+        tool_rotation = pose_math.quat_to_matrix(tool_orientation)
+        self.attached = BoxProxies(
+            (objects.centers - tool_position) @ tool_rotation,
+            np.einsum("ki,bkj->bij", tool_rotation, objects.rotations),
+            objects.half_extents.copy(),
+            list(objects.paths),
+        )
+
+    def attached_boxes(self, joint_positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Place the held object boxes of configurations in world frame.
+
+        Args:
+            joint_positions: (..., num_joints) joint vectors
+
+        Returns:
+            Tuple of ((..., M, 3) box centers, (..., M, 3, 3) box rotations)
+        """
+        tool_poses = pose_math.compose_poses(self.base_pose, self._tool_poses(np.asarray(joint_positions, dtype=float)))
+        tool_positions, tool_orientations = pose_math.split_poses(tool_poses)
+        tool_rotations = pose_math.quat_to_matrix(tool_orientations)
+        centers = np.einsum("...ij,mj->...mi", tool_rotations, self.attached.centers) + tool_positions[..., None, :]
+        return centers, tool_rotations[..., None, :, :] @ self.attached.rotations
+
+    def sphere_centers(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Place the link spheres of configurations in world frame.
+
+        Args:
+            joint_positions: (..., num_joints) joint vectors
+
+        Returns:
+            (..., num_spheres, 3) sphere centers
+        """
+        points = self._link_points(np.asarray(joint_positions, dtype=float))
+        starts = points[..., self._segments, :]
+        ends = points[..., self._segments + 1, :]
+        centers_b = starts + (ends - starts) * self._fractions[:, None]
+        base_position, base_orientation = pose_math.split_poses(self.base_pose)
+        return pose_math.quat_rotate(base_orientation, centers_b) + base_position
+
+    def colliding_obstacles(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Find the obstacles each configuration touches.
+
+        Args:
+            joint_positions: (..., num_joints) joint vectors
+
+        Returns:
+            (..., B) True where the robot overlaps an obstacle
+        """
+        joint_positions = np.asarray(joint_positions, dtype=float)
+        batch_shape = joint_positions.shape[:-1]
+        flat = joint_positions.reshape(-1, joint_positions.shape[-1])
+        hits = np.zeros((len(flat), len(self.obstacles)), dtype=bool)
+        if len(self.obstacles) == 0 or len(flat) == 0:
+            return hits.reshape(batch_shape + (len(self.obstacles),))
+
+        # Broadphase: only boxes overlapping the bounds of a chunk's spheres
+        # and held objects are tested
+        box_extents = self.obstacles.aabb_half_extents()
+        max_radius = self._sphere_radii.max()
+        held_radius = np.linalg.norm(self.attached.half_extents, axis=-1).max(initial=0.0)
+        for begin in range(0, len(flat), self.CHUNK_SIZE):
+            chunk = slice(begin, begin + self.CHUNK_SIZE)
+            centers = self.sphere_centers(flat[chunk])
+            lower = centers.reshape(-1, 3).min(axis=0) - max_radius
+            upper = centers.reshape(-1, 3).max(axis=0) + max_radius
+            if len(self.attached):
+                held_centers, held_rotations = self.attached_boxes(flat[chunk])
+                lower = np.minimum(lower, held_centers.reshape(-1, 3).min(axis=0) - held_radius)
+                upper = np.maximum(upper, held_centers.reshape(-1, 3).max(axis=0) + held_radius)
+
+            candidates = np.flatnonzero(np.all(
+                (self.obstacles.centers + box_extents >= lower) & (self.obstacles.centers - box_extents <= upper),
+                axis=-1,
+            ))
+            if len(candidates) == 0:
+                continue
+            boxes = self.obstacles.select(candidates)
+            chunk_hits = boxes.sphere_hits(centers, self._sphere_radii).any(axis=-2)
+            if len(self.attached):
+                chunk_hits |= boxes.box_hits(held_centers, held_rotations, self.attached.half_extents).any(axis=-2)
+            hits[chunk, candidates] = chunk_hits
+        return hits.reshape(batch_shape + (len(self.obstacles),))
+
+    def in_collision(self, joint_positions: np.ndarray, ignore: np.ndarray = None) -> np.ndarray:
+        """Check configurations for collisions.
+
+        Args:
+            joint_positions: (..., num_joints) joint vectors
+            ignore: (B,) obstacles to skip (e.g., ones touched at the start)
+
+        Returns:
+            (...) True where the robot overlaps any obstacle not ignored
+        """
+        hits = self.colliding_obstacles(joint_positions)
+        if ignore is not None:
+            hits = hits & ~ignore
+        return hits.any(axis=-1)
+
+    def edge_samples(self, starts: np.ndarray, goals: np.ndarray) -> np.ndarray:
+        """Sample straight joint-space edges at the checker resolution.
+
+        Args:
+            starts: (E, num_joints) edge start configurations
+            goals: (E, num_joints) edge end configurations
+
+        Returns:
+            (E, K, num_joints) samples including both ends; shorter edges
+            repeat their end configuration
+        """
+        starts = np.asarray(starts, dtype=float)
+        goals = np.asarray(goals, dtype=float)
+        steps = np.maximum(1, np.ceil(np.max(np.abs(goals - starts), axis=-1) / self.resolution)).astype(int)
+        fractions = np.minimum(np.arange(steps.max() + 1)[None, :] / steps[:, None], 1.0)
+        return starts[:, None] + (goals - starts)[:, None] * fractions[..., None]
+
+    def edges_in_collision(self, starts: np.ndarray, goals: np.ndarray, ignore: np.ndarray = None) -> np.ndarray:
+        """Check straight joint-space edges for collisions, all edges in one call.
+
+        Args:
+            starts: (E, num_joints) edge start configurations
+            goals: (E, num_joints) edge end configurations
+            ignore: (B,) obstacles to skip
+
+        Returns:
+            (E,) True where any sample of the edge collides
+        """
+        if len(starts) == 0:
+            return np.zeros(0, dtype=bool)
+        return self.in_collision(self.edge_samples(starts, goals), ignore).any(axis=-1)
+
+    def first_collision(self, waypoints: np.ndarray) -> Optional[tuple[np.ndarray, list[str]]]:
+        """Find the first collision along a joint-space path of straight edges.
+
+        Obstacles touched at the first or last waypoint (e.g., the nest a
+        plate is picked from or placed on) are not counted.
+
+        Args:
+            waypoints: (W, num_joints) path configurations
+
+        Returns:
+            Tuple of (first colliding sample configuration, prim paths of the
+            obstacles it touches), or None if the path is collision-free
+        """
+        waypoints = np.asarray(waypoints, dtype=float)
+        if len(waypoints) < 2 or len(self.obstacles) == 0:
+            return None
+
+        ignore = self.colliding_obstacles(waypoints[[0, -1]]).any(axis=0)
+        samples = self.edge_samples(waypoints[:-1], waypoints[1:]).reshape(-1, waypoints.shape[-1])
+        hits = self.colliding_obstacles(samples) & ~ignore
+        colliding = np.flatnonzero(hits.any(axis=-1))
+        if len(colliding) == 0:
+            return None
+
+        first = colliding[0]
+        return samples[first], [self.obstacles.paths[i] for i in np.flatnonzero(hits[first])]
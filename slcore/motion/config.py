@@ -19,7 +19,8 @@ class ApproachConfig:
     Attributes:
         enabled: Whether this approach is available for use
         config_path: Path to approach-specific config file (relative to robot config dir)
-        trajectory_generator: For IK-only approaches, which trajectory generator to pair with
+        trajectory_generator: For IK-only approaches, which trajectory profile to pair
+            with ("trapezoid" or "scurve"); None executes IK results as a single PD target
     """
 
     enabled: bool = False
@@ -35,6 +36,9 @@ class ExecutionConfig:
         default_mode: Default execution mode ("teleport", "pd_follow")
         convergence_threshold: Thresholds for motion completion
         trajectory_timestep: Timestep for trajectory waypoint stepping (seconds)
+        collision_config_path: Config file with collision proxies (relative to robot
+            config dir, e.g., "sampling_planner_config.yaml"); when set, joint moves
+            whose path would collide are rejected before they start
     """
 
     default_mode: str = "pd_follow"
@@ -45,6 +49,70 @@ class ExecutionConfig:
         },
     )
     trajectory_timestep: float = 0.01  # 100Hz
+    collision_config_path: str = None
+
+
+@dataclass
+class IKCacheConfig:
+    """Configuration for the IK solution cache.
+
+    Attributes:
+        enabled: Whether the dispatcher uses the cache
+        max_entries: Maximum number of cached solutions (least recently used are evicted)
+        position_tolerance: Quantization step for base-frame target positions (meters)
+        orientation_tolerance: Quantization step for target quaternion components
+        seed_tolerance: Quantization step for the start joints that
+            "closest_to_current" solutions are keyed on (radians or meters)
+    """
+
+    enabled: bool = True
+    max_entries: int = 256
+    position_tolerance: float = 1e-4  # meters
+    orientation_tolerance: float = 1e-3
+    seed_tolerance: float = 0.01
+
+
+@dataclass
+class TrajectoryConfig:
+    """Configuration for time-parameterized trajectories.
+
+    Limits are either one value for all joints or a list with one value per
+    joint (radians or meters per second, per second squared, per second cubed).
+
+    Attributes:
+        profile: Default profile ("trapezoid" or "scurve")
+        max_velocity: Joint velocity limits
+        max_acceleration: Joint acceleration limits
+        max_jerk: Joint jerk limits (used by "scurve")
+        timestep: Sample spacing of generated trajectories (seconds); moves
+            interpolate the samples at the elapsed simulation time, so this
+            only sets the resolution, not the playback speed
+    """
+
+    profile: str = "trapezoid"
+    max_velocity: float | list[float] = 1.0
+    max_acceleration: float | list[float] = 2.0
+    max_jerk: float | list[float] = 10.0
+    timestep: float = 0.01
+
+
+@dataclass
+class RoadmapConfig:
+    """Configuration for precomputed paths between named locations.
+
+    Attributes:
+        enabled: Whether warmup builds (or loads) a roadmap for the locations
+        config_path: Config file with collision proxies and planner settings
+            (relative to robot config dir)
+        cache_dir: Directory of saved roadmaps (relative to the assets root);
+            None keeps roadmaps in memory only
+        tolerance: Largest joint difference for the robot to count as at a location
+    """
+
+    enabled: bool = False
+    config_path: str = "sampling_planner_config.yaml"
+    cache_dir: Optional[str] = ".roadmaps"
+    tolerance: float = 0.01
 
 
 @dataclass
@@ -58,12 +126,19 @@ class MotionConfig:
         fallback_approach: Approach to use if default fails or is unavailable
         approaches: Configuration for each available approach
         execution: Execution settings (modes, thresholds)
+        ik_cache: IK solution cache settings
+        trajectory: Trajectory limits, used by approaches with a trajectory_generator
+            and by roadmap transfers
+        roadmap: Precomputed location-to-location paths
     """
 
     default_approach: str = "differential_ik"
     fallback_approach: str = None
     approaches: dict[str, ApproachConfig] = field(default_factory=dict)
     execution: ExecutionConfig = field(default_factory=ExecutionConfig)
+    ik_cache: IKCacheConfig = field(default_factory=IKCacheConfig)
+    trajectory: TrajectoryConfig = field(default_factory=TrajectoryConfig)
+    roadmap: RoadmapConfig = field(default_factory=RoadmapConfig)
 
     @classmethod
     def from_yaml(cls, yaml_path: str | Path) -> "MotionConfig":
@@ -109,6 +184,36 @@ class MotionConfig:
                 "velocity": convergence.get("velocity", 0.008),
             },
             trajectory_timestep=exec_data.get("trajectory_timestep", 0.01),
+            collision_config_path=exec_data.get("collision_config_path"),
+        )
+
+        # Parse IK cache config
+        cache_data = motion_data.get("ik_cache", {})
+        ik_cache = IKCacheConfig(
+            enabled=cache_data.get("enabled", True),
+            max_entries=cache_data.get("max_entries", 256),
+            position_tolerance=cache_data.get("position_tolerance", 1e-4),
+            orientation_tolerance=cache_data.get("orientation_tolerance", 1e-3),
+            seed_tolerance=cache_data.get("seed_tolerance", 0.01),
+        )
+
+        # Parse trajectory config (samples default to the execution timestep)
+        trajectory_data = motion_data.get("trajectory", {})
+        trajectory = TrajectoryConfig(
+            profile=trajectory_data.get("profile", "trapezoid"),
+            max_velocity=trajectory_data.get("max_velocity", 1.0),
+            max_acceleration=trajectory_data.get("max_acceleration", 2.0),
+            max_jerk=trajectory_data.get("max_jerk", 10.0),
+            timestep=trajectory_data.get("timestep", execution.trajectory_timestep),
+        )
+
+        # Parse roadmap config
+        roadmap_data = motion_data.get("roadmap", {})
+        roadmap = RoadmapConfig(
+            enabled=roadmap_data.get("enabled", False),
+            config_path=roadmap_data.get("config_path", "sampling_planner_config.yaml"),
+            cache_dir=roadmap_data.get("cache_dir", ".roadmaps"),
+            tolerance=roadmap_data.get("tolerance", 0.01),
         )
 
         return cls(
@@ -116,6 +221,9 @@ class MotionConfig:
             fallback_approach=motion_data.get("fallback_approach"),
             approaches=approaches,
             execution=execution,
+            ik_cache=ik_cache,
+            trajectory=trajectory,
+            roadmap=roadmap,
         )
 
     def get_approach_config(self, approach_name: str) -> Optional[ApproachConfig]:
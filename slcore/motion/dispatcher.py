@@ -3,7 +3,10 @@
 The MotionDispatcher is the main entry point for motion commands. It:
 1. Resolves which approach to use (explicit, default, or fallback)
 2. Validates that the approach has required capabilities
-3. Dispatches to the selected approach
+3. Answers repeated IK requests from the IK cache, if one is attached
+4. Dispatches to the selected approach
+5. Time-parameterizes IK results with the approach's paired trajectory
+   generator, if one is configured
 """
 
 from typing import Optional
@@ -17,6 +20,8 @@ from slcore.motion.base import (
 )
 from slcore.motion.capabilities import MotionCapability
 from slcore.motion.config import MotionConfig
+from slcore.motion.ik_cache import IKCache
+from slcore.motion.trajectory import JointTrajectory, TrajectoryGenerator
 
 
 class MotionDispatcher:
@@ -28,16 +33,30 @@ class MotionDispatcher:
     Attributes:
         config: Motion configuration loaded from YAML
         approaches: Registry of approach name -> MotionApproach instance
+        ik_cache: IK solution cache (None if caching is disabled)
+        base_position: Robot base position in world frame
+        base_orientation: Robot base orientation quaternion [w, x, y, z]
     """
 
-    def __init__(self, config: MotionConfig):
+    def __init__(self, config: MotionConfig, ik_cache: IKCache = None):
         """Initialize the motion dispatcher.
 
         Args:
             config: Motion configuration specifying defaults and enabled approaches
+            ik_cache: IK solution cache, usually shared by all robots of the same
+                model (see get_ik_cache()); ignored if config.ik_cache.enabled is False
         """
         self.config = config
         self.approaches: dict[str, MotionApproach] = {}
+        self.ik_cache = ik_cache if config.ik_cache.enabled else None
+
+        # Trajectory generators by profile name, created on first use
+        self.trajectory_generators: dict[str, TrajectoryGenerator] = {}
+
+        # Robot base pose, updated through set_robot_base_pose()
+        self.base_position = np.zeros(3)
+        self.base_orientation = np.array([1.0, 0.0, 0.0, 0.0])
+        self._base_pose_set = False
 
     def register_approach(self, name: str, approach: MotionApproach):
         """Register a motion approach.
@@ -54,6 +73,37 @@ class MotionDispatcher:
         self.approaches[name] = approach
         print(f"Registered motion approach: {name} (capabilities: {approach.capabilities()})")
 
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Update the robot base pose for all approaches and the IK cache.
+
+        Cached solutions are keyed in the base frame, but an approach's
+        answer depends on where it believes the base is, so the cache is
+        invalidated when this robot's base actually moves.
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        position = np.asarray(position, dtype=float)
+        orientation = np.asarray(orientation, dtype=float)
+
+        if self.ik_cache is not None and self._base_pose_set:
+            tolerances = self.ik_cache.config
+            moved = (
+                np.max(np.abs(position - self.base_position)) > tolerances.position_tolerance
+                or abs(abs(np.dot(orientation, self.base_orientation)) - 1.0) > tolerances.orientation_tolerance
+            )
+            if moved:
+                self.ik_cache.invalidate("robot base moved")
+
+        self.base_position = position
+        self.base_orientation = orientation
+        self._base_pose_set = True
+
+        for approach in self.approaches.values():
+            if hasattr(approach, "set_robot_base_pose"):
+                approach.set_robot_base_pose(position, orientation)
+
     def get_approach(self, name: str) -> Optional[MotionApproach]:
         """Get a registered approach by name.
 
@@ -114,16 +164,39 @@ class MotionDispatcher:
             f"Registered: {registered}"
         )
 
+    def get_trajectory_generator(self, approach_name: str) -> Optional[TrajectoryGenerator]:
+        """Get the trajectory generator paired with an approach.
+
+        Args:
+            approach_name: Approach name
+
+        Returns:
+            TrajectoryGenerator for the approach's trajectory_generator profile,
+            or None if the approach is not paired with one
+        """
+        approach_config = self.config.get_approach_config(approach_name)
+        if approach_config is None or not approach_config.trajectory_generator:
+            return None
+
+        profile = approach_config.trajectory_generator
+        generator = self.trajectory_generators.get(profile)
+        if generator is None:
+            generator = TrajectoryGenerator(self.config.trajectory, profile)
+            self.trajectory_generators[profile] = generator
+        return generator
+
     def validate_capabilities(
         self,
         approach: MotionApproach,
         required: MotionCapability,
+        paired: MotionCapability = MotionCapability.NONE,
     ):
         """Validate that approach has required capabilities.
 
         Args:
             approach: The approach to validate
             required: Required capabilities
+            paired: Capabilities added by a paired trajectory generator
 
         Raises:
             CapabilityError: If approach is missing required capabilities
@@ -131,10 +204,36 @@ class MotionDispatcher:
         if required == MotionCapability.NONE:
             return
 
-        available = approach.capabilities()
-        if not approach.has_capability(required):
+        available = approach.capabilities() | paired
+        if (required & available) != required:
             raise CapabilityError(required=required, available=available)
 
+    def plan_trajectories(
+        self,
+        start_joint_positions: np.ndarray,
+        goal_joint_positions: np.ndarray,
+        approach: str = None,
+    ) -> Optional[list[JointTrajectory]]:
+        """Time-parameterize joint-space moves with an approach's trajectory generator.
+
+        Args:
+            start_joint_positions: (R, num_joints) start joint positions
+            goal_joint_positions: (R, num_joints) goal joint positions
+            approach: Approach whose generator to use, or None for default
+
+        Returns:
+            One JointTrajectory per row, or None if the approach is not paired
+            with a trajectory generator
+        """
+        approach_name, _ = self.resolve_approach(approach)
+        generator = self.get_trajectory_generator(approach_name)
+        if generator is None:
+            return None
+
+        starts = np.asarray(start_joint_positions, dtype=float)
+        goals = np.asarray(goal_joint_positions, dtype=float)
+        return generator.generate_batch(np.stack([starts, goals], axis=1))
+
     def compute_motion(
         self,
         target_position: np.ndarray,
@@ -142,6 +241,8 @@ class MotionDispatcher:
         approach: str = None,
         linear_path: bool = False,
         collision_check: bool = False,
+        use_cache: bool = True,
+        start_joint_positions: np.ndarray = None,
         **kwargs,
     ) -> MotionResult:
         """Compute motion to reach target pose.
@@ -154,6 +255,11 @@ class MotionDispatcher:
             approach: Explicit approach name, or None for default
             linear_path: If True, requires LINEAR_CARTESIAN capability
             collision_check: If True, requires COLLISION_AWARE capability
+            use_cache: If False, bypass the IK cache for this request
+            start_joint_positions: Current joint positions; passed to the
+                approach (planners start from here), and when the approach is
+                paired with a trajectory generator, the result includes a
+                trajectory from here to the IK solution
             **kwargs: Additional parameters passed to the approach
 
         Returns:
@@ -175,14 +281,159 @@ class MotionDispatcher:
             required |= MotionCapability.COLLISION_AWARE
 
         # Validate capabilities (strict mode - fail if missing)
-        self.validate_capabilities(approach_instance, required)
+        generator = self.get_trajectory_generator(approach_name)
+        paired = generator.capabilities() if generator is not None else MotionCapability.NONE
+        self.validate_capabilities(approach_instance, required, paired)
+
+        # Only plain IK results are cached; trajectories depend on the start state
+        # and are generated after the lookup, and collision-aware approaches
+        # also depend on the obstacles. "closest_to_current" solutions are keyed
+        # on the start joints and not cached without them.
+        cache_key = None
+        result = None
+        solution_preference = kwargs.get("solution_preference", "closest_to_current")
+        planner = MotionCapability.COLLISION_AWARE in approach_instance.capabilities()
+        seeded = solution_preference != "closest_to_current" or start_joint_positions is not None
+        if use_cache and self.ik_cache is not None and required == MotionCapability.IK and not planner and seeded:
+            cache_key = self.ik_cache.make_key(
+                target_position,
+                target_orientation,
+                self.base_position,
+                self.base_orientation,
+                solution_preference=solution_preference,
+                approach=approach_name,
+                seed_joint_positions=start_joint_positions,
+            )
+            joint_positions = self.ik_cache.get(cache_key)
+            if joint_positions is not None:
+                result = MotionResult(success=True, joint_positions=joint_positions)
+
+        if result is None:
+            # Dispatch to approach
+            result = approach_instance.compute_motion(
+                target_position=target_position,
+                target_orientation=target_orientation,
+                start_joint_positions=start_joint_positions,
+                **kwargs,
+            )
+            if cache_key is not None and result.success and result.joint_positions is not None and result.trajectory is None:
+                self.ik_cache.put(cache_key, result.joint_positions)
+
+        if (
+            generator is not None
+            and start_joint_positions is not None
+            and result.success
+            and result.trajectory is None
+            and result.joint_positions is not None
+        ):
+            result.trajectory = generator.generate(np.asarray(start_joint_positions, dtype=float), result.joint_positions)
+        return result
+
+    def compute_motion_batch(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        approach: str = None,
+        use_cache: bool = True,
+        start_joint_positions: np.ndarray = None,
+        base_positions: np.ndarray = None,
+        base_orientations: np.ndarray = None,
+        target_kwargs: dict = None,
+        **kwargs,
+    ) -> list[MotionResult]:
+        """Compute IK for many target poses in one call.
 
-        # Dispatch to approach
-        return approach_instance.compute_motion(
-            target_position=target_position,
-            target_orientation=target_orientation,
-            **kwargs,
-        )
+        Targets found in the IK cache are answered directly; the rest are
+        handed to the approach as one batch and successful solutions are
+        stored in the cache.
+
+        Args:
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target orientation quaternions [w, x, y, z]
+            approach: Explicit approach name, or None for default
+            use_cache: If False, bypass the IK cache for this batch
+            start_joint_positions: (N, num_joints) or (num_joints,) start joint
+                positions; when given and the approach is paired with a
+                trajectory generator, successful results include trajectories
+                generated in one vectorized call
+            base_positions: (N, 3) base position of each target's robot, for
+                batches spanning several robots (default: this dispatcher's base)
+            base_orientations: (N, 4) base orientation of each target's robot
+            target_kwargs: Parameters with one entry per target (e.g., rows),
+                passed to the approach for the targets missing from the cache
+            **kwargs: Additional parameters passed to the approach
+
+        Returns:
+            One MotionResult per target, in input order; targets that fail IK
+            have success=False and an error_message
+
+        Raises:
+            ValueError: If no valid approach can be resolved
+            CapabilityError: If the approach does not provide IK
+        """
+        approach_name, approach_instance = self.resolve_approach(approach)
+        self.validate_capabilities(approach_instance, MotionCapability.IK)
+
+        target_positions = np.asarray(target_positions, dtype=float).reshape(-1, 3)
+        target_orientations = np.asarray(target_orientations, dtype=float).reshape(-1, 4)
+        results: list[Optional[MotionResult]] = [None] * len(target_positions)
+
+        if base_positions is None:
+            base_positions = np.broadcast_to(self.base_position, target_positions.shape)
+        if base_orientations is None:
+            base_orientations = np.broadcast_to(self.base_orientation, target_orientations.shape)
+
+        cache_keys = [None] * len(target_positions)
+        solution_preference = kwargs.get("solution_preference", "closest_to_current")
+        planner = MotionCapability.COLLISION_AWARE in approach_instance.capabilities()
+        seeded = solution_preference != "closest_to_current" or start_joint_positions is not None
+        if use_cache and self.ik_cache is not None and not planner and seeded:
+            seeds = [None] * len(target_positions)
+            if start_joint_positions is not None:
+                starts = np.asarray(start_joint_positions, dtype=float)
+                seeds = starts if starts.ndim == 2 else [starts] * len(target_positions)
+            for i in range(len(target_positions)):
+                cache_keys[i] = self.ik_cache.make_key(
+                    target_positions[i],
+                    target_orientations[i],
+                    base_positions[i],
+                    base_orientations[i],
+                    solution_preference=solution_preference,
+                    approach=approach_name,
+                    seed_joint_positions=seeds[i],
+                )
+                joint_positions = self.ik_cache.get(cache_keys[i])
+                if joint_positions is not None:
+                    results[i] = MotionResult(success=True, joint_positions=joint_positions)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            pending_kwargs = {name: np.asarray(values)[pending] for name, values in (target_kwargs or {}).items()}
+            solved = approach_instance.compute_motion_batch(
+                target_positions[pending],
+                target_orientations[pending],
+                **pending_kwargs,
+                **kwargs,
+            )
+            for i, result in zip(pending, solved):
+                results[i] = result
+                if cache_keys[i] is not None and result.success and result.joint_positions is not None:
+                    self.ik_cache.put(cache_keys[i], result.joint_positions)
+
+        generator = self.get_trajectory_generator(approach_name)
+        if generator is not None and start_joint_positions is not None:
+            planned = [
+                i for i, result in enumerate(results)
+                if result.success and result.trajectory is None and result.joint_positions is not None
+            ]
+            if planned:
+                goals = np.stack([results[i].joint_positions for i in planned])
+                starts = np.broadcast_to(np.asarray(start_joint_positions, dtype=float), (len(results), goals.shape[-1]))
+                trajectories = generator.generate_batch(np.stack([starts[planned], goals], axis=1))
+                for i, trajectory in zip(planned, trajectories):
+                    results[i].trajectory = trajectory
+
+        return results
 
     def reset(self, approach: str = None):
         """Reset approach state.
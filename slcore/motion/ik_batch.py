@@ -0,0 +1,183 @@
+"""Per-frame batching of IK requests across environments.
+
+Robots of the same model submit their goto_pose IK requests to a shared
+IKBatchQueue instead of solving them on the spot. Once per frame,
+update_handlers() flushes every queue: each queue hands its pending requests
+to its dispatcher's compute_motion_batch in one call per (approach,
+solution preference), and the results are picked up by the robots on the
+next frame.
+
+Example:
+    queue = get_ik_batch_queue("pf400")
+    request = queue.submit(position, orientation, row=3, base_pose=(base_pos, base_rot))
+    ...
+    flush_ik_batch_queues()  # once per frame
+    if request.done:
+        result = request.result
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from slcore.motion.base import CapabilityError, MotionResult
+from slcore.motion.dispatcher import MotionDispatcher
+
+
+@dataclass
+class IKRequest:
+    """A queued IK request and, once the queue is flushed, its result.
+
+    Attributes:
+        target_position: Target position [x, y, z] in world frame
+        target_orientation: Target orientation quaternion [w, x, y, z]
+        row: Row of the robot in the approach's shared view
+        base_position: Robot base position in world frame (IK cache key)
+        base_orientation: Robot base orientation [w, x, y, z] (IK cache key)
+        approach: Approach name, or None for the dispatcher default
+        solution_preference: "closest_to_current" or "closest_to_home"
+        start_joint_positions: Current joints, for paired trajectory generation
+        result: MotionResult, set when the queue is flushed
+    """
+
+    target_position: np.ndarray
+    target_orientation: np.ndarray
+    row: int
+    base_position: np.ndarray
+    base_orientation: np.ndarray
+    approach: Optional[str] = None
+    solution_preference: str = "closest_to_current"
+    start_joint_positions: Optional[np.ndarray] = None
+    result: Optional[MotionResult] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the request has been solved."""
+        return self.result is not None
+
+
+class IKBatchQueue:
+    """Collects IK requests from all robots of a model and solves them together.
+
+    Attributes:
+        dispatcher: Dispatcher whose approaches accept a rows keyword
+            (e.g., BatchedDifferentialIKApproach without a bound robot)
+    """
+
+    def __init__(self):
+        """Initialize an empty queue without a dispatcher."""
+        self.dispatcher: Optional[MotionDispatcher] = None
+        self._pending: list[IKRequest] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        row: int,
+        base_pose: tuple[np.ndarray, np.ndarray],
+        approach: str = None,
+        solution_preference: str = "closest_to_current",
+        start_joint_positions: np.ndarray = None,
+    ) -> IKRequest:
+        """Queue an IK request for the next flush.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame
+            target_orientation: Target orientation quaternion [w, x, y, z]
+            row: Row of the robot in the approach's shared view
+            base_pose: (position, orientation) of the robot base in world frame
+            approach: Approach name, or None for the dispatcher default
+            solution_preference: "closest_to_current" or "closest_to_home"
+            start_joint_positions: Current joints, for paired trajectory generation
+
+        Returns:
+            IKRequest whose result is set by the next flush()
+        """
+        request = IKRequest(
+            target_position=np.asarray(target_position, dtype=float),
+            target_orientation=np.asarray(target_orientation, dtype=float),
+            row=row,
+            base_position=np.asarray(base_pose[0], dtype=float),
+            base_orientation=np.asarray(base_pose[1], dtype=float),
+            approach=approach,
+            solution_preference=solution_preference,
+            start_joint_positions=start_joint_positions,
+        )
+        with self._lock:
+            self._pending.append(request)
+        return request
+
+    def flush(self) -> int:
+        """Solve every pending request, one dispatcher call per (approach, preference).
+
+        Requests that cannot be dispatched (unknown approach, missing
+        capability) get an unsuccessful result instead of raising.
+
+        Returns:
+            Number of requests solved
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        groups: dict[tuple, list[IKRequest]] = {}
+        for request in pending:
+            groups.setdefault((request.approach, request.solution_preference), []).append(request)
+
+        for (approach, solution_preference), requests in groups.items():
+            starts = None
+            if all(request.start_joint_positions is not None for request in requests):
+                starts = np.stack([request.start_joint_positions for request in requests])
+
+            try:
+                results = self.dispatcher.compute_motion_batch(
+                    np.stack([request.target_position for request in requests]),
+                    np.stack([request.target_orientation for request in requests]),
+                    approach=approach,
+                    start_joint_positions=starts,
+                    base_positions=np.stack([request.base_position for request in requests]),
+                    base_orientations=np.stack([request.base_orientation for request in requests]),
+                    target_kwargs={"rows": np.array([request.row for request in requests])},
+                    solution_preference=solution_preference,
+                )
+            except (CapabilityError, ValueError, KeyError) as e:
+                results = [MotionResult(success=False, error_message=str(e))] * len(requests)
+
+            for request, result in zip(requests, results):
+                request.result = result
+        return len(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+_ik_batch_queues: dict[str, IKBatchQueue] = {}
+
+
+def get_ik_batch_queue(robot_model: str) -> IKBatchQueue:
+    """Get the IK batch queue shared by all robots of one model.
+
+    Args:
+        robot_model: Robot model name (e.g., "pf400")
+
+    Returns:
+        IKBatchQueue for the robot model
+    """
+    queue = _ik_batch_queues.get(robot_model)
+    if queue is None:
+        queue = IKBatchQueue()
+        _ik_batch_queues[robot_model] = queue
+    return queue
+
+
+def flush_ik_batch_queues() -> int:
+    """Solve the pending requests of every IK batch queue (once per frame).
+
+    Returns:
+        Total number of requests solved
+    """
+    return sum(queue.flush() for queue in _ik_batch_queues.values() if queue.dispatcher is not None)
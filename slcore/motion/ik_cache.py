@@ -0,0 +1,218 @@
+"""IK solution cache for repeated target poses.
+
+Workflows send a robot to the same handful of poses (home, staging, nests and
+their hovers) over and over. IKCache stores the joint positions computed for
+a target pose so repeated requests skip the solver entirely.
+
+Keys are built from the target pose expressed in the robot base frame, so
+every environment running the same robot model shares one cache: env_3
+reaching its staging location hits the entry env_0 computed. Positions and
+quaternions are quantized to a configurable grid, and the key also includes
+the solution preference and approach name. "closest_to_current" solutions
+depend on where the robot starts (e.g., which elbow branch is nearer), so
+their keys also include the quantized start joints; robots starting from
+different configurations never share those entries.
+
+Example:
+    cache = get_ik_cache("pf400", IKCacheConfig(max_entries=512))
+    dispatcher = MotionDispatcher(config, ik_cache=cache)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.motion.config import IKCacheConfig
+
+
+class IKCache:
+    """LRU cache from quantized base-frame target poses to joint positions.
+
+    The cache is shared by every robot of one model, so lookups and inserts
+    go through a lock. Cached entries become invalid when the IK
+    configuration changes (see validate_config()) or a robot base moves
+    (see MotionDispatcher.set_robot_base_pose()).
+
+    Attributes:
+        config: Cache configuration
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that required solving
+        evictions: Number of entries dropped to stay within max_entries
+        invalidations: Number of times the cache was cleared
+    """
+
+    def __init__(self, config: IKCacheConfig = None):
+        """Initialize an empty cache.
+
+        Args:
+            config: Cache configuration (default: IKCacheConfig())
+        """
+        self.config = config or IKCacheConfig()
+        self._entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._config_fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def make_key(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        base_position: np.ndarray = None,
+        base_orientation: np.ndarray = None,
+        solution_preference: str = "closest_to_current",
+        approach: str = None,
+        seed_joint_positions: np.ndarray = None,
+    ) -> tuple:
+        """Build the cache key for a target pose.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame
+            target_orientation: Target orientation quaternion [w, x, y, z] in world frame
+            base_position: Robot base position [x, y, z] in world frame (default: origin)
+            base_orientation: Robot base quaternion [w, x, y, z] (default: identity)
+            solution_preference: IK solution preference of the request
+            approach: Name of the approach that solves the request
+            seed_joint_positions: Start joints the solution is chosen closest
+                to (only part of the key for "closest_to_current")
+
+        Returns:
+            Hashable key
+        """
+        target_pose = pose_math.make_poses(target_position, target_orientation)
+        if base_position is not None:
+            base_pose = pose_math.make_poses(base_position, base_orientation)
+            target_pose = pose_math.relative_poses(base_pose, target_pose)
+
+        position, orientation = pose_math.split_poses(target_pose)
+        orientation = pose_math.quat_normalize(orientation)
+
+        # q and -q are the same rotation; make the first non-negligible component positive
+        leading = orientation[np.abs(orientation) > 0.5 * self.config.orientation_tolerance]
+        if leading.size and leading[0] < 0:
+            orientation = -orientation
+
+        position_bins = np.round(position / self.config.position_tolerance).astype(np.int64)
+        orientation_bins = np.round(orientation / self.config.orientation_tolerance).astype(np.int64)
+
+        seed_bins = None
+        if solution_preference == "closest_to_current" and seed_joint_positions is not None:
+            seed = np.asarray(seed_joint_positions, dtype=float)
+            seed_bins = tuple(np.round(seed / self.config.seed_tolerance).astype(np.int64).tolist())
+
+        return (
+            tuple(position_bins.tolist()),
+            tuple(orientation_bins.tolist()),
+            solution_preference,
+            approach,
+            seed_bins,
+        )
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        """Look up cached joint positions and mark the entry as recently used.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Copy of the cached joint positions, or None on a miss
+        """
+        with self._lock:
+            joint_positions = self._entries.get(key)
+            if joint_positions is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return joint_positions.copy()
+
+    def put(self, key: tuple, joint_positions: np.ndarray):
+        """Store joint positions, evicting the least recently used entries if full.
+
+        Args:
+            key: Key from make_key()
+            joint_positions: Solved joint positions
+        """
+        with self._lock:
+            self._entries[key] = np.array(joint_positions, dtype=float)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, reason: str = None):
+        """Drop all cached solutions.
+
+        Args:
+            reason: Why the cache is cleared (logged)
+        """
+        with self._lock:
+            if self._entries:
+                print(f"IK cache invalidated ({len(self._entries)} entries){f': {reason}' if reason else ''}")
+            self._entries.clear()
+            self.invalidations += 1
+
+    def validate_config(self, fingerprint: str):
+        """Clear the cache if the IK configuration differs from the cached one.
+
+        Args:
+            fingerprint: String identifying the IK configuration (e.g., repr of
+                the approach config dataclasses)
+        """
+        if fingerprint == self._config_fingerprint:
+            return
+        if self._config_fingerprint is not None:
+            self.invalidate("IK configuration changed")
+        self._config_fingerprint = fingerprint
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with size, max_entries, hits, misses, hit_rate, evictions and invalidations
+        """
+        return {
+            "size": len(self._entries),
+            "max_entries": self.config.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_ik_caches: dict[str, IKCache] = {}
+
+
+def get_ik_cache(robot_model: str, config: IKCacheConfig = None) -> IKCache:
+    """Get the IK cache shared by all robots of one model.
+
+    Args:
+        robot_model: Robot model name (e.g., "pf400")
+        config: Cache configuration, used when the cache is first created
+
+    Returns:
+        IKCache for the robot model
+    """
+    cache = _ik_caches.get(robot_model)
+    if cache is None:
+        cache = IKCache(config)
+        _ik_caches[robot_model] = cache
+    return cache
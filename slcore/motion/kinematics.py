@@ -0,0 +1,746 @@
+"""Kinematic chains loaded from URDF, with NumPy FK, Jacobians and iterative IK.
+
+KinematicChain models the serial chain from a base link to an end-effector
+link. Forward kinematics and geometric Jacobians run on the CPU and are
+vectorized over leading batch dimensions of the joint positions, so one call
+can evaluate a single configuration or one configuration per environment.
+
+solve_ik() repeats damped least-squares (or pseudo-inverse) steps against the
+chain until every target is within tolerance, instead of taking one step from
+the current simulator Jacobian. It needs neither a GPU nor a running
+simulation.
+
+ScaraKinematics solves SCARA arms on a vertical lift (e.g., the PF400) in
+closed form, returning every elbow configuration for a target.
+
+Poses use the [x, y, z, qw, qx, qy, qz] layout of slcore.common.pose_math and
+are expressed in the robot base frame.
+
+Example:
+    chain = KinematicChain.from_urdf("PF400.urdf", end_effector_link="pointer")
+    pose = chain.forward_kinematics(np.zeros(chain.num_joints))
+    solution = solve_ik(chain, pose, seeds=np.full(chain.num_joints, 0.1))
+"""
+
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.robots.common.config import SCARA_JOINTS, AnalyticalIKConfig
+
+
+MOVABLE_JOINT_TYPES = ("revolute", "continuous", "prismatic")
+SUPPORTED_JOINT_TYPES = MOVABLE_JOINT_TYPES + ("fixed",)
+
+
+@dataclass
+class ChainJoint:
+    """One joint of a kinematic chain.
+
+    Attributes:
+        name: Joint name (matches the articulation joint name)
+        joint_type: "revolute", "continuous", "prismatic" or "fixed"
+        origin: 4x4 transform from the parent link to the joint frame
+        axis: Unit joint axis in the joint frame
+        lower: Lower position limit (-inf if unlimited)
+        upper: Upper position limit (inf if unlimited)
+    """
+
+    name: str
+    joint_type: str
+    origin: np.ndarray
+    axis: np.ndarray
+    lower: float = -np.inf
+    upper: float = np.inf
+
+    @property
+    def is_movable(self) -> bool:
+        return self.joint_type in MOVABLE_JOINT_TYPES
+
+
+def rpy_to_matrix(rpy) -> np.ndarray:
+    """Convert URDF roll/pitch/yaw (fixed XYZ axes) to a rotation matrix.
+
+    Args:
+        rpy: [roll, pitch, yaw] in radians
+
+    Returns:
+        3x3 rotation matrix Rz(yaw) @ Ry(pitch) @ Rx(roll)
+    """
+    roll, pitch, yaw = rpy
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    return np.array([
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr],
+    ])
+
+
+def axis_angle_matrices(axis: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Rotation matrices about a fixed axis for a batch of angles.
+
+    Args:
+        axis: Unit rotation axis (3,)
+        angles: (...) angles in radians
+
+    Returns:
+        (..., 3, 3) rotation matrices (Rodrigues' formula)
+    """
+    x, y, z = axis
+    skew = np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+    angles = np.asarray(angles, dtype=float)[..., None, None]
+    return np.eye(3) + np.sin(angles) * skew + (1.0 - np.cos(angles)) * (skew @ skew)
+
+
+def _parse_floats(text: str, default) -> np.ndarray:
+    if text is None:
+        return np.array(default, dtype=float)
+    return np.array([float(value) for value in text.split()], dtype=float)
+
+
+class KinematicChain:
+    """Serial kinematic chain from a base link to an end-effector link.
+
+    Attributes:
+        joints: Chain joints from base to end effector, including fixed joints
+        joint_names: Names of the movable joints, in chain order
+        base_link: Name of the base link
+        end_effector_link: Name of the end-effector link
+    """
+
+    def __init__(self, joints: list[ChainJoint], base_link: str, end_effector_link: str):
+        """Initialize a chain from its joints.
+
+        Args:
+            joints: Chain joints from base to end effector
+            base_link: Name of the base link
+            end_effector_link: Name of the end-effector link
+        """
+        self.joints = joints
+        self.base_link = base_link
+        self.end_effector_link = end_effector_link
+
+        movable = [joint for joint in joints if joint.is_movable]
+        self.joint_names = [joint.name for joint in movable]
+        self.lower_limits = np.array([joint.lower for joint in movable])
+        self.upper_limits = np.array([joint.upper for joint in movable])
+
+    @property
+    def num_joints(self) -> int:
+        """Number of movable joints."""
+        return len(self.joint_names)
+
+    @classmethod
+    def from_urdf(cls, urdf_path, end_effector_link: str, base_link: str = None) -> "KinematicChain":
+        """Load the chain between two links of a URDF file.
+
+        Args:
+            urdf_path: Path to the URDF file
+            end_effector_link: Link at the tip of the chain
+            base_link: Link at the root of the chain (default: the URDF root link)
+
+        Returns:
+            KinematicChain
+
+        Raises:
+            ValueError: If a link is missing, the links are not connected, or
+                the chain contains an unsupported joint type
+        """
+        root = ElementTree.parse(Path(urdf_path)).getroot()
+
+        joints_by_child = {}
+        for element in root.findall("joint"):
+            joints_by_child[element.find("child").get("link")] = element
+
+        links = {element.get("name") for element in root.findall("link")}
+        if end_effector_link not in links:
+            raise ValueError(f"Link '{end_effector_link}' not found in {urdf_path}")
+        if base_link is not None and base_link not in links:
+            raise ValueError(f"Link '{base_link}' not found in {urdf_path}")
+
+        # Walk from the end effector up to the base link (or the root)
+        elements = []
+        link = end_effector_link
+        while link != base_link and link in joints_by_child:
+            element = joints_by_child[link]
+            elements.append(element)
+            link = element.find("parent").get("link")
+
+        if base_link is None:
+            base_link = link
+        elif link != base_link:
+            raise ValueError(f"Link '{end_effector_link}' is not a descendant of '{base_link}' in {urdf_path}")
+
+        joints = []
+        for element in reversed(elements):
+            joint_type = element.get("type")
+            if joint_type not in SUPPORTED_JOINT_TYPES:
+                raise ValueError(f"Joint '{element.get('name')}' has unsupported type '{joint_type}'")
+
+            origin_element = element.find("origin")
+            xyz = _parse_floats(None if origin_element is None else origin_element.get("xyz"), [0.0, 0.0, 0.0])
+            rpy = _parse_floats(None if origin_element is None else origin_element.get("rpy"), [0.0, 0.0, 0.0])
+            origin = np.eye(4)
+            origin[:3, :3] = rpy_to_matrix(rpy)
+            origin[:3, 3] = xyz
+
+            axis_element = element.find("axis")
+            axis = _parse_floats(None if axis_element is None else axis_element.get("xyz"), [1.0, 0.0, 0.0])
+            axis = axis / np.linalg.norm(axis)
+
+            lower, upper = -np.inf, np.inf
+            limit_element = element.find("limit")
+            if limit_element is not None and joint_type in ("revolute", "prismatic"):
+                lower = float(limit_element.get("lower", -np.inf))
+                upper = float(limit_element.get("upper", np.inf))
+
+            joints.append(ChainJoint(element.get("name"), joint_type, origin, axis, lower, upper))
+
+        return cls(joints, base_link, end_effector_link)
+
+    def _joint_transforms(self, joint_positions: np.ndarray):
+        """Walk the chain, yielding world-from-joint frames and the tip transform.
+
+        Args:
+            joint_positions: (..., num_joints) joint positions
+
+        Returns:
+            Tuple of (list of (..., 4, 4) frames of the movable joints before
+            their motion is applied, (..., 4, 4) end-effector transform)
+        """
+        joint_positions = np.asarray(joint_positions, dtype=float)
+        batch_shape = joint_positions.shape[:-1]
+        transform = np.broadcast_to(np.eye(4), batch_shape + (4, 4)).copy()
+
+        frames = []
+        index = 0
+        for joint in self.joints:
+            transform = transform @ joint.origin
+            if not joint.is_movable:
+                continue
+
+            frames.append(transform)
+            position = joint_positions[..., index]
+            motion = np.broadcast_to(np.eye(4), batch_shape + (4, 4)).copy()
+            if joint.joint_type == "prismatic":
+                motion[..., :3, 3] = position[..., None] * joint.axis
+            else:
+                motion[..., :3, :3] = axis_angle_matrices(joint.axis, position)
+            transform = transform @ motion
+            index += 1
+
+        return frames, transform
+
+    def forward_kinematics(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Compute end-effector poses in the base-link frame.
+
+        Args:
+            joint_positions: (..., num_joints) joint positions
+
+        Returns:
+            (..., 7) end-effector poses
+        """
+        _, transform = self._joint_transforms(joint_positions)
+        return pose_math.matrices_to_poses(transform)
+
+    def jacobian(self, joint_positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute geometric Jacobians of the end effector in the base-link frame.
+
+        Args:
+            joint_positions: (..., num_joints) joint positions
+
+        Returns:
+            Tuple of ((..., 6, num_joints) Jacobians with linear rows first,
+            (..., 7) end-effector poses)
+        """
+        frames, transform = self._joint_transforms(joint_positions)
+        tip = transform[..., :3, 3]
+
+        columns = []
+        movable = [joint for joint in self.joints if joint.is_movable]
+        for joint, frame in zip(movable, frames):
+            axis = frame[..., :3, :3] @ joint.axis
+            if joint.joint_type == "prismatic":
+                columns.append(np.concatenate([axis, np.zeros_like(axis)], axis=-1))
+            else:
+                linear = np.cross(axis, tip - frame[..., :3, 3])
+                columns.append(np.concatenate([linear, axis], axis=-1))
+
+        return np.stack(columns, axis=-1), pose_math.matrices_to_poses(transform)
+
+    def clamp_to_limits(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Clamp joint positions to the chain's joint limits.
+
+        Args:
+            joint_positions: (..., num_joints) joint positions
+
+        Returns:
+            (..., num_joints) clamped joint positions
+        """
+        return np.clip(joint_positions, self.lower_limits, self.upper_limits)
+
+
+def pose_errors(current_poses: np.ndarray, target_poses: np.ndarray) -> np.ndarray:
+    """Compute 6D pose errors (position difference and rotation vector).
+
+    Args:
+        current_poses: (..., 7) current poses
+        target_poses: (..., 7) target poses in the same frame
+
+    Returns:
+        (..., 6) errors [dx, dy, dz, rx, ry, rz], rotation as axis * angle
+    """
+    current_positions, current_quats = pose_math.split_poses(current_poses)
+    target_positions, target_quats = pose_math.split_poses(target_poses)
+
+    error_quats = pose_math.quat_multiply(target_quats, pose_math.quat_conjugate(current_quats))
+    error_quats = np.where(error_quats[..., :1] < 0, -error_quats, error_quats)
+    vector = error_quats[..., 1:]
+    sin_half = np.linalg.norm(vector, axis=-1, keepdims=True)
+    angle = 2.0 * np.arctan2(sin_half, error_quats[..., :1])
+    # angle / sin(angle / 2) -> 2 as the rotation vanishes
+    scale = np.where(sin_half > 1e-9, angle / np.maximum(sin_half, 1e-9), 2.0)
+
+    return np.concatenate([target_positions - current_positions, vector * scale], axis=-1)
+
+
+def differential_ik_step(
+    jacobians: np.ndarray,
+    errors: np.ndarray,
+    ik_method: str = "dls",
+    lambda_val: float = 0.01,
+) -> np.ndarray:
+    """Compute one differential IK joint update for a batch of robots.
+
+    Args:
+        jacobians: (..., 6, n) end-effector Jacobians
+        errors: (..., 6) pose errors in the Jacobian's frame
+        ik_method: "dls" (damped least-squares), "pinv"/"svd" (pseudo-inverse)
+            or "trans" (Jacobian transpose)
+        lambda_val: Damping for "dls"
+
+    Returns:
+        (..., n) joint position deltas
+    """
+    jacobian_t = np.swapaxes(jacobians, -1, -2)
+    if ik_method == "dls":
+        damping = (lambda_val ** 2) * np.eye(6)
+        delta = jacobian_t @ np.linalg.solve(jacobians @ jacobian_t + damping, errors[..., None])
+    elif ik_method == "trans":
+        delta = jacobian_t @ errors[..., None]
+    else:
+        delta = np.linalg.pinv(jacobians) @ errors[..., None]
+    return delta[..., 0]
+
+
+@dataclass
+class IKSolution:
+    """Result of solve_ik() for a batch of targets.
+
+    Attributes:
+        joint_positions: (..., num_joints) solved joint positions
+        converged: (...) True where both tolerances were met
+        iterations: (...) Iterations used per target
+        position_error: (...) Final position error (meters)
+        orientation_error: (...) Final orientation error (radians)
+    """
+
+    joint_positions: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    position_error: np.ndarray
+    orientation_error: np.ndarray
+
+
+def solve_ik(
+    chain: KinematicChain,
+    target_poses: np.ndarray,
+    seeds: np.ndarray,
+    ik_method: str = "dls",
+    lambda_val: float = 0.05,
+    position_tolerance: float = 0.001,
+    orientation_tolerance: float = 0.01,
+    max_iterations: int = 100,
+    max_step: float = 0.2,
+) -> IKSolution:
+    """Iterate differential IK steps until each target is within tolerance.
+
+    Targets are solved together; a target stops updating once it converges,
+    and the loop ends when all targets converged or max_iterations is reached.
+
+    Args:
+        chain: Kinematic chain
+        target_poses: (..., 7) target end-effector poses in the base-link frame
+        seeds: (..., num_joints) initial joint positions
+        ik_method: "dls" (damped least-squares), "pinv"/"svd" (pseudo-inverse)
+            or "trans" (Jacobian transpose)
+        lambda_val: Damping factor for "dls"
+        position_tolerance: Convergence tolerance on position (meters)
+        orientation_tolerance: Convergence tolerance on orientation (radians)
+        max_iterations: Maximum number of steps
+        max_step: Largest joint change per step (radians or meters)
+
+    Returns:
+        IKSolution with the same batch shape as the inputs
+
+    Raises:
+        ValueError: If ik_method is unknown
+    """
+    if ik_method not in ("dls", "pinv", "svd", "trans"):
+        raise ValueError(f"Unknown IK method '{ik_method}', expected 'dls', 'pinv', 'svd' or 'trans'")
+
+    target_poses = np.asarray(target_poses, dtype=float)
+    seeds = np.asarray(seeds, dtype=float)
+    batch_shape = np.broadcast_shapes(target_poses.shape[:-1], seeds.shape[:-1])
+
+    # Flatten the batch so per-target bookkeeping is one-dimensional
+    targets = np.broadcast_to(target_poses, batch_shape + (7,)).reshape(-1, 7)
+    joints = chain.clamp_to_limits(np.broadcast_to(seeds, batch_shape + (chain.num_joints,)).reshape(-1, chain.num_joints))
+    iterations = np.zeros(len(joints), dtype=int)
+    active = np.ones(len(joints), dtype=bool)
+
+    jacobians, poses = chain.jacobian(joints)
+    errors = pose_errors(poses, targets)
+    for _ in range(max_iterations):
+        position_error = np.linalg.norm(errors[:, :3], axis=-1)
+        orientation_error = np.linalg.norm(errors[:, 3:], axis=-1)
+        active &= (position_error > position_tolerance) | (orientation_error > orientation_tolerance)
+        if not active.any():
+            break
+
+        delta = differential_ik_step(jacobians[active], errors[active], ik_method, lambda_val)
+
+        # Limit the step so large moves do not overshoot into another branch
+        step_norm = np.max(np.abs(delta), axis=-1, keepdims=True)
+        delta = delta * np.minimum(1.0, max_step / np.maximum(step_norm, 1e-12))
+
+        joints[active] = chain.clamp_to_limits(joints[active] + delta)
+        iterations[active] += 1
+        jacobians[active], poses[active] = chain.jacobian(joints[active])
+        errors[active] = pose_errors(poses[active], targets[active])
+
+    position_error = np.linalg.norm(errors[:, :3], axis=-1)
+    orientation_error = np.linalg.norm(errors[:, 3:], axis=-1)
+    converged = (position_error <= position_tolerance) & (orientation_error <= orientation_tolerance)
+
+    return IKSolution(
+        joint_positions=joints.reshape(batch_shape + (chain.num_joints,)),
+        converged=converged.reshape(batch_shape),
+        iterations=iterations.reshape(batch_shape),
+        position_error=position_error.reshape(batch_shape),
+        orientation_error=orientation_error.reshape(batch_shape),
+    )
+
+
+def _wrap_near(angles: np.ndarray, references: np.ndarray, lower: float, upper: float) -> tuple[np.ndarray, np.ndarray]:
+    """Pick the 2*pi-equivalent of each angle that lies in limits, nearest a reference.
+
+    Args:
+        angles: (...) angles in radians
+        references: (...) angles to stay close to (e.g., seed joint positions)
+        lower: Lower joint limit
+        upper: Upper joint limit
+
+    Returns:
+        Tuple of ((...) wrapped angles, (...) True where some equivalent is within limits)
+    """
+    turns = np.round((references - angles) / (2.0 * np.pi))
+    candidates = angles[..., None] + 2.0 * np.pi * (turns[..., None] + np.array([-1.0, 0.0, 1.0]))
+    in_limits = (candidates >= lower) & (candidates <= upper)
+    distance = np.where(in_limits, np.abs(candidates - references[..., None]), np.inf)
+    best = np.argmin(distance, axis=-1)
+    wrapped = np.take_along_axis(candidates, best[..., None], axis=-1)[..., 0]
+    return wrapped, in_limits.any(axis=-1)
+
+
+class ScaraKinematics:
+    """Closed-form kinematics of a SCARA arm on a vertical lift and optional rail.
+
+    The end effector height is set by the lift alone and its yaw by the sum
+    of the shoulder, elbow and wrist angles, so each target pose has at most
+    two arm solutions (the two elbow configurations). The rail position is
+    redundant; inverse_kinematics() tries the seed rail position and a set
+    of candidates and keeps the one with the least overall joint motion.
+
+    All methods are vectorized over leading batch dimensions and work in the
+    robot base frame.
+
+    Attributes:
+        config: Analytical IK configuration
+        num_solutions: Number of solutions returned per target (elbow configurations)
+    """
+
+    num_solutions = 2
+
+    # Evenly spaced rail positions tried in addition to the analytic candidates
+    RAIL_SAMPLES = 9
+
+    # Fraction of the full reach kept clear of the annulus edges for rail candidates
+    REACH_MARGIN = 0.01
+
+    def __init__(self, config: AnalyticalIKConfig):
+        """Initialize from an analytical IK configuration.
+
+        Args:
+            config: Geometry, joint indices and limits of the arm
+        """
+        self.config = config
+        self.indices = dict(config.joint_indices)
+        self.limits = {joint: config.get_limits(joint) for joint in SCARA_JOINTS}
+
+        self.shoulder_offset = np.array(config.shoulder_offset, dtype=float)
+        rail_axis = np.array(config.rail_axis, dtype=float)
+        self.rail_axis = rail_axis / np.linalg.norm(rail_axis)
+        self.tool_offset = np.array(config.tool_offset, dtype=float)
+        self.tool_rotation = pose_math.quat_to_matrix(pose_math.quat_normalize(config.tool_orientation))
+
+    def _get_joint(self, joint_positions: np.ndarray, joint: str) -> np.ndarray:
+        index = self.indices.get(joint)
+        if index is None:
+            return np.zeros(joint_positions.shape[:-1])
+        return joint_positions[..., index]
+
+    def _rotate_z(self, yaw: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        cos_yaw, sin_yaw = np.cos(yaw), np.sin(yaw)
+        return np.stack([
+            cos_yaw * vectors[..., 0] - sin_yaw * vectors[..., 1],
+            sin_yaw * vectors[..., 0] + cos_yaw * vectors[..., 1],
+            np.broadcast_to(vectors[..., 2], np.shape(yaw)),
+        ], axis=-1)
+
+    def _arm_points(self, joint_positions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute shoulder, elbow and wrist axis positions and the tool yaw."""
+        joint_positions = np.asarray(joint_positions, dtype=float)
+        rail = self._get_joint(joint_positions, "rail")
+        lift = self._get_joint(joint_positions, "lift")
+        shoulder = self._get_joint(joint_positions, "shoulder")
+        elbow = self._get_joint(joint_positions, "elbow")
+        wrist = self._get_joint(joint_positions, "wrist")
+
+        upper_arm_angle = self.config.shoulder_zero_angle + shoulder
+        forearm_angle = upper_arm_angle + elbow
+        yaw = shoulder + elbow + wrist
+
+        zeros = np.zeros_like(upper_arm_angle)
+        shoulder_position = self.shoulder_offset + rail[..., None] * self.rail_axis
+        shoulder_position = shoulder_position + np.stack([zeros, zeros, lift], axis=-1)
+        elbow_position = shoulder_position + self.config.upper_arm_length * np.stack([
+            np.cos(upper_arm_angle), np.sin(upper_arm_angle), zeros,
+        ], axis=-1)
+        wrist_position = elbow_position + self.config.forearm_length * np.stack([
+            np.cos(forearm_angle), np.sin(forearm_angle), zeros,
+        ], axis=-1)
+        return shoulder_position, elbow_position, wrist_position, yaw
+
+    def forward_kinematics(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Compute end-effector poses in the base frame.
+
+        Args:
+            joint_positions: (..., num_joints) full joint vectors
+
+        Returns:
+            (..., 7) end-effector poses
+        """
+        _, _, wrist_position, yaw = self._arm_points(joint_positions)
+        positions = wrist_position + self._rotate_z(yaw, self.tool_offset)
+        yaw_rotations = axis_angle_matrices(np.array([0.0, 0.0, 1.0]), yaw)
+        return pose_math.make_poses(positions, pose_math.matrix_to_quat(yaw_rotations @ self.tool_rotation))
+
+    def link_points(self, joint_positions: np.ndarray) -> np.ndarray:
+        """Compute the points joined by the arm's links, for collision checking.
+
+        Consecutive points are the ends of the upper arm, forearm and tool
+        segments.
+
+        Args:
+            joint_positions: (..., num_joints) full joint vectors
+
+        Returns:
+            (..., 4, 3) shoulder, elbow, wrist and end-effector positions in the base frame
+        """
+        shoulder_position, elbow_position, wrist_position, yaw = self._arm_points(joint_positions)
+        tool_position = wrist_position + self._rotate_z(yaw, self.tool_offset)
+        return np.stack([shoulder_position, elbow_position, wrist_position, tool_position], axis=-2)
+
+    def to_chain(self) -> KinematicChain:
+        """Build the equivalent serial chain, for iterative solvers on the same model.
+
+        Chain joints are named after SCARA_JOINTS (the rail only if the arm
+        has one), so their positions map to the full joint vector through
+        config.joint_indices.
+
+        Returns:
+            KinematicChain whose forward kinematics match forward_kinematics()
+        """
+        z_axis = np.array([0.0, 0.0, 1.0])
+
+        def transform(rotation=np.eye(3), translation=(0.0, 0.0, 0.0)) -> np.ndarray:
+            matrix = np.eye(4)
+            matrix[:3, :3] = rotation
+            matrix[:3, 3] = translation
+            return matrix
+
+        def joint(name, joint_type, origin, axis=z_axis) -> ChainJoint:
+            lower, upper = self.limits[name]
+            return ChainJoint(name, joint_type, origin, axis, lower, upper)
+
+        zero_rotation = axis_angle_matrices(z_axis, self.config.shoulder_zero_angle)
+        joints = []
+        if self.indices.get("rail") is not None:
+            joints.append(joint("rail", "prismatic", transform(translation=self.shoulder_offset), self.rail_axis))
+            joints.append(joint("lift", "prismatic", transform()))
+        else:
+            joints.append(joint("lift", "prismatic", transform(translation=self.shoulder_offset)))
+        joints += [
+            joint("shoulder", "revolute", transform(zero_rotation)),
+            joint("elbow", "revolute", transform(translation=(self.config.upper_arm_length, 0.0, 0.0))),
+            joint("wrist", "revolute", transform(translation=(self.config.forearm_length, 0.0, 0.0))),
+            # Undo the shoulder zero angle: the tool yaw is the sum of the joint angles
+            ChainJoint("tool", "fixed", transform(zero_rotation.T) @ transform(self.tool_rotation, self.tool_offset), z_axis),
+        ]
+        return KinematicChain(joints, base_link="base", end_effector_link="tool")
+
+    def _rail_candidates(self, wrist_xy: np.ndarray, seed_rail: np.ndarray) -> np.ndarray:
+        """List rail positions worth trying for each target.
+
+        The seed comes first, followed by the rail positions where the wrist
+        enters or leaves the arm's reach annulus (the distance from shoulder
+        to wrist is a quadratic in the rail position), the rail limits and
+        evenly spaced samples between them, all clipped to the limits. The
+        annulus is shrunk by REACH_MARGIN so boundary candidates avoid the
+        singular fully stretched and fully folded arm.
+
+        Args:
+            wrist_xy: (N, 2) wrist axis positions
+            seed_rail: (N,) seed rail positions
+
+        Returns:
+            (N, C) candidate rail positions
+        """
+        lower, upper = self.limits["rail"]
+        reach_max = self.config.upper_arm_length + self.config.forearm_length
+        margin = self.REACH_MARGIN * reach_max
+        reach_min = abs(self.config.upper_arm_length - self.config.forearm_length) + margin
+        reach_max -= margin
+
+        offsets = wrist_xy - self.shoulder_offset[:2]
+        along = offsets @ self.rail_axis[:2]
+        across_sq = np.sum(offsets ** 2, axis=-1) - along ** 2
+        outer = np.sqrt(np.maximum(reach_max ** 2 - across_sq, 0.0))
+        inner = np.sqrt(np.maximum(reach_min ** 2 - across_sq, 0.0))
+
+        candidates = [seed_rail, along - outer, along + outer, along - inner, along + inner]
+        if np.isfinite(lower) and np.isfinite(upper):
+            for rail in np.linspace(lower, upper, self.RAIL_SAMPLES):
+                candidates.append(np.full_like(seed_rail, rail))
+        return np.clip(np.stack(candidates, axis=-1), lower, upper)
+
+    def inverse_kinematics(self, target_poses: np.ndarray, seeds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute both elbow solutions for target poses, best first.
+
+        Solutions are ranked by their distance to the seed over the arm
+        joints; invalid solutions (out of reach, out of limits, or a target
+        orientation that is not a pure yaw) sort last. With a rail, each
+        elbow configuration uses the candidate rail position (see
+        _rail_candidates()) that gives the cheapest valid solution.
+
+        Args:
+            target_poses: (..., 7) target end-effector poses in the base frame
+            seeds: (..., num_joints) full joint vectors (rail position, angle
+                wrapping and ranking reference; other joints are copied)
+
+        Returns:
+            Tuple of ((..., 2, num_joints) solutions, (..., 2) validity flags)
+        """
+        target_poses = np.asarray(target_poses, dtype=float)
+        seeds = np.asarray(seeds, dtype=float)
+        batch_shape = np.broadcast_shapes(target_poses.shape[:-1], seeds.shape[:-1])
+        targets = np.broadcast_to(target_poses, batch_shape + (7,)).reshape(-1, 7)
+        seeds = np.broadcast_to(seeds, batch_shape + seeds.shape[-1:]).reshape(-1, seeds.shape[-1])
+
+        positions, quats = pose_math.split_poses(targets)
+
+        # The end effector can only yaw; reject targets tilted away from that
+        relative = pose_math.quat_to_matrix(pose_math.quat_normalize(quats)) @ self.tool_rotation.T
+        yaw = np.arctan2(relative[:, 1, 0], relative[:, 0, 0])
+        tilt = np.arccos(np.clip(relative[:, 2, 2], -1.0, 1.0))
+        orientation_ok = tilt <= self.config.orientation_tolerance
+
+        wrist_position = positions - self._rotate_z(yaw, self.tool_offset)
+        lift = wrist_position[:, 2] - self.shoulder_offset[2]
+
+        if self.indices.get("rail") is not None:
+            rail = self._rail_candidates(wrist_position[:, :2], self._get_joint(seeds, "rail"))
+        else:
+            rail = np.zeros((len(targets), 1))
+
+        # Planar two-link problem from the shoulder axis to the wrist axis,
+        # shaped (N, rail candidates, elbow configurations)
+        planar = (
+            wrist_position[:, None, :2]
+            - self.shoulder_offset[:2]
+            - rail[..., None] * self.rail_axis[:2]
+        )
+        distance_sq = np.sum(planar ** 2, axis=-1)
+        l1, l2 = self.config.upper_arm_length, self.config.forearm_length
+        cos_elbow = (distance_sq - l1 ** 2 - l2 ** 2) / (2.0 * l1 * l2)
+        reachable = np.abs(cos_elbow) <= 1.0 + 1e-9
+
+        elbow_magnitude = np.arccos(np.clip(cos_elbow, -1.0, 1.0))
+        elbow = np.stack([elbow_magnitude, -elbow_magnitude], axis=-1)
+        shoulder = (
+            np.arctan2(planar[..., 1], planar[..., 0])[..., None]
+            - np.arctan2(l2 * np.sin(elbow), l1 + l2 * np.cos(elbow))
+            - self.config.shoulder_zero_angle
+        )
+        wrist = yaw[:, None, None] - shoulder - elbow
+
+        def seed_of(joint):
+            return np.broadcast_to(self._get_joint(seeds, joint)[:, None, None], shoulder.shape)
+
+        shoulder, shoulder_ok = _wrap_near(shoulder, seed_of("shoulder"), *self.limits["shoulder"])
+        elbow, elbow_ok = _wrap_near(elbow, seed_of("elbow"), *self.limits["elbow"])
+        wrist, wrist_ok = _wrap_near(wrist, seed_of("wrist"), *self.limits["wrist"])
+
+        lift_lower, lift_upper = self.limits["lift"]
+        valid = (
+            shoulder_ok & elbow_ok & wrist_ok
+            & reachable[..., None]
+            & (orientation_ok & (lift >= lift_lower) & (lift <= lift_upper))[:, None, None]
+        )
+
+        values = {
+            "rail": np.broadcast_to(rail[..., None], shoulder.shape),
+            "lift": np.broadcast_to(lift[:, None, None], shoulder.shape),
+            "shoulder": shoulder,
+            "elbow": elbow,
+            "wrist": wrist,
+        }
+        solutions = np.broadcast_to(seeds[:, None, None, :], shoulder.shape + seeds.shape[-1:]).copy()
+        for joint, value in values.items():
+            index = self.indices.get(joint)
+            if index is not None:
+                solutions[..., index] = value
+
+        # Keep the cheapest valid rail candidate per elbow configuration
+        arm_indices = [index for index in self.indices.values() if index is not None]
+        cost = np.sum(np.abs(solutions[..., arm_indices] - seeds[:, None, None, arm_indices]), axis=-1)
+        cost = np.where(valid, cost, np.inf)
+        best_rail = np.argmin(cost, axis=1)
+        solutions = np.take_along_axis(solutions, best_rail[:, None, :, None], axis=1)[:, 0]
+        valid = np.take_along_axis(valid, best_rail[:, None, :], axis=1)[:, 0]
+        cost = np.take_along_axis(cost, best_rail[:, None, :], axis=1)[:, 0]
+
+        order = np.argsort(cost, axis=-1, kind="stable")
+        solutions = np.take_along_axis(solutions, order[..., None], axis=1)
+        valid = np.take_along_axis(valid, order, axis=1)
+
+        return (
+            solutions.reshape(batch_shape + solutions.shape[1:]),
+            valid.reshape(batch_shape + (self.num_solutions,)),
+        )
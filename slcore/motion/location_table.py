@@ -0,0 +1,99 @@
+"""Precomputed joint positions for named locations.
+
+Location prims (home, staging, nests and their hovers) are fixed for the
+lifetime of an environment, so their IK can be solved once at startup.
+LocationJointTable maps (env_id, location name) to the joint positions that
+reach the location, letting goto_location commands skip IK at runtime.
+
+Example:
+    table = get_location_joint_table("pf400")
+    table.set(0, "staging", joint_positions)
+    joints = table.get(0, "staging")
+"""
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+class LocationJointTable:
+    """Thread-safe table from (env_id, location name) to joint positions.
+
+    The table is filled on the simulation thread (warmup) and read on the
+    ZMQ thread (command handling), so every access goes through a lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._entries: dict[tuple[int, str], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def set(self, env_id: int, name: str, joint_positions: np.ndarray):
+        """Store the joint positions that reach a location.
+
+        Args:
+            env_id: Environment ID
+            name: Location name (e.g., "staging")
+            joint_positions: Solved joint positions
+        """
+        with self._lock:
+            self._entries[(env_id, name)] = np.array(joint_positions, dtype=float)
+
+    def get(self, env_id: int, name: str) -> Optional[np.ndarray]:
+        """Look up the joint positions for a location.
+
+        Args:
+            env_id: Environment ID
+            name: Location name
+
+        Returns:
+            Copy of the joint positions, or None if the location was not precomputed
+        """
+        with self._lock:
+            joint_positions = self._entries.get((env_id, name))
+            return None if joint_positions is None else joint_positions.copy()
+
+    def get_names(self, env_id: int) -> list[str]:
+        """List the precomputed locations of an environment.
+
+        Args:
+            env_id: Environment ID
+
+        Returns:
+            Sorted location names
+        """
+        with self._lock:
+            return sorted(name for entry_env_id, name in self._entries if entry_env_id == env_id)
+
+    def clear_env(self, env_id: int):
+        """Drop all entries of an environment (e.g., before recomputing it).
+
+        Args:
+            env_id: Environment ID
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == env_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_location_tables: dict[str, LocationJointTable] = {}
+
+
+def get_location_joint_table(robot_model: str) -> LocationJointTable:
+    """Get the location table shared by all robots of one model.
+
+    Args:
+        robot_model: Robot model name (e.g., "pf400")
+
+    Returns:
+        LocationJointTable for the robot model
+    """
+    table = _location_tables.get(robot_model)
+    if table is None:
+        table = LocationJointTable()
+        _location_tables[robot_model] = table
+    return table
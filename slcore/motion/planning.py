@@ -0,0 +1,166 @@
+"""Sampling-based joint-space path planning.
+
+RRT-Connect grows one tree from the start and one from the goal and tries
+to join them. Each iteration extends the active tree toward a batch of
+random samples and tries to connect the other tree to every new node, so
+all edges of an iteration are checked in one vectorized collision query.
+Found paths are shortened by greedy visibility shortcutting, which checks
+every candidate shortcut from a waypoint at once.
+
+The planners only see an edge checker (e.g.,
+CollisionChecker.edges_in_collision), so they are independent of the
+collision model.
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+EdgeChecker = Callable[[np.ndarray, np.ndarray], np.ndarray]
+"""Maps (E, J) edge starts and (E, J) edge ends to (E,) collision flags"""
+
+
+def sampling_bounds(
+    joint_limits: dict[int, tuple[float, float]],
+    configurations: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get per-joint sampling bounds for planning between configurations.
+
+    Args:
+        joint_limits: {joint index: (lower, upper)} of the joints to sample;
+            infinite limits span one turn beyond the configurations
+        configurations: (C, J) configurations the plan connects (e.g., start
+            and goal); joints without limits stay within their span
+
+    Returns:
+        Tuple of ((J,) lower bounds, (J,) upper bounds)
+    """
+    configurations = np.asarray(configurations, dtype=float)
+    lower, upper = configurations.min(axis=0), configurations.max(axis=0)
+    for index, (joint_lower, joint_upper) in joint_limits.items():
+        lower[index] = joint_lower if np.isfinite(joint_lower) else lower[index] - np.pi
+        upper[index] = joint_upper if np.isfinite(joint_upper) else upper[index] + np.pi
+    return lower, upper
+
+
+class _Tree:
+    """Nodes of one RRT tree with their parent indices."""
+
+    def __init__(self, root: np.ndarray):
+        self.nodes = root[None].copy()
+        self.parents = np.array([-1])
+
+    def nearest(self, points: np.ndarray) -> np.ndarray:
+        """Index of the node nearest to each point."""
+        distances = np.linalg.norm(points[:, None] - self.nodes[None], axis=-1)
+        return np.argmin(distances, axis=-1)
+
+    def add(self, nodes: np.ndarray, parents: np.ndarray) -> np.ndarray:
+        """Append nodes and return their indices."""
+        first = len(self.nodes)
+        self.nodes = np.concatenate([self.nodes, nodes])
+        self.parents = np.concatenate([self.parents, parents])
+        return np.arange(first, len(self.nodes))
+
+    def path_to_root(self, index: int) -> np.ndarray:
+        """Nodes from a node back to the root."""
+        indices = []
+        while index >= 0:
+            indices.append(index)
+            index = self.parents[index]
+        return self.nodes[indices]
+
+
+def rrt_connect(
+    start: np.ndarray,
+    goal: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    edges_in_collision: EdgeChecker,
+    step_size: float = 0.3,
+    max_iterations: int = 200,
+    batch_size: int = 16,
+    rng: np.random.Generator = None,
+) -> Optional[np.ndarray]:
+    """Find a collision-free joint-space path with batched RRT-Connect.
+
+    Args:
+        start: (J,) start configuration
+        goal: (J,) goal configuration
+        lower: (J,) lower sampling bounds (equal to upper for joints that stay fixed)
+        upper: (J,) upper sampling bounds
+        edges_in_collision: Edge checker
+        step_size: Longest tree edge (joint-space Euclidean norm)
+        max_iterations: Extension rounds before giving up
+        batch_size: Random samples per extension round
+        rng: Random generator (default: a fresh unseeded generator)
+
+    Returns:
+        (W, J) waypoints from start to goal, or None if no path was found
+    """
+    start = np.asarray(start, dtype=float)
+    goal = np.asarray(goal, dtype=float)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    if not edges_in_collision(start[None], goal[None])[0]:
+        return np.stack([start, goal])
+
+    trees = [_Tree(start), _Tree(goal)]
+    for iteration in range(max_iterations):
+        active, other = trees[iteration % 2], trees[1 - iteration % 2]
+
+        # Extend the active tree one step toward each sample
+        samples = rng.uniform(lower, upper, size=(batch_size, len(start)))
+        nearest = active.nearest(samples)
+        near_nodes = active.nodes[nearest]
+        offsets = samples - near_nodes
+        distances = np.linalg.norm(offsets, axis=-1, keepdims=True)
+        new_nodes = near_nodes + offsets * np.minimum(1.0, step_size / np.maximum(distances, 1e-12))
+
+        free = ~edges_in_collision(near_nodes, new_nodes)
+        if not free.any():
+            continue
+        new_indices = active.add(new_nodes[free], nearest[free])
+
+        # Try to connect the other tree straight to every new node
+        other_nearest = other.nearest(active.nodes[new_indices])
+        connected = ~edges_in_collision(other.nodes[other_nearest], active.nodes[new_indices])
+        if not connected.any():
+            continue
+
+        # Keep the connection with the shortest bridging edge
+        candidates = np.flatnonzero(connected)
+        gaps = np.linalg.norm(other.nodes[other_nearest[candidates]] - active.nodes[new_indices[candidates]], axis=-1)
+        best = candidates[np.argmin(gaps)]
+
+        active_half = active.path_to_root(new_indices[best])[::-1]
+        other_half = other.path_to_root(other_nearest[best])
+        path = np.concatenate([active_half, other_half])
+        return path if active is trees[0] else path[::-1]
+
+    return None
+
+
+def shortcut_path(path: np.ndarray, edges_in_collision: EdgeChecker) -> np.ndarray:
+    """Shorten a path by jumping to the farthest waypoint visible from each waypoint.
+
+    Args:
+        path: (W, J) collision-free waypoints
+        edges_in_collision: Edge checker
+
+    Returns:
+        (W', J) waypoints with the same start and goal, W' <= W
+    """
+    path = np.asarray(path, dtype=float)
+    shortened = [path[0]]
+    index = 0
+    while index < len(path) - 1:
+        # Check the straight edge to every later waypoint at once
+        later = np.arange(index + 1, len(path))
+        free = ~edges_in_collision(np.repeat(path[index][None], len(later), axis=0), path[later])
+        free[0] = True  # Consecutive waypoints are already known to be connected
+        index = later[np.flatnonzero(free)[-1]]
+        shortened.append(path[index])
+    return np.stack(shortened)
+
@@ -0,0 +1,362 @@
+"""Precomputed collision-free paths between named locations.
+
+Transfers between the same locations (e.g., peeler_nest to
+thermocycler_nest via their hovers) repeat throughout a campaign. A
+LocationRoadmap is a graph over an environment's location configurations
+whose edges are straight joint-space moves validated against the static
+layout. Every pair of locations gets a stored path: the straight edge when
+it is free, otherwise the shortest route through other locations (e.g.,
+hovers; shortcut afterwards), otherwise an RRT-Connect plan. At runtime a transfer
+is a table lookup followed by trajectory execution.
+
+Roadmaps are keyed by a hash of the robot and collision model (asset) and
+of the location configurations and obstacle boxes in the robot base frame
+(layout), so identical environments share one roadmap and a roadmap saved
+by an earlier run is reused until the layout changes.
+
+Example:
+    key = layout_hash(asset_key, names, joints, obstacles, base_position, base_orientation)
+    roadmap = get_location_roadmap("pf400", key, build_roadmap, cache_dir)
+    path = roadmap.path("peeler_nest", "thermocycler_nest")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.motion.collision import BoxProxies, CollisionChecker
+from slcore.motion.planning import rrt_connect, sampling_bounds, shortcut_path
+
+if TYPE_CHECKING:
+    from slcore.robots.common.config import SamplingPlannerConfig
+
+ROADMAP_VERSION = 1
+
+# Rounding applied before hashing, so float noise does not change the key
+HASH_DECIMALS = 4
+
+
+class LocationRoadmap:
+    """Validated joint-space paths between every pair of named locations.
+
+    Attributes:
+        names: Location names
+        joint_positions: (N, num_joints) configuration of each location
+        key: Asset and layout hash the roadmap was built for
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        joint_positions: np.ndarray,
+        paths: dict[tuple[int, int], np.ndarray],
+        key: str = None,
+    ):
+        """Initialize a roadmap from stored paths.
+
+        Args:
+            names: Location names
+            joint_positions: (N, num_joints) configuration of each location
+            paths: {(i, j): (W, num_joints) waypoints} for i < j; the path
+                from j to i is the reverse
+            key: Asset and layout hash
+        """
+        self.names = list(names)
+        self.joint_positions = np.asarray(joint_positions, dtype=float)
+        self.key = key
+        self._paths = paths
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def build(
+        cls,
+        names: list[str],
+        joint_positions: np.ndarray,
+        checker: CollisionChecker,
+        config: SamplingPlannerConfig,
+        joint_limits: dict[int, tuple[float, float]],
+        key: str = None,
+    ) -> "LocationRoadmap":
+        """Validate paths between every pair of locations.
+
+        Obstacles touched at a path's two end locations (e.g., the nests
+        themselves) are not counted for that path.
+
+        Args:
+            names: Location names
+            joint_positions: (N, num_joints) configuration of each location
+            checker: Collision checker holding the static obstacles
+            config: Planner settings for pairs without a route
+            joint_limits: {joint index: (lower, upper)} of the joints sampled
+                when planning (see planning.sampling_bounds)
+            key: Asset and layout hash
+
+        Returns:
+            LocationRoadmap; pairs without any collision-free path are left out
+        """
+        joint_positions = np.asarray(joint_positions, dtype=float)
+        count = len(names)
+        if count < 2:
+            return cls(names, joint_positions, {}, key)
+        touched = checker.colliding_obstacles(joint_positions)
+
+        # Check every straight edge in one query, each with its own end obstacles
+        first, second = np.triu_indices(count, k=1)
+        samples = checker.edge_samples(joint_positions[first], joint_positions[second])
+        hits = checker.colliding_obstacles(samples) & ~(touched[first] | touched[second])[:, None]
+        free = ~hits.any(axis=(-2, -1))
+
+        # All-pairs shortest routes over the free edges (Floyd-Warshall); a
+        # location touching an obstacle is only a route end, never a stop on
+        # the way, since its edges ignore that obstacle
+        distances = np.full((count, count), np.inf)
+        np.fill_diagonal(distances, 0.0)
+        lengths = np.linalg.norm(joint_positions[second] - joint_positions[first], axis=-1)
+        distances[first[free], second[free]] = lengths[free]
+        distances[second[free], first[free]] = lengths[free]
+        next_hop = np.tile(np.arange(count), (count, 1))
+        for via in np.flatnonzero(~touched.any(axis=-1)):
+            through = distances[:, via, None] + distances[None, via, :]
+            shorter = through < distances
+            distances = np.where(shorter, through, distances)
+            next_hop = np.where(shorter, next_hop[:, via, None], next_hop)
+
+        rng = np.random.default_rng(config.seed)
+        paths = {}
+        for i, j in zip(first, second):
+            ignore = touched[i] | touched[j]
+
+            def edges_in_collision(starts, goals, ignore=ignore):
+                return checker.edges_in_collision(starts, goals, ignore)
+
+            if np.isfinite(distances[i, j]):
+                route = [i]
+                while route[-1] != j:
+                    route.append(next_hop[route[-1], j])
+                path = shortcut_path(joint_positions[route], edges_in_collision)
+            else:
+                lower, upper = sampling_bounds(joint_limits, joint_positions[[i, j]])
+                path = rrt_connect(
+                    joint_positions[i],
+                    joint_positions[j],
+                    lower,
+                    upper,
+                    edges_in_collision,
+                    step_size=config.step_size,
+                    max_iterations=config.max_iterations,
+                    batch_size=config.batch_size,
+                    rng=rng,
+                )
+                if path is None:
+                    continue
+                path = shortcut_path(path, edges_in_collision)
+            paths[(int(i), int(j))] = path
+
+        return cls(names, joint_positions, paths, key)
+
+    def path(self, start: str, goal: str) -> Optional[np.ndarray]:
+        """Look up the stored path between two locations.
+
+        Args:
+            start: Start location name
+            goal: Goal location name
+
+        Returns:
+            (W, num_joints) waypoints from start to goal, or None if either
+            location is unknown or no collision-free path was found
+        """
+        i, j = self._index.get(start), self._index.get(goal)
+        if i is None or j is None:
+            return None
+        if i == j:
+            return self.joint_positions[[i, i]].copy()
+        if i < j:
+            path = self._paths.get((i, j))
+            return None if path is None else path.copy()
+        path = self._paths.get((j, i))
+        return None if path is None else path[::-1].copy()
+
+    def nearest_location(self, joint_positions: np.ndarray, tolerance: float = 0.01) -> Optional[str]:
+        """Find the location a configuration is at.
+
+        Args:
+            joint_positions: (num_joints,) configuration
+            tolerance: Largest joint difference to count as at a location
+
+        Returns:
+            Name of the closest location within tolerance, or None
+        """
+        if not self.names:
+            return None
+        errors = np.max(np.abs(self.joint_positions - np.asarray(joint_positions, dtype=float)), axis=-1)
+        nearest = int(np.argmin(errors))
+        return self.names[nearest] if errors[nearest] <= tolerance else None
+
+    def num_paths(self) -> int:
+        """Number of location pairs with a stored path."""
+        return len(self._paths)
+
+    def save(self, path: str | Path):
+        """Write the roadmap to an .npz file atomically.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        pairs = sorted(self._paths)
+        header = {
+            "version": ROADMAP_VERSION,
+            "key": self.key,
+            "names": self.names,
+            "pairs": [[i, j, len(self._paths[(i, j)])] for i, j in pairs],
+        }
+        num_joints = self.joint_positions.shape[-1]
+        waypoints = np.concatenate([self._paths[pair] for pair in pairs]) if pairs else np.zeros((0, num_joints))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                header=np.frombuffer(json.dumps(header).encode(), dtype=np.uint8),
+                joint_positions=self.joint_positions,
+                waypoints=waypoints,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocationRoadmap":
+        """Read a roadmap written by save().
+
+        Args:
+            path: Roadmap file
+
+        Returns:
+            LocationRoadmap
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file version is not supported
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Roadmap not found: {path}")
+
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(data["header"].tobytes().decode())
+            joint_positions = data["joint_positions"]
+            waypoints = data["waypoints"]
+
+        if header.get("version") != ROADMAP_VERSION:
+            raise ValueError(f"Unsupported roadmap version: {header.get('version')}")
+
+        paths = {}
+        offset = 0
+        for i, j, count in header["pairs"]:
+            paths[(i, j)] = waypoints[offset:offset + count].copy()
+            offset += count
+        return cls(header["names"], joint_positions, paths, header["key"])
+
+
+def _rounded_bytes(values: np.ndarray) -> bytes:
+    """Round values for hashing (adding 0.0 turns -0.0 into 0.0)."""
+    return (np.round(np.asarray(values, dtype=float), HASH_DECIMALS) + 0.0).tobytes()
+
+
+def layout_hash(
+    asset_key: str,
+    names: list[str],
+    joint_positions: np.ndarray,
+    obstacles: BoxProxies,
+    base_position: np.ndarray,
+    base_orientation: np.ndarray,
+) -> str:
+    """Hash a robot model and the static layout around it.
+
+    Obstacles are expressed in the robot base frame and sorted by path
+    relative to their environment root, so identical environments at
+    different origins hash the same.
+
+    Args:
+        asset_key: Description of the robot and collision model (e.g., repr
+            of its kinematic and collision configs)
+        names: Location names
+        joint_positions: (N, num_joints) configuration of each location
+        obstacles: Static obstacle boxes in world frame
+        base_position: Robot base position in world frame
+        base_orientation: Robot base orientation [w, x, y, z]
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    inverse_rotation = pose_math.quat_to_matrix(pose_math.quat_conjugate(np.asarray(base_orientation, dtype=float)))
+    centers = (obstacles.centers - base_position) @ inverse_rotation.T
+    rotations = inverse_rotation @ obstacles.rotations
+
+    # Box axes are only defined up to sign; hash the unsigned axes
+    boxes = np.concatenate([centers, np.abs(rotations).reshape(-1, 9), obstacles.half_extents], axis=-1)
+    relative_paths = [path.split("/", 3)[-1] for path in obstacles.paths]
+    order = sorted(range(len(obstacles)), key=lambda i: relative_paths[i])
+
+    digest = hashlib.sha256(f"simlab-roadmap-{ROADMAP_VERSION}".encode())
+    digest.update(asset_key.encode())
+    digest.update(json.dumps(list(names)).encode())
+    digest.update(_rounded_bytes(joint_positions))
+    digest.update(json.dumps([relative_paths[i] for i in order]).encode())
+    digest.update(_rounded_bytes(boxes[order]))
+    return digest.hexdigest()
+
+
+_roadmaps: dict[tuple[str, str], LocationRoadmap] = {}
+_roadmaps_lock = threading.Lock()
+
+
+def get_location_roadmap(
+    robot_model: str,
+    key: str,
+    build: Callable[[], LocationRoadmap],
+    cache_dir: str | Path = None,
+) -> LocationRoadmap:
+    """Get the roadmap for a layout, loading or building it once.
+
+    Roadmaps are looked up in memory, then in cache_dir, and only built
+    when neither has one; newly built roadmaps are saved to cache_dir.
+
+    Args:
+        robot_model: Robot model name (e.g., "pf400")
+        key: Asset and layout hash from layout_hash()
+        build: Builds the roadmap when it is not cached
+        cache_dir: Directory of saved roadmaps, or None to keep them in memory only
+
+    Returns:
+        LocationRoadmap for the layout
+    """
+    with _roadmaps_lock:
+        roadmap = _roadmaps.get((robot_model, key))
+        if roadmap is not None:
+            return roadmap
+
+        file_path = Path(cache_dir) / f"{robot_model}-{key[:16]}.npz" if cache_dir is not None else None
+        if file_path is not None and file_path.exists():
+            try:
+                roadmap = LocationRoadmap.load(file_path)
+            except (OSError, ValueError, KeyError):
+                roadmap = None
+            if roadmap is not None and roadmap.key != key:
+                roadmap = None
+
+        if roadmap is None:
+            roadmap = build()
+            if file_path is not None:
+                roadmap.save(file_path)
+
+        _roadmaps[(robot_model, key)] = roadmap
+        return roadmap
@@ -0,0 +1,378 @@
+"""Time-optimal joint trajectories with velocity, acceleration and jerk limits.
+
+Turns joint-space goals (IK results) or multi-waypoint joint paths into
+timed trajectories. Each segment moves all joints along the straight line
+between its endpoints, scaled by one shared profile so the joints start and
+stop together; the profile is the fastest one that keeps every joint within
+its limits:
+
+- "trapezoid": bang-coast-bang acceleration (velocity and acceleration limits)
+- "scurve": seven-phase jerk-limited profile (velocity, acceleration and
+  jerk limits)
+
+Segments start and end at rest. Profiles are computed in closed form and
+vectorized over robots, so generate_batch() plans one motion per
+environment in a single call.
+
+Trajectories are stored as a times array plus a 2D positions array
+(JointTrajectory) sampled at a fixed timestep; moves stream them as
+setpoints interpolated at each frame's simulation time (sample()).
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from slcore.motion.capabilities import MotionCapability
+from slcore.motion.config import TrajectoryConfig
+
+
+PROFILES = ("trapezoid", "scurve")
+
+
+@dataclass
+class JointTrajectory:
+    """Joint positions sampled at increasing times.
+
+    Attributes:
+        times: (T,) sample times in seconds, starting at 0
+        positions: (T, num_joints) joint positions at each sample
+    """
+
+    times: np.ndarray
+    positions: np.ndarray
+
+    def __post_init__(self):
+        self.times = np.asarray(self.times, dtype=float)
+        self.positions = np.asarray(self.positions, dtype=float)
+        if self.positions.ndim != 2 or len(self.times) != len(self.positions):
+            raise ValueError(
+                f"JointTrajectory needs (T,) times and (T, num_joints) positions, "
+                f"got {self.times.shape} and {self.positions.shape}"
+            )
+
+    @property
+    def duration(self) -> float:
+        """Time of the last sample (seconds)."""
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+    @property
+    def final_positions(self) -> np.ndarray:
+        """Joint positions at the end of the trajectory."""
+        return self.positions[-1]
+
+    def sample(self, times) -> np.ndarray:
+        """Interpolate joint positions at arbitrary times.
+
+        Args:
+            times: Scalar or (K,) times in seconds (clamped to the trajectory)
+
+        Returns:
+            (num_joints,) or (K, num_joints) joint positions
+        """
+        times = np.clip(np.asarray(times, dtype=float), 0.0, self.duration)
+        index = np.clip(np.searchsorted(self.times, times, side="right") - 1, 0, max(len(self.times) - 2, 0))
+        if len(self.times) < 2:
+            return np.broadcast_to(self.positions[0], np.shape(times) + self.positions.shape[1:]).copy()
+
+        span = self.times[index + 1] - self.times[index]
+        fraction = np.where(span > 0, (times - self.times[index]) / np.where(span > 0, span, 1.0), 0.0)
+        start = self.positions[index]
+        end = self.positions[index + 1]
+        return start + fraction[..., None] * (end - start)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {"times": self.times.tolist(), "positions": self.positions.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JointTrajectory":
+        """Deserialize from to_dict() output."""
+        return cls(times=data["times"], positions=data["positions"])
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+def _limit_array(value, num_joints: int) -> np.ndarray:
+    """Broadcast a scalar or per-joint limit to (num_joints,)."""
+    return np.broadcast_to(np.asarray(value, dtype=float), (num_joints,)).copy()
+
+
+def _path_limits(deltas: np.ndarray, limits: np.ndarray) -> np.ndarray:
+    """Limit on the path parameter derivative implied by per-joint limits.
+
+    Args:
+        deltas: (R, num_joints) joint displacements of the segments
+        limits: (num_joints,) per-joint limits on the same derivative
+
+    Returns:
+        (R,) limits for the normalized path parameter s in [0, 1]
+    """
+    distance = np.abs(deltas)
+    with np.errstate(divide="ignore"):
+        ratio = np.where(distance > 0, limits / distance, np.inf)
+    return np.min(ratio, axis=-1)
+
+
+def trapezoid_phases(max_velocity: np.ndarray, max_acceleration: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Phases of the fastest rest-to-rest trapezoidal profile covering s = 0 to 1.
+
+    Args:
+        max_velocity: (R,) path velocity limits
+        max_acceleration: (R,) path acceleration limits
+
+    Returns:
+        Tuple of (R, 3) phase durations, (R, 3) phase jerks, (R, 3) accelerations
+        at the start of each phase
+    """
+    # Triangle profile when the velocity limit cannot be reached
+    triangular = max_velocity ** 2 / max_acceleration > 1.0
+    accel_time = np.where(triangular, np.sqrt(1.0 / max_acceleration), max_velocity / max_acceleration)
+    peak_velocity = max_acceleration * accel_time
+    cruise_time = np.where(triangular, 0.0, (1.0 - peak_velocity * accel_time) / peak_velocity)
+
+    durations = np.stack([accel_time, cruise_time, accel_time], axis=-1)
+    jerks = np.zeros_like(durations)
+    accelerations = np.stack([max_acceleration, np.zeros_like(max_acceleration), -max_acceleration], axis=-1)
+    return durations, jerks, accelerations
+
+
+def scurve_phases(
+    max_velocity: np.ndarray,
+    max_acceleration: np.ndarray,
+    max_jerk: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Phases of the fastest rest-to-rest jerk-limited (double S) profile for s = 0 to 1.
+
+    Follows the symmetric double S construction of Biagiotti and Melchiorri,
+    reducing the peak velocity and then the peak acceleration when the
+    segment is too short to reach them.
+
+    Args:
+        max_velocity: (R,) path velocity limits
+        max_acceleration: (R,) path acceleration limits
+        max_jerk: (R,) path jerk limits
+
+    Returns:
+        Tuple of (R, 7) phase durations, (R, 7) phase jerks, (R, 7) accelerations
+        at the start of each phase
+    """
+    v, a, j = max_velocity, max_acceleration, max_jerk
+
+    # Assume the velocity limit is reached
+    accel_reached = v * j >= a ** 2
+    jerk_time = np.where(accel_reached, a / j, np.sqrt(v / j))
+    accel_time = np.where(accel_reached, jerk_time + v / a, 2.0 * jerk_time)
+    cruise_time = 1.0 / v - accel_time
+
+    # Velocity limit not reached: shorten the acceleration phase
+    short = cruise_time <= 0
+    jerk_time_short = a / j
+    accel_time_short = (a ** 2 / j + np.sqrt(a ** 4 / j ** 2 + 4.0 * a)) / (2.0 * a)
+    # Acceleration limit not reached either: pure jerk phases
+    no_accel = accel_time_short < 2.0 * jerk_time_short
+    jerk_time_short = np.where(no_accel, np.cbrt(1.0 / (2.0 * j)), jerk_time_short)
+    accel_time_short = np.where(no_accel, 2.0 * jerk_time_short, accel_time_short)
+
+    jerk_time = np.where(short, jerk_time_short, jerk_time)
+    accel_time = np.where(short, accel_time_short, accel_time)
+    cruise_time = np.where(short, 0.0, cruise_time)
+    constant_time = accel_time - 2.0 * jerk_time
+    peak_acceleration = j * jerk_time
+
+    zeros = np.zeros_like(v)
+    durations = np.stack([jerk_time, constant_time, jerk_time, cruise_time, jerk_time, constant_time, jerk_time], axis=-1)
+    jerks = np.stack([j, zeros, -j, zeros, -j, zeros, j], axis=-1)
+    accelerations = np.stack([zeros, peak_acceleration, peak_acceleration, zeros, zeros, -peak_acceleration, -peak_acceleration], axis=-1)
+    return durations, jerks, accelerations
+
+
+def evaluate_phases(
+    durations: np.ndarray,
+    jerks: np.ndarray,
+    accelerations: np.ndarray,
+    times: np.ndarray,
+    profiles: np.ndarray = None,
+) -> np.ndarray:
+    """Evaluate piecewise constant-jerk profiles starting at rest at s = 0.
+
+    Args:
+        durations: (R, P) phase durations
+        jerks: (R, P) jerk during each phase
+        accelerations: (R, P) acceleration at the start of each phase
+        times: (R, K) evaluation times per profile, or any shape if profiles is given
+        profiles: Profile row of each entry of times (default: row i for times[i])
+
+    Returns:
+        Path parameter values shaped like times, clamped to [0, 1]
+    """
+    # Position and velocity at the start of each phase
+    num_phases = durations.shape[-1]
+    start_positions = np.zeros_like(durations)
+    start_velocities = np.zeros_like(durations)
+    for phase in range(1, num_phases):
+        dt = durations[:, phase - 1]
+        a0 = accelerations[:, phase - 1]
+        jerk = jerks[:, phase - 1]
+        v0 = start_velocities[:, phase - 1]
+        start_positions[:, phase] = start_positions[:, phase - 1] + v0 * dt + a0 * dt ** 2 / 2 + jerk * dt ** 3 / 6
+        start_velocities[:, phase] = v0 + a0 * dt + jerk * dt ** 2 / 2
+    start_times = np.concatenate([np.zeros_like(durations[:, :1]), np.cumsum(durations, axis=-1)[:, :-1]], axis=-1)
+
+    times = np.asarray(times, dtype=float)
+    if profiles is None:
+        profiles = np.broadcast_to(np.arange(len(durations)).reshape((-1,) + (1,) * (times.ndim - 1)), times.shape)
+
+    phase = np.sum(times[..., None] >= start_times[profiles], axis=-1) - 1
+    phase = np.clip(phase, 0, num_phases - 1)
+
+    tau = times - start_times[profiles, phase]
+    s = (
+        start_positions[profiles, phase]
+        + start_velocities[profiles, phase] * tau
+        + accelerations[profiles, phase] * tau ** 2 / 2
+        + jerks[profiles, phase] * tau ** 3 / 6
+    )
+    return np.clip(s, 0.0, 1.0)
+
+
+class TrajectoryGenerator:
+    """Time-parameterizes joint motions under per-joint limits.
+
+    Attributes:
+        config: Trajectory limits and sampling settings
+        profile: "trapezoid" or "scurve"
+    """
+
+    def __init__(self, config: TrajectoryConfig = None, profile: str = None):
+        """Initialize the generator.
+
+        Args:
+            config: Trajectory configuration (default: TrajectoryConfig())
+            profile: Profile name (default: config.profile)
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        self.config = config or TrajectoryConfig()
+        self.profile = profile or self.config.profile
+        if self.profile not in PROFILES:
+            raise ValueError(f"Unknown trajectory profile '{self.profile}', expected one of {PROFILES}")
+
+    def capabilities(self) -> MotionCapability:
+        """Return the capabilities trajectories from this generator provide.
+
+        Returns:
+            TRAJECTORY, VELOCITY_LIMITS and ACCEL_LIMITS, plus JERK_LIMITS for "scurve"
+        """
+        capabilities = MotionCapability.TRAJECTORY | MotionCapability.VELOCITY_LIMITS | MotionCapability.ACCEL_LIMITS
+        if self.profile == "scurve":
+            capabilities |= MotionCapability.JERK_LIMITS
+        return capabilities
+
+    def segment_durations(self, starts: np.ndarray, goals: np.ndarray) -> tuple[np.ndarray, tuple]:
+        """Compute the minimum durations and profile phases of rest-to-rest segments.
+
+        Args:
+            starts: (R, num_joints) start joint positions
+            goals: (R, num_joints) goal joint positions
+
+        Returns:
+            Tuple of ((R,) durations in seconds, (durations, jerks, accelerations)
+            phase arrays for evaluate_phases())
+        """
+        num_joints = starts.shape[-1]
+        deltas = goals - starts
+        velocity = _path_limits(deltas, _limit_array(self.config.max_velocity, num_joints))
+        acceleration = _path_limits(deltas, _limit_array(self.config.max_acceleration, num_joints))
+
+        # Segments with no motion get a zero-length profile
+        still = ~np.isfinite(velocity)
+        velocity = np.where(still, 1.0, velocity)
+        acceleration = np.where(still, 1.0, acceleration)
+
+        if self.profile == "scurve":
+            jerk = _path_limits(deltas, _limit_array(self.config.max_jerk, num_joints))
+            jerk = np.where(still, 1.0, jerk)
+            phases = scurve_phases(velocity, acceleration, jerk)
+        else:
+            phases = trapezoid_phases(velocity, acceleration)
+
+        phase_durations = np.where(still[:, None], 0.0, phases[0])
+        phases = (phase_durations, phases[1], phases[2])
+        return np.sum(phase_durations, axis=-1), phases
+
+    def generate_batch(self, paths: np.ndarray) -> list[JointTrajectory]:
+        """Time-parameterize one waypoint path per robot.
+
+        Every path stops at each of its waypoints. All segments of all
+        robots are profiled in one vectorized pass.
+
+        Args:
+            paths: (R, W, num_joints) waypoints per robot (W >= 2), or
+                (R, 2, num_joints) start/goal pairs
+
+        Returns:
+            One JointTrajectory per robot, sampled every config.timestep
+        """
+        paths = np.asarray(paths, dtype=float)
+        num_robots, num_waypoints, num_joints = paths.shape
+        starts = paths[:, :-1].reshape(-1, num_joints)
+        goals = paths[:, 1:].reshape(-1, num_joints)
+
+        durations, phases = self.segment_durations(starts, goals)
+        durations = durations.reshape(num_robots, num_waypoints - 1)
+        segment_starts = np.concatenate([np.zeros((num_robots, 1)), np.cumsum(durations, axis=-1)], axis=-1)
+        total = segment_starts[:, -1]
+
+        # Sample all robots on a shared grid, then trim each to its own duration
+        timestep = self.config.timestep
+        num_samples = int(np.ceil(np.max(total) / timestep - 1e-9)) + 1 if num_robots else 0
+        grid = np.arange(num_samples) * timestep
+        times = np.minimum(grid[None, :], total[:, None])
+
+        segment = np.clip(np.sum(times[..., None] >= segment_starts[:, None, 1:], axis=-1), 0, num_waypoints - 2)
+        local_times = times - np.take_along_axis(segment_starts, segment, axis=-1)
+
+        # Evaluate every sample against the profile of its segment
+        profiles = np.arange(num_robots)[:, None] * (num_waypoints - 1) + segment
+        s = evaluate_phases(*phases, local_times, profiles=profiles)
+
+        starts = starts.reshape(num_robots, num_waypoints - 1, num_joints)
+        goals = goals.reshape(num_robots, num_waypoints - 1, num_joints)
+        segment_start = np.take_along_axis(starts, segment[..., None], axis=1)
+        segment_goal = np.take_along_axis(goals, segment[..., None], axis=1)
+        positions = segment_start + s[..., None] * (segment_goal - segment_start)
+
+        trajectories = []
+        for robot in range(num_robots):
+            count = int(np.ceil(total[robot] / timestep - 1e-9)) + 1
+            robot_times = times[robot, :count]
+            robot_positions = positions[robot, :count].copy()
+            robot_positions[-1] = paths[robot, -1]
+            trajectories.append(JointTrajectory(robot_times, robot_positions))
+        return trajectories
+
+    def generate(self, start: np.ndarray, goal: np.ndarray) -> JointTrajectory:
+        """Time-parameterize a single point-to-point motion.
+
+        Args:
+            start: (num_joints,) start joint positions
+            goal: (num_joints,) goal joint positions
+
+        Returns:
+            JointTrajectory from start to goal
+        """
+        return self.generate_batch(np.stack([start, goal])[None])[0]
+
+    def generate_path(self, waypoints: np.ndarray) -> JointTrajectory:
+        """Time-parameterize a multi-waypoint joint path, stopping at each waypoint.
+
+        Args:
+            waypoints: (W, num_joints) joint positions (W >= 2)
+
+        Returns:
+            JointTrajectory through all waypoints
+        """
+        return self.generate_batch(np.asarray(waypoints, dtype=float)[None])[0]
@@ -0,0 +1,192 @@
+"""Differential IK for every robot of a model from one shared PhysX view.
+
+DifferentialIKSolver builds a PhysX view and a controller per robot and reads
+one robot's Jacobian per solve. BatchedDifferentialIKSolver instead reads the
+Jacobians, link transforms and joint positions of all robots of a model from
+a single ArticulationView and takes one differential IK step for any subset
+of them in one vectorized call, so the goto_pose requests of every
+environment queued in a frame cost a single solve.
+
+The view only needs the ArticulationViewWrapper interface (root_physx_view
+with get_jacobians, get_link_transforms, get_dof_positions and prim_paths;
+data with joint_names and body_names; is_fixed_base), so the solver can be
+driven by a stub view returning synthetic Jacobians.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.motion.kinematics import differential_ik_step, pose_errors
+from slcore.robots.common.config import DifferentialIKConfig
+
+if TYPE_CHECKING:
+    from slcore.robots.common.isaaclab_articulation import ArticulationViewWrapper
+
+
+class BatchedDifferentialIKSolver:
+    """Takes differential IK steps for many robots sharing one articulation view.
+
+    Rows are robots in view order. Targets and the PhysX Jacobians are both
+    in world frame, so no per-robot base pose is needed.
+
+    Attributes:
+        view: Articulation view over all robots of the model
+        config: Differential IK configuration parameters
+        joint_names: Names of the controlled joints
+    """
+
+    def __init__(
+        self,
+        view_factory: Callable[[], ArticulationViewWrapper],
+        config: DifferentialIKConfig,
+        joint_names: list[str] = None,
+    ):
+        """Initialize the solver.
+
+        Args:
+            view_factory: Creates the shared view; called again when a robot
+                is not found in the current view (e.g., after an environment
+                was added) or after invalidate()
+            config: Differential IK configuration from YAML
+            joint_names: Joints to control (default: all joints of the view)
+        """
+        self.config = config
+        self._view_factory = view_factory
+        self._requested_joint_names = joint_names
+        self.view: ArticulationViewWrapper = None
+        self._rows: dict[str, int] = {}
+
+    def _build_view(self):
+        """Create the shared view and resolve joint, body and row indices.
+
+        Raises:
+            ValueError: If a joint or the end effector body is not in the view
+        """
+        self.view = self._view_factory()
+        data = self.view.data
+
+        self.joint_names = list(self._requested_joint_names or data.joint_names)
+        missing = [name for name in self.joint_names if name not in data.joint_names]
+        if missing:
+            raise ValueError(f"Joints {missing} not found in articulation. Available joints: {data.joint_names}")
+        self.joint_ids = [data.joint_names.index(name) for name in self.joint_names]
+
+        ee_name = self.config.end_effector_body_name
+        if ee_name not in data.body_names:
+            raise ValueError(f"Body '{ee_name}' not found in articulation. Available bodies: {data.body_names}")
+        self.ee_body_idx = data.body_names.index(ee_name)
+
+        # In the Jacobian, body indices are offset by -1 for fixed-base robots
+        self.ee_jacobi_idx = self.ee_body_idx - 1 if self.view.is_fixed_base else self.ee_body_idx
+
+        self._rows = {path: row for row, path in enumerate(self.view.root_physx_view.prim_paths)}
+
+    def invalidate(self):
+        """Drop the view so it is rebuilt on next use (e.g., after an environment was removed)."""
+        self.view = None
+        self._rows = {}
+
+    def row_of(self, prim_path: str) -> int:
+        """Get the view row of a robot, rebuilding the view if it is missing.
+
+        Args:
+            prim_path: Articulation root prim path of the robot
+
+        Returns:
+            Row index in the shared view
+
+        Raises:
+            KeyError: If the robot is not in the view even after a rebuild
+        """
+        if prim_path not in self._rows:
+            self._build_view()
+        if prim_path not in self._rows:
+            raise KeyError(f"Robot '{prim_path}' is not in the shared articulation view")
+        return self._rows[prim_path]
+
+    def solve(
+        self,
+        rows: np.ndarray,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        solution_preference: str = "closest_to_current",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Take one differential IK step toward each target.
+
+        Args:
+            rows: (N,) view rows of the robots
+            target_positions: (N, 3) target positions in world frame (meters)
+            target_orientations: (N, 4) target quaternions [w, x, y, z]
+            solution_preference: Seed for the step:
+                - "closest_to_current": Current joint positions
+                - "closest_to_home": Home pose
+
+        Returns:
+            Tuple of ((N, num_joints) joint positions, (N,) success flags)
+        """
+        if self.view is None:
+            self._build_view()
+        physx_view = self.view.root_physx_view
+        rows = np.asarray(rows, dtype=int)
+
+        # One read of each buffer for all robots
+        jacobians = np.asarray(physx_view.get_jacobians())[rows, self.ee_jacobi_idx][..., self.joint_ids]
+        num_links = len(self.view.data.body_names)
+        links = np.asarray(physx_view.get_link_transforms()).reshape(-1, num_links, 7)[rows, self.ee_body_idx]
+
+        # PhysX quaternions are [x, y, z, w]
+        ee_poses = np.concatenate([links[:, :3], links[:, 6:7], links[:, 3:6]], axis=-1)
+        targets = pose_math.make_poses(target_positions, target_orientations)
+
+        if solution_preference == "closest_to_home":
+            seeds = np.tile(np.asarray(self.config.home_pose, dtype=float)[self.joint_ids], (len(rows), 1))
+        else:
+            seeds = np.asarray(physx_view.get_dof_positions(), dtype=float)[rows][:, self.joint_ids]
+
+        delta = differential_ik_step(
+            jacobians,
+            pose_errors(ee_poses, targets),
+            self.config.ik_method,
+            self.config.lambda_val,
+        )
+        joint_positions = seeds + delta
+        return joint_positions, np.isfinite(joint_positions).all(axis=-1)
+
+
+_batched_solvers: dict[str, BatchedDifferentialIKSolver] = {}
+
+
+def get_batched_ik_solver(
+    robot_model: str,
+    view_factory: Callable[[], ArticulationViewWrapper],
+    config: DifferentialIKConfig,
+    joint_names: list[str] = None,
+) -> BatchedDifferentialIKSolver:
+    """Get the solver shared by all robots of one model.
+
+    The arguments are only used by the first call for a model.
+
+    Args:
+        robot_model: Robot model name (e.g., "pf400")
+        view_factory: Creates the view over all robots of the model
+        config: Differential IK configuration
+        joint_names: Joints to control (default: all joints of the view)
+
+    Returns:
+        BatchedDifferentialIKSolver for the robot model
+    """
+    solver = _batched_solvers.get(robot_model)
+    if solver is None:
+        solver = BatchedDifferentialIKSolver(view_factory, config, joint_names)
+        _batched_solvers[robot_model] = solver
+    return solver
+
+
+def invalidate_batched_ik_solvers():
+    """Rebuild every shared view on next use (call after robots were removed)."""
+    for solver in _batched_solvers.values():
+        solver.invalidate()
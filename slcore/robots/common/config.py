@@ -60,6 +60,9 @@ class PhysicsConfig:
     contact_threshold: float = 0.0
     """Contact threshold for collision events"""
 
+    contact_threshold_disabled: float = 1e30
+    """Contact threshold used while contact reporting is switched off (no contact reaches it)"""
+
     raycast_distance: float = 0.03
     """Default raycast distance for gripper detection (meters)"""
 
@@ -111,10 +114,36 @@ class DifferentialIKConfig:
     end_effector_body_name: str = "pointer"
     """Name of the end effector body in the articulation"""
 
+    # Solver backend
+    backend: str = "isaaclab"
+    """IK backend: "isaaclab" (one step from the PhysX Jacobian), "batched"
+    (one step for every robot of the model at once, from a shared PhysX view)
+    or "numpy" (iterated to convergence against the URDF kinematic chain, CPU only)"""
+
+    device: str = "cuda:0"
+    """Torch device for the isaaclab and batched backends"""
+
+    max_iterations: int = 100
+    """Maximum solver iterations for the numpy backend"""
+
+    max_step: float = 0.2
+    """Largest joint change per iteration for the numpy backend (radians or meters)"""
+
+    # Kinematic model (numpy backend)
+    urdf_path: Optional[str] = None
+    """URDF file of the robot (absolute, or resolved relative to the YAML file)"""
+
+    base_link: Optional[str] = None
+    """Root link of the IK chain (default: the URDF root link)"""
+
     @classmethod
     def from_yaml(cls, yaml_path: str | Path) -> "DifferentialIKConfig":
         """Load configuration from a YAML file.
 
+        The optional solver section sets backend, device, max_iterations and
+        max_step; the optional kinematics section sets urdf (relative to the
+        YAML file) and base_link for the numpy backend.
+
         Args:
             yaml_path: Path to the differential_ik_config.yaml file
 
@@ -124,6 +153,12 @@ class DifferentialIKConfig:
         with open(yaml_path, 'r') as f:
             data = yaml.safe_load(f)
 
+        solver = data.get("solver", {})
+        kinematics = data.get("kinematics", {})
+        urdf_path = kinematics.get("urdf")
+        if urdf_path is not None:
+            urdf_path = str(Path(yaml_path).parent / urdf_path)
+
         return cls(
             ik_method=data.get("ik_method", "dls"),
             lambda_val=data.get("ik_params", {}).get("lambda_val", 0.05),
@@ -133,4 +168,179 @@ class DifferentialIKConfig:
             velocity_threshold=data.get("motion_complete", {}).get("velocity_threshold", 0.008),
             home_pose=data.get("home_pose", [0.0] * 7),
             end_effector_body_name=data.get("end_effector", {}).get("body_name", "pointer"),
+            backend=solver.get("backend", "isaaclab"),
+            device=solver.get("device", "cuda:0"),
+            max_iterations=solver.get("max_iterations", 100),
+            max_step=solver.get("max_step", 0.2),
+            urdf_path=urdf_path,
+            base_link=kinematics.get("base_link"),
+        )
+
+
+# Arm joints of a SCARA with rails, in the order used by AnalyticalIKConfig
+SCARA_JOINTS = ("rail", "lift", "shoulder", "elbow", "wrist")
+
+
+@dataclass
+class AnalyticalIKConfig:
+    """Closed-form IK parameters for SCARA arms on a vertical lift (e.g., PF400).
+
+    The arm is modelled as an optional horizontal rail, a vertical lift and
+    three revolute joints (shoulder, elbow, wrist) about the base z axis.
+    Lengths are in meters, angles in radians, all in the robot base frame.
+    Loaded from assets/robots/<Manufacturer>/<Model>/isaacsim/analytical_ik_config.yaml.
+    """
+
+    # Joint indices into the full joint vector
+    joint_indices: dict[str, Optional[int]] = field(
+        default_factory=lambda: {"rail": 0, "lift": 1, "shoulder": 2, "elbow": 3, "wrist": 4}
+    )
+    """Index of each SCARA_JOINTS joint in the articulation joint vector (rail may be None)"""
+
+    # Geometry
+    upper_arm_length: float = 0.302
+    """Shoulder axis to elbow axis distance (meters)"""
+
+    forearm_length: float = 0.289
+    """Elbow axis to wrist axis distance (meters)"""
+
+    shoulder_offset: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    """Shoulder axis position at rail = lift = 0 (meters)"""
+
+    rail_axis: list[float] = field(default_factory=lambda: [1.0, 0.0, 0.0])
+    """Direction of travel of the horizontal rail"""
+
+    shoulder_zero_angle: float = 0.0
+    """Direction of the upper arm at shoulder = 0, measured from the base x axis"""
+
+    tool_offset: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    """End effector position relative to the wrist axis (at lift height 0) with all joints at 0"""
+
+    tool_orientation: list[float] = field(default_factory=lambda: [1.0, 0.0, 0.0, 0.0])
+    """End effector orientation [w, x, y, z] with all joints at 0"""
+
+    # Limits and tolerances
+    joint_limits: dict[str, list[float]] = field(default_factory=dict)
+    """[lower, upper] per SCARA_JOINTS joint (unlimited if missing)"""
+
+    orientation_tolerance: float = 0.01
+    """Largest tilt of the target away from a pure yaw rotation (radians)"""
+
+    # Home pose
+    home_pose: list[float] = field(default_factory=lambda: [0.0] * 7)
+    """Home joint positions"""
+
+    def get_limits(self, joint: str) -> tuple[float, float]:
+        """Get the [lower, upper] limits of a SCARA joint.
+
+        Args:
+            joint: One of SCARA_JOINTS
+
+        Returns:
+            Tuple of (lower, upper), infinite where unlimited
+        """
+        lower, upper = self.joint_limits.get(joint, (-float("inf"), float("inf")))
+        return float(lower), float(upper)
+
+    @classmethod
+    def from_yaml(cls, yaml_path: str | Path) -> "AnalyticalIKConfig":
+        """Load configuration from a YAML file.
+
+        Args:
+            yaml_path: Path to the analytical_ik_config.yaml file
+
+        Returns:
+            AnalyticalIKConfig instance with loaded values
+
+        Raises:
+            ValueError: If joint_indices or joint_limits name an unknown joint
+        """
+        with open(yaml_path, 'r') as f:
+            data = yaml.safe_load(f)
+
+        defaults = cls()
+        geometry = data.get("geometry", {})
+        joint_indices = {**defaults.joint_indices, **data.get("joints", {})}
+        joint_limits = data.get("joint_limits", {})
+
+        unknown = (set(joint_indices) | set(joint_limits)) - set(SCARA_JOINTS)
+        if unknown:
+            raise ValueError(f"Unknown SCARA joints {sorted(unknown)} in {yaml_path}, expected {SCARA_JOINTS}")
+
+        return cls(
+            joint_indices=joint_indices,
+            upper_arm_length=geometry.get("upper_arm_length", defaults.upper_arm_length),
+            forearm_length=geometry.get("forearm_length", defaults.forearm_length),
+            shoulder_offset=geometry.get("shoulder_offset", defaults.shoulder_offset),
+            rail_axis=geometry.get("rail_axis", defaults.rail_axis),
+            shoulder_zero_angle=geometry.get("shoulder_zero_angle", defaults.shoulder_zero_angle),
+            tool_offset=geometry.get("tool_offset", defaults.tool_offset),
+            tool_orientation=geometry.get("tool_orientation", defaults.tool_orientation),
+            joint_limits=joint_limits,
+            orientation_tolerance=data.get("tolerances", {}).get("orientation", 0.01),
+            home_pose=data.get("home_pose", [0.0] * 7),
+        )
+
+
+@dataclass
+class SamplingPlannerConfig:
+    """Collision proxies and RRT-Connect parameters for the sampling planner.
+
+    The robot is modelled as capsules along its links and obstacles as
+    boxes around the environment's collision prims. Loaded from
+    assets/robots/<Manufacturer>/<Model>/isaacsim/sampling_planner_config.yaml.
+    """
+
+    # Collision proxies
+    link_radii: list[float] = field(default_factory=lambda: [0.06, 0.05, 0.04])
+    """Capsule radius of each link segment, from the base outward (meters)"""
+
+    obstacle_margin: float = 0.01
+    """Padding added on every side of each obstacle box (meters)"""
+
+    exclude: list[str] = field(default_factory=lambda: ["locations"])
+    """Prims below the environment root that are never obstacles (relative paths)"""
+
+    edge_resolution: float = 0.02
+    """Largest joint change between collision-checked samples on an edge (radians or meters)"""
+
+    # RRT-Connect
+    step_size: float = 0.3
+    """Longest tree edge (joint-space norm)"""
+
+    max_iterations: int = 200
+    """Extension rounds before planning fails"""
+
+    batch_size: int = 16
+    """Random samples per extension round (their edges are checked together)"""
+
+    seed: Optional[int] = None
+    """Random seed for reproducible plans (None: unseeded)"""
+
+    @classmethod
+    def from_yaml(cls, yaml_path: str | Path) -> "SamplingPlannerConfig":
+        """Load configuration from a YAML file.
+
+        Args:
+            yaml_path: Path to the sampling_planner_config.yaml file
+
+        Returns:
+            SamplingPlannerConfig instance with loaded values
+        """
+        with open(yaml_path, 'r') as f:
+            data = yaml.safe_load(f)
+
+        defaults = cls()
+        collision = data.get("collision", {})
+        planner = data.get("planner", {})
+
+        return cls(
+            link_radii=collision.get("link_radii", defaults.link_radii),
+            obstacle_margin=collision.get("obstacle_margin", defaults.obstacle_margin),
+            exclude=collision.get("exclude", defaults.exclude),
+            edge_resolution=collision.get("edge_resolution", defaults.edge_resolution),
+            step_size=planner.get("step_size", defaults.step_size),
+            max_iterations=planner.get("max_iterations", defaults.max_iterations),
+            batch_size=planner.get("batch_size", defaults.batch_size),
+            seed=planner.get("seed", defaults.seed),
         )
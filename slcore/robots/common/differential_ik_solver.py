@@ -158,9 +158,12 @@ class DifferentialIKSolver:
         target_position: np.ndarray,
         target_orientation: np.ndarray,
         solution_preference: str = "closest_to_current",
-    ) -> tuple[np.ndarray, bool]:
+    ) -> tuple[np.ndarray, bool, int]:
         """Compute joint positions to achieve target end-effector pose.
 
+        Takes a single controller step from the current PhysX Jacobian; the
+        result is not iterated to convergence (see KinematicIKSolver).
+
         Args:
             target_position: Target position [x, y, z] in world frame (meters)
             target_orientation: Target orientation quaternion [w, x, y, z]
@@ -169,9 +172,10 @@ class DifferentialIKSolver:
                 - "closest_to_home": Prefer configurations near the defined home pose
 
         Returns:
-            Tuple of (joint_positions, success) where:
+            Tuple of (joint_positions, success, iterations) where:
                 - joint_positions: Computed joint angles (numpy array)
                 - success: True if IK found a valid solution
+                - iterations: Controller steps taken (always 1)
         """
         # Deferred import - only available after Isaac Sim starts
         from isaaclab.utils.math import subtract_frame_transforms
@@ -249,7 +253,7 @@ class DifferentialIKSolver:
         # Convert result to numpy
         result_joints = joint_pos_des.squeeze(0).cpu().numpy()
 
-        return result_joints, success
+        return result_joints, success, 1
 
     def reset(self):
         """Reset the controller state.
@@ -0,0 +1,153 @@
+"""Iterative differential IK solver on a URDF kinematic chain (NumPy, CPU).
+
+Counterpart of DifferentialIKSolver that does not need Isaac Lab, torch or a
+GPU. Instead of a single step from the simulator's current Jacobian, it
+iterates damped least-squares steps against the robot's URDF chain until the
+target is within DifferentialIKConfig's tolerances, so one call returns a
+converged solution.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from slcore.common import pose_math
+from slcore.motion.kinematics import IKSolution, KinematicChain, solve_ik
+from slcore.robots.common.config import DifferentialIKConfig
+
+
+class KinematicIKSolver:
+    """Solves IK for the joints of a URDF chain within a full joint vector.
+
+    Joints outside the chain (e.g., gripper fingers) keep their seed values.
+
+    Attributes:
+        chain: Kinematic chain from the base link to the end effector
+        config: Differential IK configuration parameters
+        joint_names: Names of the full joint vector, in articulation order
+    """
+
+    def __init__(
+        self,
+        config: DifferentialIKConfig,
+        joint_names: list[str],
+        get_joint_positions: Callable[[], np.ndarray],
+        chain: KinematicChain = None,
+    ):
+        """Initialize the solver.
+
+        Args:
+            config: Differential IK configuration (urdf_path is required
+                unless chain is given)
+            joint_names: Names of the full joint vector, in articulation order
+            get_joint_positions: Returns the current full joint vector (seed
+                for "closest_to_current")
+            chain: Prebuilt kinematic chain (default: loaded from config.urdf_path)
+
+        Raises:
+            ValueError: If no URDF is configured or a chain joint is not in joint_names
+        """
+        if chain is None:
+            if config.urdf_path is None:
+                raise ValueError("The numpy IK backend requires kinematics.urdf in differential_ik_config.yaml")
+            chain = KinematicChain.from_urdf(config.urdf_path, config.end_effector_body_name, config.base_link)
+
+        self.chain = chain
+        self.config = config
+        self.joint_names = list(joint_names)
+        self._get_joint_positions = get_joint_positions
+
+        missing = [name for name in chain.joint_names if name not in self.joint_names]
+        if missing:
+            raise ValueError(f"Chain joints {missing} not found in articulation joints {self.joint_names}")
+        self.chain_joint_ids = [self.joint_names.index(name) for name in chain.joint_names]
+
+        # Robot base pose in world frame (updated before each IK solve)
+        self.robot_base_pose = pose_math.IDENTITY_POSE.copy()
+
+    def set_robot_base_pose(self, position: np.ndarray, orientation: np.ndarray):
+        """Update the robot base pose for IK calculations.
+
+        Args:
+            position: Base position [x, y, z] in world frame
+            orientation: Base orientation quaternion [w, x, y, z]
+        """
+        self.robot_base_pose = pose_math.make_poses(position, orientation)
+
+    def get_seeds(self, solution_preference: str) -> np.ndarray:
+        """Get the full joint vector that seeds the solver.
+
+        Args:
+            solution_preference: "closest_to_current" or "closest_to_home"
+
+        Returns:
+            Full joint vector
+        """
+        if solution_preference == "closest_to_home":
+            return np.array(self.config.home_pose, dtype=float)
+        return np.array(self._get_joint_positions(), dtype=float)
+
+    def solve(
+        self,
+        target_positions: np.ndarray,
+        target_orientations: np.ndarray,
+        seeds: np.ndarray,
+    ) -> tuple[np.ndarray, IKSolution]:
+        """Solve IK for world-frame targets.
+
+        Args:
+            target_positions: (..., 3) target positions in world frame
+            target_orientations: (..., 4) target quaternions [w, x, y, z]
+            seeds: (..., num_joints) full joint vectors to start from
+
+        Returns:
+            Tuple of ((..., num_joints) full joint vectors, IKSolution for the chain joints)
+        """
+        targets_w = pose_math.make_poses(target_positions, target_orientations)
+        targets_b = pose_math.relative_poses(self.robot_base_pose, targets_w)
+
+        seeds = np.asarray(seeds, dtype=float)
+        solution = solve_ik(
+            self.chain,
+            targets_b,
+            seeds[..., self.chain_joint_ids],
+            ik_method=self.config.ik_method,
+            lambda_val=self.config.lambda_val,
+            position_tolerance=self.config.position_tolerance,
+            orientation_tolerance=self.config.orientation_tolerance,
+            max_iterations=self.config.max_iterations,
+            max_step=self.config.max_step,
+        )
+
+        batch_shape = solution.joint_positions.shape[:-1]
+        joint_positions = np.broadcast_to(seeds, batch_shape + seeds.shape[-1:]).copy()
+        joint_positions[..., self.chain_joint_ids] = solution.joint_positions
+        return joint_positions, solution
+
+    def compute_inverse_kinematics(
+        self,
+        target_position: np.ndarray,
+        target_orientation: np.ndarray,
+        solution_preference: str = "closest_to_current",
+    ) -> tuple[np.ndarray, bool, int]:
+        """Compute joint positions to achieve target end-effector pose.
+
+        Args:
+            target_position: Target position [x, y, z] in world frame (meters)
+            target_orientation: Target orientation quaternion [w, x, y, z]
+            solution_preference: "closest_to_current" or "closest_to_home" (seed choice)
+
+        Returns:
+            Tuple of (joint_positions, success, iterations), success meaning
+            the solver converged within tolerance
+        """
+        joint_positions, solution = self.solve(
+            target_position,
+            target_orientation,
+            self.get_seeds(solution_preference),
+        )
+        return joint_positions, bool(solution.converged), int(solution.iterations)
+
+    def reset(self):
+        """Reset solver state (the solver is stateless between calls)."""
+        pass
@@ -1,14 +1,19 @@
 from abc import ABC, abstractmethod
 
 import numpy as np
+from isaacsim.core.api import SimulationContext
 from isaacsim.core.utils.stage import get_current_stage
 from isaacsim.core.utils.types import ArticulationAction
 from omni.isaac.dynamic_control import _dynamic_control
 from omni.physx import get_physx_scene_query_interface
 from omni.usd.commands.usd_commands import DeletePrimsCommand
-from pxr import Gf, Sdf, UsdPhysics
+from pxr import Gf, PhysxSchema, Sdf, UsdPhysics
 
 from slcore.common import utils
+from slcore.common.stage_cache import get_rigid_body_cache
+from slcore.motion.base import CollisionError
+from slcore.motion.trajectory import JointTrajectory
+from slcore.robots.common.config import DEFAULT_PHYSICS_CONFIG
 
 class ZMQ_Robot_Server(ABC):
     """Base class for ZMQ robot handlers with enhanced end-effector robot functionality.
@@ -17,6 +22,9 @@ class ZMQ_Robot_Server(ABC):
     command handling and robot control logic.
     """
 
+    wants_collision_events = False
+    """Whether CollisionDetector should deliver contacts to on_collision()"""
+
     def __init__(
         self,
         simulation_app,
@@ -44,11 +52,23 @@ class ZMQ_Robot_Server(ABC):
         self.collision_detected = False
         self.collision_actors = None
 
+        # Contact reporting state (None until first sync)
+        self._contact_reporting_enabled = None
+        self._attached_objects: dict[str, str] = {}  # joint path -> attached prim path
+
         # Control state
         self.current_action = None
         self.target_joints = None
         self.target_pose = None
 
+        # Trajectory being streamed toward target_joints, sampled at the
+        # simulation time elapsed since the move started
+        self.target_trajectory: JointTrajectory = None
+        self._trajectory_time = 0.0
+
+        # Whether the current move passed check_move() (set on its first frame)
+        self._move_checked = True
+
     @abstractmethod
     def handle_command(self, request: dict) -> dict:
         """Handle incoming ZMQ command from MADSci - must be implemented by subclasses"""
@@ -64,35 +84,105 @@ class ZMQ_Robot_Server(ABC):
         """Helper to create standardized error response"""
         return {"status": "error", "message": message}
 
-    def raycast(self, src: Gf.Vec3d, direction: Gf.Vec3d, distance: float, filter_prim_path: str):
-        """Perform raycast to detect objects for gripping"""
+    def set_contact_reporting(self, enabled: bool, prim_path: str = None):
+        """Switch PhysX contact reports on or off for the robot or another prim.
+
+        The PhysxContactReportAPI stays applied; only its threshold changes, so
+        PhysX does not have to re-parse the articulation when reporting toggles.
+
+        Args:
+            enabled: True to report all contacts, False to suppress them
+            prim_path: Prim to toggle (default: the robot root prim)
+        """
+        stage = get_current_stage()
+        prim = stage.GetPrimAtPath(prim_path or self.robot_prim_path)
+        if not prim or not prim.IsValid():
+            return
+
+        if prim.HasAPI(PhysxSchema.PhysxContactReportAPI):
+            contact_report_api = PhysxSchema.PhysxContactReportAPI(prim)
+        else:
+            contact_report_api = PhysxSchema.PhysxContactReportAPI.Apply(prim)
+
+        threshold = (
+            DEFAULT_PHYSICS_CONFIG.contact_threshold
+            if enabled
+            else DEFAULT_PHYSICS_CONFIG.contact_threshold_disabled
+        )
+        contact_report_api.CreateThresholdAttr().Set(threshold)
+
+    def wants_contact_reporting(self) -> bool:
+        """Whether contacts should currently be reported (moving or holding an object)"""
+        return self.current_action is not None or bool(self._attached_objects)
+
+    def sync_contact_reporting(self):
+        """Enable or disable contact reporting to match the robot's activity.
+
+        Must be called from the simulation thread. Only authors USD when the
+        desired state changes, so it is cheap to call every frame.
+        """
+        enabled = self.wants_contact_reporting()
+        if enabled == self._contact_reporting_enabled:
+            return
+
+        self.set_contact_reporting(enabled)
+        for prim_path in self._attached_objects.values():
+            self.set_contact_reporting(enabled, prim_path)
+        self._contact_reporting_enabled = enabled
+
+    def raycast(
+        self,
+        src: Gf.Vec3d,
+        direction: Gf.Vec3d,
+        distance: float,
+        filter_prim_path: str,
+        closest_only: bool = True,
+    ):
+        """Perform raycast to detect rigid bodies for gripping or presence checks.
+
+        Hits on the filter prim's subtree and on non-rigid-body prims are
+        skipped. Rigid body lookups go through the shared stage cache.
+
+        Args:
+            src: Ray origin in world frame
+            direction: Ray direction in world frame
+            distance: Maximum ray length (meters)
+            filter_prim_path: Prim path whose subtree is ignored (usually the robot)
+            closest_only: If True, return only the closest hit prim; otherwise
+                return all hit prims ordered by distance
+
+        Returns:
+            Closest hit prim (or None), or a list of hit prims if closest_only is False
+        """
         physx_query = get_physx_scene_query_interface()
+        rigid_bodies = get_rigid_body_cache()
 
         hits = []
+        closest = {"prim": None, "distance": float("inf")}
+
         def ray_func(_hit):
             if _hit.rigid_body.startswith(filter_prim_path):
                 return True
 
-            stage = get_current_stage()
-            prim = stage.GetPrimAtPath(_hit.rigid_body)
-            if not prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            prim = rigid_bodies.get_rigid_body(_hit.rigid_body)
+            if prim is None:
                 return True
 
-            hits.append({
-                'hit': True,
-                'prim': prim,
-                'rigid_body': _hit.rigid_body,
-                'position': Gf.Vec3d(*_hit.position),
-                'normal': Gf.Vec3d(*_hit.normal),
-            })
+            if closest_only:
+                if _hit.distance < closest["distance"]:
+                    closest["prim"] = prim
+                    closest["distance"] = _hit.distance
+            else:
+                hits.append((_hit.distance, prim))
             return True
 
         physx_query.raycast_all(src, direction, distance, ray_func)
 
-        if hits:
-            hits = sorted(hits, key=lambda x: (src - x['position']).GetLength())
-            return hits[0]['prim']
-        return None
+        if closest_only:
+            return closest["prim"]
+
+        hits.sort(key=lambda hit: hit[0])
+        return [prim for _, prim in hits]
 
     def attach_object(self, target_prim_path: str, end_effector_name: str) -> str:
         """Attach a specific object using physics joints"""
@@ -132,6 +222,11 @@ class ZMQ_Robot_Server(ABC):
         # This prevents the object from snapping its rotation to match the gripper.
         joint_prim.CreateLocalRot1Attr().Set(Gf.Quatf(float(rel_rot[0]), float(rel_rot[1]), float(rel_rot[2]), float(rel_rot[3])))
 
+        # Held labware reports contacts for as long as it is attached
+        self._attached_objects[joint_path.pathString] = target_prim_path
+        self.set_contact_reporting(True, target_prim_path)
+        self._contact_reporting_enabled = None
+
         print(f"Robot {self.robot_name} attached object: {target_prim_path}")
         return joint_path.pathString
 
@@ -143,6 +238,10 @@ class ZMQ_Robot_Server(ABC):
         joint_path = Sdf.Path(joint_path_string)
         DeletePrimsCommand([joint_path]).do()
 
+        released_prim_path = self._attached_objects.pop(joint_path_string, None)
+        if released_prim_path:
+            self.set_contact_reporting(False, released_prim_path)
+
         # Wake up the released object
         dc = _dynamic_control.acquire_dynamic_control_interface()
         parent_rb = joint_path.GetParentPath().pathString
@@ -153,14 +252,79 @@ class ZMQ_Robot_Server(ABC):
         print(f"Robot {self.robot_name} detached object")
         return True
 
+    def detach_all_objects(self):
+        """Remove every attachment joint created by this handler"""
+        for joint_path in list(self._attached_objects):
+            self.detach_object(joint_path)
+
+    def set_trajectory(self, trajectory: JointTrajectory):
+        """Start a new move, streaming a trajectory on the following frames.
+
+        The move is checked by check_move() on its first frame.
+
+        Args:
+            trajectory: Time-parameterized joint trajectory ending at its final
+                positions, or None to drive straight to target_joints
+        """
+        self.target_trajectory = trajectory
+        self._trajectory_time = 0.0
+        self._move_checked = False
+        if trajectory is not None:
+            self.target_joints = trajectory.final_positions
+
+    def check_move(self, start_joints: np.ndarray):
+        """Check the path of a new move before any motion is sent to the simulation.
+
+        The path runs from start_joints through target_trajectory (or
+        straight) to target_joints. Subclasses with a collision model override
+        this; the base class accepts every move.
+
+        Args:
+            start_joints: Joint positions at the start of the move
+
+        Raises:
+            CollisionError: If the move would collide
+        """
+        pass
+
+    def reject_move(self, error: CollisionError):
+        """Drop a move that failed check_move() and report it like a collision.
+
+        Args:
+            error: Why the move was rejected
+        """
+        self.halt_motion()
+        self.target_joints = None
+        self.collision_detected = True
+        self.collision_actors = f"predicted: {error}"
+        print(f"Robot {self.robot_name} move rejected: {error}")
+
     def execute_move_joints(self):
         """Execute joint movement in simulation"""
         if self.target_joints is None:
             return
 
+        if not self._move_checked:
+            self._move_checked = True
+            try:
+                self.check_move(self.robot.get_joint_positions())
+            except CollisionError as e:
+                self.reject_move(e)
+                return
+
         if self.motion_type == "teleport":
             self.robot.set_joint_positions(self.target_joints)
+            self.target_trajectory = None
             self.current_action = None
+        elif self.target_trajectory is not None:
+            # Track the trajectory in simulation time, so the move takes its
+            # planned duration at any frame rate; settle on target_joints once it ends
+            positions = self.target_trajectory.sample(self._trajectory_time)
+            self.robot.apply_action(ArticulationAction(joint_positions=positions))
+            if self._trajectory_time >= self.target_trajectory.duration:
+                self.target_trajectory = None
+            else:
+                self._trajectory_time += SimulationContext.instance().get_rendering_dt()
         else:
             action = ArticulationAction(joint_positions=self.target_joints)
             self.robot.apply_action(action)
@@ -182,9 +346,65 @@ class ZMQ_Robot_Server(ABC):
         action = ArticulationAction(joint_positions=current_joints)
         self.robot.apply_action(action)
 
+        self.target_trajectory = None
         self.current_action = None
         print(f"Robot {self.robot_name} motion halted")
 
+    def get_state(self) -> dict:
+        """Get the handler state machine as a JSON-serializable dict.
+
+        Subclasses extend this with their own state (gripper joints, virtual
+        joints, etc.). Joint positions of the articulation are not included.
+        """
+        target_pose = None
+        if self.target_pose is not None:
+            target_pose = [np.asarray(part).tolist() for part in self.target_pose]
+
+        return {
+            "current_action": self.current_action,
+            "target_joints": None if self.target_joints is None else np.asarray(self.target_joints).tolist(),
+            "target_pose": target_pose,
+            "target_trajectory": None if self.target_trajectory is None else self.target_trajectory.to_dict(),
+            "trajectory_time": self._trajectory_time,
+            "move_checked": self._move_checked,
+            "is_paused": self.is_paused,
+            "collision_detected": self.collision_detected,
+            "collision_actors": self.collision_actors,
+            "attached_objects": dict(self._attached_objects),
+        }
+
+    def set_state(self, state: dict):
+        """Restore the handler state machine from get_state() output.
+
+        Attachment joints listed in attached_objects must already exist on
+        the stage; this only restores the handler's bookkeeping.
+        """
+        target_joints = state.get("target_joints")
+        target_pose = state.get("target_pose")
+        target_trajectory = state.get("target_trajectory")
+
+        self.current_action = state.get("current_action")
+        self.target_joints = None if target_joints is None else np.array(target_joints)
+        self.target_pose = None if target_pose is None else tuple(np.array(part) for part in target_pose)
+        self.target_trajectory = None if target_trajectory is None else JointTrajectory.from_dict(target_trajectory)
+        self._trajectory_time = state.get("trajectory_time", 0.0)
+        self._move_checked = state.get("move_checked", True)
+        self.is_paused = state.get("is_paused", False)
+        self.collision_detected = state.get("collision_detected", False)
+        self.collision_actors = state.get("collision_actors")
+        self._attached_objects = dict(state.get("attached_objects", {}))
+
+        # Force contact reporting to be re-applied on the next sync
+        self._contact_reporting_enabled = None
+
+    def warmup(self):
+        """Called once after world.reset(), before commands are served.
+
+        Subclasses override this to do expensive one-time setup (e.g.,
+        precomputing IK for named locations) outside the command path.
+        """
+        pass
+
     def update(self):
         """Called every simulation frame to execute robot actions - must be implemented by subclasses"""
         pass
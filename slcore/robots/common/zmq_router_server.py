@@ -39,6 +39,27 @@ class ZMQRouterServer:
         self.handlers[identity] = handler
         print(f"Registered handler: {identity}")
 
+    def unregister_handler(self, env_id: int, robot_type: str):
+        """Stop routing commands to a robot handler.
+
+        Args:
+            env_id: Environment ID (0-N)
+            robot_type: Robot type (e.g., "pf400", "peeler", "thermocycler")
+        """
+        identity = f"env_{env_id}.{robot_type}"
+        if self.handlers.pop(identity, None) is not None:
+            print(f"Unregistered handler: {identity}")
+
+    def register_admin_handler(self, handler, identity: str = "admin"):
+        """Register a handler for commands that are not tied to one robot.
+
+        Args:
+            handler: Object with a handle_command(request) -> dict method
+            identity: Client identity that reaches this handler (default: "admin")
+        """
+        self.handlers[identity] = handler
+        print(f"Registered admin handler: {identity}")
+
     def start_server(self):
         """Start ROUTER server in background thread."""
         self._thread = threading.Thread(target=self.zmq_server_thread, daemon=True)
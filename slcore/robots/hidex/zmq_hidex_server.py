@@ -81,6 +81,17 @@ class ZMQ_Hidex_Server(RaycastMixin, ZMQ_Robot_Server):
             except Exception as e:
                 print(f"Hidex failed to detach object: {e}")
 
+    def get_state(self) -> dict:
+        """Get handler state including the attached plate joint"""
+        state = super().get_state()
+        state["attached_plate"] = self._attached_plate
+        return state
+
+    def set_state(self, state: dict):
+        """Restore handler state including the attached plate joint"""
+        super().set_state(state)
+        self._attached_plate = state.get("attached_plate")
+
     def update(self):
         """Called every simulation frame to execute robot actions"""
         if self.is_paused:
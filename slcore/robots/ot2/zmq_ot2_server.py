@@ -473,6 +473,32 @@ class ZMQ_OT2_Server(ZMQ_Robot_Server):
         except Exception as e:
             return {"status": "error", "message": f"Failed to halt robot: {str(e)}"}
 
+    def get_state(self) -> dict:
+        """Get handler state including virtual joints, tips and lights"""
+        state = super().get_state()
+        state.update({
+            "is_moving": self.is_moving,
+            "motion_complete": self.motion_complete,
+            "virtual_joints": dict(self.virtual_joints),
+            "left_tip_attached": self.model.left_tip_attached,
+            "right_tip_attached": self.model.right_tip_attached,
+            "button_light": self.model.button_light,
+            "rail_lights": self.model.rail_lights,
+        })
+        return state
+
+    def set_state(self, state: dict):
+        """Restore handler state including virtual joints, tips and lights"""
+        super().set_state(state)
+        self.is_moving = state.get("is_moving", False)
+        self.motion_complete = state.get("motion_complete", False)
+        # Update in place so self.virtual_joints stays aliased to the model
+        self.virtual_joints.update(state.get("virtual_joints", {}))
+        self.model.left_tip_attached = state.get("left_tip_attached", False)
+        self.model.right_tip_attached = state.get("right_tip_attached", False)
+        self.model.button_light = state.get("button_light", False)
+        self.model.rail_lights = state.get("rail_lights", False)
+
     def update(self):
         """Called every simulation frame to execute robot actions"""
         if self.is_paused:
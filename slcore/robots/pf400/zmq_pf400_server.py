@@ -1,16 +1,48 @@
+import threading
+
 import numpy as np
 from isaacsim.core.utils.stage import get_current_stage
 from isaacsim.core.utils.types import ArticulationAction
 from pxr import Gf
 
 from slcore.common import utils
-from slcore.motion import IKError, MotionConfig, MotionDispatcher
-from slcore.motion.approaches import DifferentialIKApproach
+from slcore.common.parallel_config import get_env_prim_path
+from slcore.common.stage_cache import get_prim_name_index
+from slcore.motion import (
+    BoxProxies,
+    CollisionChecker,
+    CollisionError,
+    IKBatchQueue,
+    IKError,
+    IKRequest,
+    LocationRoadmap,
+    MotionConfig,
+    MotionDispatcher,
+    MotionResult,
+    PlanningError,
+    collect_obstacle_prims,
+    get_ik_batch_queue,
+    get_ik_cache,
+    get_location_joint_table,
+    get_location_roadmap,
+    layout_hash,
+)
+from slcore.motion.approaches import (
+    AnalyticalIKApproach,
+    BatchedDifferentialIKApproach,
+    DifferentialIKApproach,
+    SamplingPlannerApproach,
+)
+from slcore.motion.kinematics import ScaraKinematics
+from slcore.motion.trajectory import TrajectoryGenerator
+from slcore.robots.common.batched_ik_solver import BatchedDifferentialIKSolver, get_batched_ik_solver
 from slcore.robots.common.zmq_robot_server import ZMQ_Robot_Server
 from slcore.robots.common.config import (
     CUSTOM_ASSETS_ROOT_PATH,
     DEFAULT_PHYSICS_CONFIG,
+    AnalyticalIKConfig,
     DifferentialIKConfig,
+    SamplingPlannerConfig,
 )
 from slcore.robots.common.zmq_server_mixins import RaycastMixin
 from slcore.robots.common.isaaclab_articulation import create_articulation_from_prim
@@ -19,19 +51,27 @@ from slcore.robots.common.isaaclab_articulation import create_articulation_from_
 class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
     """Handles ZMQ communication for PF400 robot with integrated control.
 
-    Uses the motion architecture with DifferentialIKApproach for inverse
+    Uses the motion architecture with DifferentialIKApproach (and
+    AnalyticalIKApproach, when enabled in motion_config.yaml) for inverse
     kinematics. The MotionDispatcher handles approach selection and validation.
     """
 
+    wants_collision_events = True
+
     def __init__(self, simulation_app, robot, robot_prim_path, robot_name: str, env_id: int):
         super().__init__(simulation_app, robot, robot_prim_path, robot_name, env_id)
 
         # PF400-specific gripper state
         self._grab_joint = None
+        self._microplate_path = f"/World/env_{self.env_id}/microplate"
 
         # IK solution preference (set per goto_pose call)
         self.solution_preference = "closest_to_current"
 
+        # Held while update() runs an action and while commands (ZMQ thread)
+        # hand over a new move, so a frame never sees a half-assigned target
+        self._action_lock = threading.Lock()
+
         # PF400-specific raycast configuration
         self.raycast_direction = Gf.Vec3d(0, 0, -1)  # Downward for PF400
         self.raycast_distance = DEFAULT_PHYSICS_CONFIG.raycast_distance
@@ -40,9 +80,27 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
         self.motion_config: MotionConfig = None
         self.motion_dispatcher: MotionDispatcher = None
         self.diff_ik_config: DifferentialIKConfig = None
+        self.analytical_ik_config: AnalyticalIKConfig = None
+        self.planner_config: SamplingPlannerConfig = None
+        self.sampling_planner: SamplingPlannerApproach = None
+        self.collision_config: SamplingPlannerConfig = None
+        self.move_checker: CollisionChecker = None
+        self.roadmap_config: SamplingPlannerConfig = None
         self.isaac_lab_articulation = None
         self._motion_initialized = False
 
+        # Batched IK ("batched" backend): shared solver and queue, and this robot's pending request
+        self.batched_ik_solver: BatchedDifferentialIKSolver = None
+        self.ik_batch_queue: IKBatchQueue = None
+        self._ik_request: IKRequest = None
+
+        # Joint positions of this environment's location prims, filled by warmup()
+        self.location_joints = get_location_joint_table("pf400")
+
+        # Collision-free paths between those locations (shared by identical layouts)
+        self.location_roadmap: LocationRoadmap = None
+        self.roadmap_generator: TrajectoryGenerator = None
+
     def handle_command(self, request: dict) -> dict:
         """Handle incoming ZMQ command"""
         action = request.get("action", "")
@@ -56,8 +114,10 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
             if len(joint_positions) != expected_joints:
                 return self.create_error_response(f"Expected {expected_joints} joint positions, got {len(joint_positions)}")
 
-            self.current_action = "move_joints"
-            self.target_joints = np.array(joint_positions)
+            with self._action_lock:
+                self.target_joints = np.array(joint_positions)
+                self.set_trajectory(None)
+                self.current_action = "move_joints"
             return self.create_success_response("command queued", joint_positions=joint_positions)
 
         elif action == "get_joints":
@@ -75,8 +135,11 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
                 "has_attached_object": bool(self._grab_joint),
                 "is_moving": is_moving,
                 "motion_complete": motion_complete,
-                "collision_detected": self.collision_detected
+                "collision_detected": self.collision_detected,
+                "collision_actors": self.collision_actors,
             }
+            if self.motion_dispatcher is not None and self.motion_dispatcher.ik_cache is not None:
+                status["ik_cache"] = self.motion_dispatcher.ik_cache.get_stats()
             return self.create_success_response("status retrieved", data=status)
 
         elif action == "gripper_open":
@@ -99,10 +162,15 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
             if solution_preference not in ("closest_to_current", "closest_to_home"):
                 return self.create_error_response("solution_preference must be 'closest_to_current' or 'closest_to_home'")
 
-            self.current_action = "goto_pose"
-            self.target_pose = (np.array(position), np.array(orientation))
-            self.solution_preference = solution_preference
-            self.requested_approach = approach
+            # Clear the previous move's joints so IK runs for the new pose
+            with self._action_lock:
+                self.target_joints = None
+                self._ik_request = None
+                self.set_trajectory(None)
+                self.target_pose = (np.array(position), np.array(orientation))
+                self.solution_preference = solution_preference
+                self.requested_approach = approach
+                self.current_action = "goto_pose"
             return self.create_success_response(
                 "goto_pose queued",
                 position=position,
@@ -122,30 +190,71 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
             if solution_preference not in ("closest_to_current", "closest_to_home"):
                 return self.create_error_response("solution_preference must be 'closest_to_current' or 'closest_to_home'")
 
-            # Get prim from stage
-            stage = get_current_stage()
-            prim = stage.GetPrimAtPath(prim_name)
-
-            if not prim or not prim.IsValid():
+            # Accept a full prim path or a bare name (e.g., "peeler_nest") in this robot's environment
+            prim_path = get_prim_name_index().resolve(prim_name, self.env_id)
+            if prim_path is None:
                 return self.create_error_response(f"Prim not found: {prim_name}")
 
+            stage = get_current_stage()
+            prim = stage.GetPrimAtPath(prim_path)
+
+            # Location markers have joints solved at warmup; reuse them (like
+            # goto_location) unless the client asked for a specific approach
+            locations_path = f"{get_env_prim_path(self.env_id)}/locations"
+            if approach is None and str(prim.GetPath().GetParentPath()) == locations_path:
+                joint_positions = self.location_joints.get(self.env_id, prim.GetName())
+                if joint_positions is not None:
+                    self._queue_location_move(prim.GetName(), joint_positions)
+                    return self.create_success_response(
+                        "goto_prim queued",
+                        prim_name=prim_name,
+                        prim_path=prim_path,
+                        location=prim.GetName(),
+                        joint_positions=joint_positions.tolist(),
+                    )
+
             # Get prim world position and orientation
             position, orientation = utils.get_xform_world_pose(prim)
 
             # Queue goto_pose with prim's pose
-            self.current_action = "goto_pose"
-            self.target_pose = (position, orientation)
-            self.solution_preference = solution_preference
-            self.requested_approach = approach
+            with self._action_lock:
+                self.target_joints = None
+                self._ik_request = None
+                self.set_trajectory(None)
+                self.target_pose = (position, orientation)
+                self.solution_preference = solution_preference
+                self.requested_approach = approach
+                self.current_action = "goto_pose"
             return self.create_success_response(
                 "goto_prim queued",
                 prim_name=prim_name,
+                prim_path=prim_path,
                 position=position.tolist(),
                 orientation=orientation.tolist(),
                 solution_preference=solution_preference,
                 approach=approach,
             )
 
+        elif action == "goto_location":
+            location = request.get("location", "")
+            if not location:
+                return self.create_error_response("goto_location requires location parameter")
+
+            # Joint positions were solved at startup, so no IK runs here
+            joint_positions = self.location_joints.get(self.env_id, location)
+            if joint_positions is None:
+                known = self.location_joints.get_names(self.env_id)
+                return self.create_error_response(
+                    f"No precomputed joints for location '{location}' (known: {known}); use goto_prim instead"
+                )
+
+            self._queue_location_move(location, joint_positions)
+            return self.create_success_response(
+                "goto_location queued",
+                location=location,
+                joint_positions=joint_positions.tolist(),
+            )
+
         elif action == "get_ee_pose":
             # Get end effector (pointer) world position and orientation
             stage = get_current_stage()
@@ -219,7 +328,7 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
             return
 
         # Use environment-specific microplate path for parallel environments
-        microplate_path = f"/World/env_{self.env_id}/microplate"
+        microplate_path = self._microplate_path
         involves_microplate = microplate_path in actor0 or microplate_path in actor1
         involves_robot = actor0.startswith(self.robot_prim_path) or actor1.startswith(self.robot_prim_path)
         holding_microplate = self._grab_joint is not None
@@ -248,6 +357,26 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
         self.halt_motion()
         self.current_action = None
 
+    def get_state(self) -> dict:
+        """Get handler state including gripper and IK request state"""
+        state = super().get_state()
+        state.update({
+            "grab_joint": self._grab_joint,
+            "solution_preference": self.solution_preference,
+            "requested_approach": getattr(self, "requested_approach", None),
+        })
+        return state
+
+    def set_state(self, state: dict):
+        """Restore handler state including gripper and IK request state"""
+        super().set_state(state)
+        self._grab_joint = state.get("grab_joint")
+        self.solution_preference = state.get("solution_preference", "closest_to_current")
+        self.requested_approach = state.get("requested_approach")
+
+        # A pending batched IK request is resubmitted from target_pose
+        self._ik_request = None
+
     def update(self):
         """Called every simulation frame to execute robot actions"""
         if self.is_paused:
@@ -256,20 +385,21 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
         if self.current_action is None:
             return
 
-        if self.current_action == "move_joints":
-            self.execute_move_joints()
-        elif self.current_action == "goto_pose":
-            self.execute_goto_pose()
-        elif self.current_action == "gripper_open":
-            self.execute_gripper_open()
-        elif self.current_action == "gripper_close":
-            self.execute_gripper_close()
+        with self._action_lock:
+            if self.current_action == "move_joints":
+                self.execute_move_joints()
+            elif self.current_action == "goto_pose":
+                self.execute_goto_pose()
+            elif self.current_action == "gripper_open":
+                self.execute_gripper_open()
+            elif self.current_action == "gripper_close":
+                self.execute_gripper_close()
 
     def _ensure_motion_initialized(self):
         """Lazily initialize motion dispatcher on first use.
 
         Isaac Lab Articulation requires physics simulation to be running,
-        so we defer initialization until the first goto_pose call.
+        so we defer initialization until warmup() or the first goto_pose call.
         """
         if self._motion_initialized:
             return
@@ -279,31 +409,381 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
         motion_config_path = config_dir / "motion_config.yaml"
         self.motion_config = MotionConfig.from_yaml(motion_config_path)
 
-        # Create dispatcher
-        self.motion_dispatcher = MotionDispatcher(self.motion_config)
-
         # Load differential IK config for the approach
         diff_ik_config_path = config_dir / "differential_ik_config.yaml"
         self.diff_ik_config = DifferentialIKConfig.from_yaml(diff_ik_config_path)
 
-        # Create Isaac Lab Articulation wrapper (points to same USD prim as self.robot)
-        self.isaac_lab_articulation = create_articulation_from_prim(
-            prim_path=self.robot_prim_path,
-            device="cuda:0",
-        )
+        # Load analytical IK config if the approach is enabled in motion_config.yaml;
+        # the sampling planner and the move check also use it for their link model
+        analytical_approach_config = self.motion_config.get_approach_config("analytical_ik")
+        planner_approach_config = self.motion_config.get_approach_config("sampling_planner")
+        collision_config_path = self.motion_config.execution.collision_config_path
+        roadmap_enabled = self.motion_config.roadmap.enabled
+        if (
+            analytical_approach_config is not None
+            or planner_approach_config is not None
+            or collision_config_path
+            or roadmap_enabled
+        ):
+            analytical_config_name = getattr(analytical_approach_config, "config_path", None) or "analytical_ik_config.yaml"
+            self.analytical_ik_config = AnalyticalIKConfig.from_yaml(config_dir / analytical_config_name)
+        if planner_approach_config is not None:
+            planner_config_path = config_dir / (planner_approach_config.config_path or "sampling_planner_config.yaml")
+            self.planner_config = SamplingPlannerConfig.from_yaml(planner_config_path)
+        if collision_config_path:
+            self.collision_config = SamplingPlannerConfig.from_yaml(config_dir / collision_config_path)
+        if roadmap_enabled:
+            self.roadmap_config = SamplingPlannerConfig.from_yaml(config_dir / self.motion_config.roadmap.config_path)
+
+        # Create dispatcher with the IK cache shared by all PF400s; solutions
+        # computed under a different configuration are dropped
+        ik_cache = get_ik_cache("pf400", self.motion_config.ik_cache)
+        ik_cache.validate_config(repr((self.motion_config.approaches, self.diff_ik_config, self.analytical_ik_config)))
+        self.motion_dispatcher = MotionDispatcher(self.motion_config, ik_cache=ik_cache)
+
+        if self.diff_ik_config.backend == "batched":
+            diff_ik_approach = self._create_batched_ik_approach(ik_cache)
+        else:
+            if self.diff_ik_config.backend == "numpy":
+                # Iterative CPU solver against the URDF chain; no PhysX view needed
+                joint_names = list(self.robot.dof_names)
+            else:
+                # Create Isaac Lab Articulation wrapper (points to same USD prim as self.robot)
+                self.isaac_lab_articulation = create_articulation_from_prim(
+                    prim_path=self.robot_prim_path,
+                    device=self.diff_ik_config.device,
+                )
+                joint_names = self.isaac_lab_articulation.data.joint_names
+
+            diff_ik_approach = DifferentialIKApproach(
+                articulation=self.isaac_lab_articulation,
+                config=self.diff_ik_config,
+                joint_names=joint_names,
+                get_joint_positions=self.robot.get_joint_positions,
+            )
 
-        # Create and register differential IK approach
-        diff_ik_approach = DifferentialIKApproach(
-            articulation=self.isaac_lab_articulation,
-            config=self.diff_ik_config,
-            joint_names=self.isaac_lab_articulation.data.joint_names,
-            device="cuda:0",
-        )
+        # Register differential IK approach
         self.motion_dispatcher.register_approach("differential_ik", diff_ik_approach)
 
+        # Closed-form SCARA IK needs no articulation view at all
+        if analytical_approach_config is not None:
+            analytical_ik_approach = AnalyticalIKApproach(
+                config=self.analytical_ik_config,
+                get_joint_positions=self.robot.get_joint_positions,
+            )
+            self.motion_dispatcher.register_approach("analytical_ik", analytical_ik_approach)
+
+        # Collision-aware planning around box proxies of the environment
+        if self.planner_config is not None:
+            self.sampling_planner = SamplingPlannerApproach(
+                ik_approach=AnalyticalIKApproach(
+                    config=self.analytical_ik_config,
+                    get_joint_positions=self.robot.get_joint_positions,
+                ),
+                checker=self._create_collision_checker(self.planner_config),
+                config=self.planner_config,
+                joint_limits=self._planned_joint_limits(),
+                get_joint_positions=self.robot.get_joint_positions,
+                trajectory_config=self.motion_config.trajectory,
+            )
+            self.motion_dispatcher.register_approach("sampling_planner", self.sampling_planner)
+
+        # Swept-volume check of every joint move before it starts
+        if self.collision_config is not None:
+            self.move_checker = self._create_collision_checker(self.collision_config)
+
         self._motion_initialized = True
         print(f"Motion dispatcher initialized for {self.robot_name}")
 
+    def _planned_joint_limits(self) -> dict[int, tuple[float, float]]:
+        """Get the limits of the arm joints sampled by the planners, by joint index."""
+        return {
+            index: self.analytical_ik_config.get_limits(joint)
+            for joint, index in self.analytical_ik_config.joint_indices.items()
+            if index is not None
+        }
+
+    def _create_collision_checker(self, config: SamplingPlannerConfig) -> CollisionChecker:
+        """Create a collision checker on the SCARA link model.
+
+        Args:
+            config: Collision proxy settings
+
+        Returns:
+            CollisionChecker without obstacles
+        """
+        kinematics = ScaraKinematics(self.analytical_ik_config)
+        return CollisionChecker(
+            link_points=kinematics.link_points,
+            link_radii=config.link_radii,
+            reference_joint_positions=self.analytical_ik_config.home_pose,
+            resolution=config.edge_resolution,
+            tool_poses=kinematics.forward_kinematics,
+        )
+
+    def _update_collision_proxies(self, checker: CollisionChecker, config: SamplingPlannerConfig):
+        """Rebuild a checker's obstacle and held object boxes from the current stage.
+
+        Labware moves between motions, so the environment's collision prims
+        are collected again for every checked motion. The robot itself and
+        the configured exclusions are skipped; held labware is carried with
+        the tool instead.
+
+        Args:
+            checker: Checker to update
+            config: Collision proxy settings
+        """
+        stage = get_current_stage()
+        env_prim_path = get_env_prim_path(self.env_id)
+        held_paths = list(self._attached_objects.values())
+        exclude = [self.robot_prim_path, *held_paths]
+        exclude += [f"{env_prim_path}/{name}" for name in config.exclude]
+
+        robot_pos, robot_rot = utils.get_xform_world_pose(self.robot_prim)
+        checker.set_robot_base_pose(robot_pos, robot_rot)
+
+        env_prim = stage.GetPrimAtPath(env_prim_path)
+        checker.set_obstacles(BoxProxies.from_prims(collect_obstacle_prims(env_prim, exclude), config.obstacle_margin))
+
+        held_prims = []
+        for path in held_paths:
+            held_prims += collect_obstacle_prims(stage.GetPrimAtPath(path))
+        checker.set_attached(BoxProxies.from_prims(held_prims), self.robot.get_joint_positions())
+
+    def _load_location_roadmap(self):
+        """Load or build the roadmap between this environment's precomputed locations.
+
+        Only static colliders are obstacles (labware that can be moved is
+        not), so the roadmap stays valid while plates move; moves along it
+        are still checked against the full scene by check_move().
+        """
+        config = self.roadmap_config
+        names = self.location_joints.get_names(self.env_id)
+        if len(names) < 2:
+            return
+        joint_positions = np.stack([self.location_joints.get(self.env_id, name) for name in names])
+
+        env_prim_path = get_env_prim_path(self.env_id)
+        exclude = [self.robot_prim_path] + [f"{env_prim_path}/{name}" for name in config.exclude]
+        env_prim = get_current_stage().GetPrimAtPath(env_prim_path)
+        obstacles = BoxProxies.from_prims(
+            collect_obstacle_prims(env_prim, exclude, static_only=True),
+            config.obstacle_margin,
+        )
+
+        robot_pos, robot_rot = utils.get_xform_world_pose(self.robot_prim)
+        key = layout_hash(
+            repr((self.analytical_ik_config, config)),
+            names,
+            joint_positions,
+            obstacles,
+            robot_pos,
+            robot_rot,
+        )
+
+        def build() -> LocationRoadmap:
+            checker = self._create_collision_checker(config)
+            checker.set_robot_base_pose(robot_pos, robot_rot)
+            checker.set_obstacles(obstacles)
+            print(f"Robot {self.robot_name} building roadmap over {len(names)} locations")
+            return LocationRoadmap.build(names, joint_positions, checker, config, self._planned_joint_limits(), key)
+
+        cache_dir = self.motion_config.roadmap.cache_dir
+        self.location_roadmap = get_location_roadmap(
+            "pf400",
+            key,
+            build,
+            cache_dir=None if cache_dir is None else CUSTOM_ASSETS_ROOT_PATH / cache_dir,
+        )
+        self.roadmap_generator = TrajectoryGenerator(self.motion_config.trajectory)
+        print(
+            f"Robot {self.robot_name} roadmap ready: "
+            f"{self.location_roadmap.num_paths()}/{len(names) * (len(names) - 1) // 2} location pairs connected"
+        )
+
+    def _queue_location_move(self, location: str, joint_positions: np.ndarray):
+        """Queue a move to a location's precomputed joint positions.
+
+        Follows the roadmap path when starting at another location; otherwise
+        time-parameterizes the straight move if the default approach is
+        paired with a generator.
+
+        Args:
+            location: Location prim name
+            joint_positions: Joint positions solved for the location at warmup
+        """
+        start_joints = self.robot.get_joint_positions()
+        path = self._roadmap_path(start_joints, location)
+        if path is not None:
+            trajectory = self.roadmap_generator.generate_path(path)
+        elif self.motion_dispatcher is not None:
+            trajectories = self.motion_dispatcher.plan_trajectories(start_joints[None], joint_positions[None])
+            trajectory = None if trajectories is None else trajectories[0]
+        else:
+            trajectory = None
+
+        with self._action_lock:
+            self.target_joints = joint_positions
+            self.set_trajectory(trajectory)
+            self.current_action = "move_joints"
+
+    def _roadmap_path(self, start_joints: np.ndarray, location: str) -> np.ndarray:
+        """Get the precomputed path to a location, if the robot is at another location.
+
+        Args:
+            start_joints: Current joint positions
+            location: Goal location name
+
+        Returns:
+            (W, num_joints) waypoints starting at start_joints, or None if
+            there is no roadmap, the robot is not at a location, or the pair
+            has no stored path
+        """
+        roadmap = self.location_roadmap
+        if roadmap is None:
+            return None
+        start = roadmap.nearest_location(start_joints, self.motion_config.roadmap.tolerance)
+        if start is None or start == location:
+            return None
+
+        path = roadmap.path(start, location)
+        if path is None:
+            return None
+        path[0] = start_joints
+        return path
+
+    def check_move(self, start_joints: np.ndarray):
+        """Reject moves whose joint path would hit the environment or held labware.
+
+        The link capsules and held labware are swept along the path at the
+        configured edge resolution. Does nothing unless
+        execution.collision_config_path is set in motion_config.yaml.
+
+        Args:
+            start_joints: Joint positions at the start of the move
+
+        Raises:
+            CollisionError: If the move would collide
+        """
+        self._ensure_motion_initialized()
+        if self.move_checker is None:
+            return
+
+        self._update_collision_proxies(self.move_checker, self.collision_config)
+        if self.target_trajectory is not None:
+            waypoints = np.vstack([start_joints, self.target_trajectory.positions])
+        else:
+            waypoints = np.stack([start_joints, self.target_joints])
+
+        collision = self.move_checker.first_collision(waypoints)
+        if collision is not None:
+            joint_positions, obstacles = collision
+            raise CollisionError(obstacles, joint_positions)
+
+    def _create_batched_ik_approach(self, ik_cache) -> BatchedDifferentialIKApproach:
+        """Join the differential IK solver and batch queue shared by all PF400s.
+
+        The first PF400 creates the solver, whose PhysX view spans this
+        robot's prim in every environment, and the queue's dispatcher.
+
+        Args:
+            ik_cache: IK cache shared by all PF400s
+
+        Returns:
+            Approach bound to this robot, for synchronous solves (e.g., warmup)
+        """
+        prim_path_pattern = self.robot_prim_path.replace(get_env_prim_path(self.env_id), "/World/env_*", 1)
+        device = self.diff_ik_config.device
+        self.batched_ik_solver = get_batched_ik_solver(
+            "pf400",
+            view_factory=lambda: create_articulation_from_prim(prim_path=prim_path_pattern, device=device),
+            config=self.diff_ik_config,
+        )
+
+        self.ik_batch_queue = get_ik_batch_queue("pf400")
+        if self.ik_batch_queue.dispatcher is None:
+            batch_dispatcher = MotionDispatcher(self.motion_config, ik_cache=ik_cache)
+            batch_dispatcher.register_approach("differential_ik", BatchedDifferentialIKApproach(self.batched_ik_solver))
+            self.ik_batch_queue.dispatcher = batch_dispatcher
+
+        return BatchedDifferentialIKApproach(self.batched_ik_solver, prim_path=self.robot_prim_path)
+
+    def _poll_batched_ik(self, approach: str, base_pose: tuple[np.ndarray, np.ndarray]) -> MotionResult:
+        """Submit this robot's goto_pose IK to the shared batch queue, or collect its result.
+
+        Args:
+            approach: Requested approach name, or None for default
+            base_pose: (position, orientation) of the robot base in world frame
+
+        Returns:
+            MotionResult once the queue has been flushed, otherwise None
+        """
+        if self._ik_request is None:
+            target_position, target_orientation = self.target_pose
+            self._ik_request = self.ik_batch_queue.submit(
+                target_position,
+                target_orientation,
+                row=self.batched_ik_solver.row_of(self.robot_prim_path),
+                base_pose=base_pose,
+                approach=approach,
+                solution_preference=self.solution_preference,
+                start_joint_positions=self.robot.get_joint_positions(),
+            )
+            return None
+
+        if not self._ik_request.done:
+            return None
+
+        result, self._ik_request = self._ik_request.result, None
+        return result
+
+    def warmup(self):
+        """Precompute IK for every location prim in this robot's environment.
+
+        All children of /World/env_N/locations are solved in one batch and
+        stored in the location table, so goto_location commands go straight
+        to move_joints. Locations whose IK fails are skipped (goto_prim still
+        works for them). With roadmap.enabled in motion_config.yaml, the
+        collision-free paths between the locations are then loaded from the
+        roadmap cache or built.
+        """
+        stage = get_current_stage()
+        locations_prim = stage.GetPrimAtPath(f"{get_env_prim_path(self.env_id)}/locations")
+        if not locations_prim:
+            return
+
+        location_prims = list(locations_prim.GetChildren())
+        if not location_prims:
+            return
+
+        self._ensure_motion_initialized()
+
+        robot_pos, robot_rot = utils.get_xform_world_pose(self.robot_prim)
+        self.motion_dispatcher.set_robot_base_pose(robot_pos, robot_rot)
+
+        # Solutions must not depend on where the robot happens to be at startup
+        positions, orientations = utils.get_xform_world_poses(location_prims)
+        results = self.motion_dispatcher.compute_motion_batch(
+            positions,
+            orientations,
+            solution_preference="closest_to_home",
+        )
+
+        self.location_joints.clear_env(self.env_id)
+        failed = []
+        for prim, result in zip(location_prims, results):
+            if result.success:
+                self.location_joints.set(self.env_id, prim.GetName(), result.joint_positions)
+            else:
+                failed.append(prim.GetName())
+
+        print(f"Robot {self.robot_name} precomputed {len(location_prims) - len(failed)}/{len(location_prims)} locations")
+        if failed:
+            print(f"Robot {self.robot_name} could not solve IK for locations: {failed}")
+
+        if self.roadmap_config is not None:
+            self._load_location_roadmap()
+
     def execute_goto_pose(self):
         """Execute pose-based movement using the motion dispatcher.
 
@@ -328,37 +808,52 @@ class ZMQ_PF400_Server(RaycastMixin, ZMQ_Robot_Server):
 
         target_position, target_orientation = self.target_pose
 
-        # Update robot base pose for the differential IK approach
+        # Update robot base pose for the approaches and the IK cache
         robot_pos, robot_rot = utils.get_xform_world_pose(self.robot_prim)
-        diff_ik_approach = self.motion_dispatcher.get_approach("differential_ik")
-        if diff_ik_approach:
-            diff_ik_approach.set_robot_base_pose(robot_pos, robot_rot)
+        self.motion_dispatcher.set_robot_base_pose(robot_pos, robot_rot)
 
         # Get approach name (explicit or None for default)
         approach = getattr(self, 'requested_approach', None)
 
-        try:
-            # Compute motion using dispatcher
-            result = self.motion_dispatcher.compute_motion(
-                target_position=target_position,
-                target_orientation=target_orientation,
-                approach=approach,
-                solution_preference=self.solution_preference,
-            )
+        approach_name = self.motion_dispatcher.resolve_approach(approach)[0]
+        if approach_name == "sampling_planner":
+            self._update_collision_proxies(self.sampling_planner.checker, self.planner_config)
 
-            # Cache the computed joint positions and clear pose target
+        try:
+            if self.ik_batch_queue is not None and approach_name == "differential_ik":
+                # Solved with every other robot's requests at the end of the frame
+                result = self._poll_batched_ik(approach, (robot_pos, robot_rot))
+                if result is None:
+                    return
+                if not result.success:
+                    raise IKError(target_position, target_orientation, message=result.error_message)
+            else:
+                # Compute motion using dispatcher
+                result = self.motion_dispatcher.compute_motion(
+                    target_position=target_position,
+                    target_orientation=target_orientation,
+                    approach=approach,
+                    solution_preference=self.solution_preference,
+                    start_joint_positions=self.robot.get_joint_positions(),
+                )
+
+            # Cache the computed joint positions (and trajectory, if the approach
+            # is paired with a generator) and clear pose target
             self.target_joints = result.joint_positions
+            self.set_trajectory(result.trajectory)
             self.target_pose = None
             self.requested_approach = None
+            iterations = f" in {result.iterations} iterations" if result.iterations is not None else ""
+            duration = f" ({result.trajectory.duration:.2f}s trajectory)" if result.trajectory is not None else ""
             print(
-                f"Robot {self.robot_name} IK computed target joints: "
+                f"Robot {self.robot_name} IK computed target joints{iterations}{duration}: "
                 f"{result.joint_positions.tolist()}"
             )
 
             # Start driving to the computed joint positions
             self.execute_move_joints()
 
-        except IKError as e:
+        except (IKError, PlanningError) as e:
             self.current_action = None
             self.target_pose = None
             self.requested_approach = None
@@ -0,0 +1,477 @@
+"""
+USD Asset Preflight Compiler
+
+Compiles robot and labware assets into flattened binary layers so that each
+environment composes one small layer stack instead of the asset's full
+reference, sublayer and material graph. Every asset is split into:
+
+    <name>.physics.usdc   Prims, transforms, joints, rigid bodies and colliders
+    <name>.visual.usdc    Render-only meshes and materials
+    <name>.usdc           Root layer sublayering physics (drop-in for the source)
+
+Each render-only subtree is replaced in the physics layer by a stub prim with
+a payload to the visual layer, so stages that leave payloads unloaded (see
+ParallelConfig.observed_envs) compose colliders but no visual meshes.
+
+Output goes to assets/.compiled/<name>-<hash>/, where <hash> covers the
+contents of every layer and texture the asset depends on, and is recorded in
+assets/.compiled/manifest.json. create_robot() picks up the compiled root
+layer automatically while the manifest entry is current
+(see slcore/common/compiled_assets.py). Only needs the pxr module, so it also
+runs with the CPU usd-core package.
+
+Usage:
+python tools/usd_asset_compiler.py assets/robots/Brooks/PF400/PF400.usd assets/labware/microplate/microplate.usd
+python tools/usd_asset_compiler.py --force --benchmark assets/robots/Azenta/XPeel/XPeel.usd
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from pxr import Sdf, Usd, UsdUtils
+
+from slcore.common.compiled_assets import (
+    COMPILED_ASSETS_DIR,
+    COMPILER_VERSION,
+    get_file_stamp,
+    get_source_key,
+    is_entry_current,
+    load_manifest,
+    save_manifest,
+)
+
+
+# Prim types that only matter for rendering
+VISUAL_PRIM_TYPES = {
+    "Material", "Shader", "NodeGraph", "GeomSubset", "Camera",
+    "DistantLight", "DomeLight", "DiskLight", "RectLight", "SphereLight", "CylinderLight",
+}
+
+# Geometry types, render-only unless a physics schema is applied to them
+GPRIM_TYPES = {
+    "Mesh", "Cube", "Sphere", "Cylinder", "Cone", "Capsule", "Plane",
+    "Points", "BasisCurves", "HermiteCurves", "NurbsCurves", "NurbsPatch",
+}
+
+# Grouping types, render-only if everything under them is
+CONTAINER_PRIM_TYPES = {"", "Xform", "Scope"}
+
+# Applied API schemas that do not affect simulation
+VISUAL_API_SCHEMAS = {"MaterialBindingAPI", "ShadowAPI", "ShapingAPI", "CoordSysAPI", "ConnectableAPI"}
+
+# Layer metadata carried over to every compiled layer
+LAYER_METADATA = ("upAxis", "metersPerUnit", "kilogramsPerUnit", "timeCodesPerSecond", "startTimeCode", "endTimeCode")
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+def find_dependencies(source_path: Path) -> list[str]:
+    """Find every file a source asset composes or loads.
+
+    Args:
+        source_path: Source USD file
+
+    Returns:
+        Sorted absolute paths of the layers and assets (e.g., textures) it uses
+    """
+    layers, assets, unresolved = UsdUtils.ComputeAllDependencies(str(source_path))
+    for path in unresolved:
+        print(f"  Warning: unresolved dependency {path}")
+
+    paths = {get_source_key(layer.realPath) for layer in layers if layer.realPath}
+    paths.update(get_source_key(asset) for asset in assets)
+    return sorted(paths)
+
+
+def hash_dependencies(source_path: Path, dependencies: list[str]) -> str:
+    """Hash the contents of an asset's dependencies.
+
+    Paths are hashed relative to the source file, so moving the asset tree
+    does not change the hash.
+
+    Args:
+        source_path: Source USD file
+        dependencies: Absolute dependency paths
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(f"simlab-asset-compiler-{COMPILER_VERSION}".encode())
+    for dependency in dependencies:
+        digest.update(os.path.relpath(dependency, source_path.parent).encode())
+        with open(dependency, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# Physics / visual split
+# =============================================================================
+
+def _list_op_items(list_op) -> list:
+    """Get every item named by an Sdf list op."""
+    if list_op is None:
+        return []
+    return list(list_op.explicitItems) + list(list_op.prependedItems) + list(list_op.appendedItems) + list(list_op.addedItems)
+
+
+def is_visual_property(name: str) -> bool:
+    """Check whether a property only matters for rendering.
+
+    Args:
+        name: Property name
+
+    Returns:
+        True for render material bindings, primvars and normals
+    """
+    if name == "material:binding" or name.startswith("material:binding:"):
+        return name != "material:binding:physics"
+    return name.startswith("primvars:") or name == "normals"
+
+
+def find_protected_paths(layer: Sdf.Layer) -> set[Sdf.Path]:
+    """Find prims that non-visual specs point at and therefore must stay.
+
+    Covers relationship targets (joint bodies, collision group includes) and
+    internal composition arcs (e.g., the prototypes of flattened instances).
+
+    Args:
+        layer: Flattened layer
+
+    Returns:
+        Set of prim paths
+    """
+    protected = set()
+
+    def _add(path):
+        path = path.GetPrimPath()
+        if not path.IsAbsolutePath():
+            return
+        for prefix in path.GetPrefixes():
+            protected.add(prefix)
+
+    def _visit(path):
+        spec = layer.GetObjectAtPath(path)
+        if isinstance(spec, Sdf.RelationshipSpec) and not is_visual_property(spec.name):
+            for target in _list_op_items(spec.targetPathList):
+                _add(target)
+        elif isinstance(spec, Sdf.PrimSpec):
+            for arc in _list_op_items(spec.referenceList) + _list_op_items(spec.payloadList):
+                if not arc.assetPath and not arc.primPath.isEmpty:
+                    _add(arc.primPath)
+            for arc in _list_op_items(spec.inheritPathList) + _list_op_items(spec.specializesList):
+                _add(arc)
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, _visit)
+    return protected
+
+
+def has_physics(prim_spec: Sdf.PrimSpec) -> bool:
+    """Check whether a prim spec carries simulation data of its own.
+
+    Args:
+        prim_spec: Prim spec
+
+    Returns:
+        True if it has a non-visual API schema or a physics attribute
+    """
+    for schema in _list_op_items(prim_spec.GetInfo("apiSchemas")):
+        if schema.split(":")[0] not in VISUAL_API_SCHEMAS:
+            return True
+    return any(name.startswith(("physics:", "physx")) for name in prim_spec.properties.keys())
+
+
+def find_visual_prims(layer: Sdf.Layer) -> list[Sdf.Path]:
+    """Find the roots of render-only prim subtrees.
+
+    Args:
+        layer: Flattened layer
+
+    Returns:
+        Paths of maximal subtrees that can move to the visual layer
+    """
+    protected = find_protected_paths(layer)
+    default_prim = Sdf.Path.absoluteRootPath.AppendChild(layer.defaultPrim) if layer.defaultPrim else None
+    visual_roots = []
+
+    def _is_visual(prim_spec: Sdf.PrimSpec) -> bool:
+        children = list(prim_spec.nameChildren)
+        child_visual = [_is_visual(child) for child in children]
+
+        visual = (
+            prim_spec.path not in protected
+            and prim_spec.path != default_prim
+            and not has_physics(prim_spec)
+            and (
+                prim_spec.typeName in VISUAL_PRIM_TYPES
+                or (prim_spec.typeName in GPRIM_TYPES and all(child_visual))
+                or (prim_spec.typeName in CONTAINER_PRIM_TYPES and children and all(child_visual))
+            )
+        )
+
+        # Report the children of non-visual prims; visual prims move as a whole
+        if not visual:
+            visual_roots.extend(child.path for child, is_visual in zip(children, child_visual) if is_visual)
+        return visual
+
+    for root_spec in layer.rootPrims:
+        if _is_visual(root_spec):
+            visual_roots.append(root_spec.path)
+    return visual_roots
+
+
+def _get_targets(spec: Sdf.PropertySpec) -> list[Sdf.Path]:
+    """Get the relationship targets or attribute connections of a property spec."""
+    if isinstance(spec, Sdf.RelationshipSpec):
+        return _list_op_items(spec.targetPathList)
+    return _list_op_items(spec.connectionPathList)
+
+
+def keep_external_targets(visual_layer: Sdf.Layer, physics_layer: Sdf.Layer, root_path: Sdf.Path) -> int:
+    """Move properties that point outside a payloaded subtree back to the physics layer.
+
+    A payload only maps paths inside its own subtree, so e.g. a material
+    binding from a visual mesh to a shared material would be dropped. Kept as
+    overs in the physics layer, such properties are composed in the asset's
+    namespace instead, and still only appear once the payload is loaded
+    (unloaded prims have no descendants).
+
+    Args:
+        visual_layer: Layer holding the payloaded subtree
+        physics_layer: Layer holding the payload stub
+        root_path: Root of the payloaded subtree
+
+    Returns:
+        Number of properties moved
+    """
+    external = []
+
+    def _visit(path):
+        spec = visual_layer.GetObjectAtPath(path)
+        if isinstance(spec, Sdf.PropertySpec):
+            if any(not target.HasPrefix(root_path) for target in _get_targets(spec)):
+                external.append(path)
+
+    visual_layer.Traverse(root_path, _visit)
+    for path in external:
+        Sdf.CreatePrimInLayer(physics_layer, path.GetPrimPath())
+        Sdf.CopySpec(visual_layer, path, physics_layer, path)
+        prim_spec = visual_layer.GetPrimAtPath(path.GetPrimPath())
+        prim_spec.RemoveProperty(prim_spec.properties[path.name])
+    return len(external)
+
+
+def split_visual_layer(physics_layer: Sdf.Layer, visual_layer: Sdf.Layer, visual_asset_path: str) -> int:
+    """Move render-only prims to another layer and payload them back in.
+
+    Each moved subtree is replaced by a typeless stub prim with a payload to
+    the same path in the visual layer. Stages that do not load the payload
+    keep the stub but compose none of the meshes or materials under it.
+
+    Args:
+        physics_layer: Flattened layer, edited in place to keep only simulation data
+        visual_layer: Empty layer that receives the visual prims
+        visual_asset_path: Asset path of the visual layer, relative to the physics layer
+
+    Returns:
+        Number of payloaded subtrees
+    """
+    visual_prims = find_visual_prims(physics_layer)
+    for path in visual_prims:
+        if path.GetParentPath() != Sdf.Path.absoluteRootPath:
+            Sdf.CreatePrimInLayer(visual_layer, path.GetParentPath())
+        Sdf.CopySpec(physics_layer, path, visual_layer, path)
+        if path.GetParentPath() == Sdf.Path.absoluteRootPath:
+            del physics_layer.rootPrims[path.name]
+        else:
+            del physics_layer.GetPrimAtPath(path.GetParentPath()).nameChildren[path.name]
+
+        stub_spec = Sdf.CreatePrimInLayer(physics_layer, path)
+        stub_spec.specifier = Sdf.SpecifierDef
+        stub_spec.payloadList.Prepend(Sdf.Payload(visual_asset_path, path))
+        keep_external_targets(visual_layer, physics_layer, path)
+
+    return len(visual_prims)
+
+
+def copy_layer_metadata(source: Sdf.Layer, destination: Sdf.Layer):
+    """Copy the default prim and stage metrics between layers.
+
+    Args:
+        source: Layer to copy from
+        destination: Layer to copy to
+    """
+    if source.defaultPrim:
+        destination.defaultPrim = source.defaultPrim
+    for key in LAYER_METADATA:
+        if source.pseudoRoot.HasInfo(key):
+            destination.pseudoRoot.SetInfo(key, source.pseudoRoot.GetInfo(key))
+
+
+# =============================================================================
+# Compilation
+# =============================================================================
+
+def get_compiled_layer_paths(output_dir: Path, name: str) -> dict[str, Path]:
+    """Get the paths of an asset's compiled layers.
+
+    Args:
+        output_dir: Compiled output directory of the asset
+        name: Asset name (source file stem)
+
+    Returns:
+        Dict of layer paths keyed by layer kind
+    """
+    return {
+        "root": output_dir / f"{name}.usdc",
+        "physics": output_dir / f"{name}.physics.usdc",
+        "visual": output_dir / f"{name}.visual.usdc",
+    }
+
+
+def compile_asset(source_path: Path, output_dir: Path, asset_hash: str) -> dict:
+    """Flatten and split one asset into compiled layers.
+
+    Args:
+        source_path: Source USD file
+        output_dir: Directory to write the compiled layers to
+        asset_hash: Dependency hash, recorded in the root layer
+
+    Returns:
+        Dict of compiled layer paths keyed by layer kind
+    """
+    stage = Usd.Stage.Open(str(source_path), Usd.Stage.LoadAll)
+    if stage is None:
+        raise RuntimeError(f"Could not open {source_path}")
+
+    physics_layer = stage.Flatten()
+    visual_layer = Sdf.Layer.CreateAnonymous(".usdc")
+    copy_layer_metadata(physics_layer, visual_layer)
+
+    layers = get_compiled_layer_paths(output_dir, source_path.stem)
+    num_payloads = split_visual_layer(physics_layer, visual_layer, f"./{layers['visual'].name}")
+    print(f"  Moved {num_payloads} visual subtrees behind payloads")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    physics_layer.Export(str(layers["physics"]))
+    visual_layer.Export(str(layers["visual"]))
+
+    root_layer = Sdf.Layer.CreateNew(str(layers["root"]))
+    copy_layer_metadata(physics_layer, root_layer)
+    root_layer.subLayerPaths = [f"./{layers['physics'].name}"]
+    root_layer.customLayerData = {
+        "simlab:compiledFrom": str(source_path),
+        "simlab:compilerVersion": COMPILER_VERSION,
+        "simlab:assetHash": asset_hash,
+    }
+    root_layer.Save()
+
+    return {kind: str(path) for kind, path in layers.items()}
+
+
+def compile_assets(source_paths: list[Path], force: bool = False) -> list[str]:
+    """Compile assets and update the manifest.
+
+    Args:
+        source_paths: Source USD files
+        force: Recompile even if the compiled output is current
+
+    Returns:
+        Paths of the compiled root layers
+    """
+    manifest = load_manifest()
+    compiled = []
+
+    for source_path in source_paths:
+        key = get_source_key(source_path)
+        print(f"Compiling {source_path}")
+
+        entry = manifest["assets"].get(key)
+        if entry is not None and not force and is_entry_current(entry):
+            print(f"  Up to date: {entry['layers']['root']}")
+            compiled.append(entry["layers"]["root"])
+            continue
+
+        dependencies = find_dependencies(source_path)
+        asset_hash = hash_dependencies(source_path, dependencies)
+        output_dir = COMPILED_ASSETS_DIR / f"{source_path.stem}-{asset_hash[:12]}"
+
+        # Output is addressed by content, so touched-but-unchanged files reuse it
+        layers = get_compiled_layer_paths(output_dir, source_path.stem)
+        if force or not all(path.exists() for path in layers.values()):
+            if output_dir.exists():
+                shutil.rmtree(output_dir)
+            layers = compile_asset(source_path, output_dir, asset_hash)
+        else:
+            layers = {kind: str(path) for kind, path in layers.items()}
+
+        # Remove the previous output once no other entry shares it
+        if entry is not None and entry["layers"]["root"] != layers["root"]:
+            old_dir = Path(entry["layers"]["root"]).parent
+            if old_dir.exists() and not any(
+                Path(other["layers"]["root"]).parent == old_dir
+                for other_key, other in manifest["assets"].items() if other_key != key
+            ):
+                shutil.rmtree(old_dir)
+
+        manifest["assets"][key] = {
+            "hash": asset_hash,
+            "layers": layers,
+            "dependencies": {dependency: get_file_stamp(dependency) for dependency in dependencies},
+        }
+        save_manifest(manifest)
+
+        print(f"  Wrote {layers['root']}")
+        compiled.append(layers["root"])
+
+    return compiled
+
+
+def benchmark_open(source_path: Path, compiled_root: str):
+    """Print how long the source and compiled assets take to open.
+
+    Args:
+        source_path: Source USD file
+        compiled_root: Compiled root layer
+    """
+    for label, path in (("source", str(source_path)), ("compiled", compiled_root)):
+        start = time.perf_counter()
+        stage = Usd.Stage.Open(path, Usd.Stage.LoadAll)
+        num_prims = sum(1 for _ in stage.Traverse())
+        elapsed_ms = 1000.0 * (time.perf_counter() - start)
+        num_layers = len(stage.GetUsedLayers())
+        print(f"  {label:>8}: {elapsed_ms:8.1f} ms, {num_layers:3d} layers, {num_prims:5d} prims")
+        del stage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile USD assets into flattened physics and visual layers.")
+    parser.add_argument("assets", type=Path, nargs="+", help="Source USD files to compile")
+    parser.add_argument("--force", action="store_true", help="Recompile even if the compiled output is current")
+    parser.add_argument("--benchmark", action="store_true", help="Time opening each source and compiled asset")
+    args = parser.parse_args()
+
+    missing = [str(path) for path in args.assets if not path.is_file()]
+    if missing:
+        print(f"Error: File(s) not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    compiled = compile_assets(args.assets, force=args.force)
+
+    if args.benchmark:
+        print("\nOpen times:")
+        for source_path, compiled_root in zip(args.assets, compiled):
+            print(f"{source_path}")
+            benchmark_open(source_path, compiled_root)
+
+
+if __name__ == "__main__":
+    main()